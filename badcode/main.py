@@ -7,7 +7,7 @@
 
 # Standard Imports
 # Third Party Imports
-from hobo.misc import print_exception
+# hobo.misc is imported on first use since it is only needed to report errors.
 # Local Imports
 from badcode.parser import parse_arguments
 from badcode.maths import divide_it
@@ -41,7 +41,7 @@ def main(args: list) -> int:
     try:
         (cli_num, cli_den) = parse_arguments(args)
     except (TypeError, ValueError, RuntimeError) as err:
-        print_exception(err)
+        _print_exception(err)
         success = 1
 
     # DO IT
@@ -49,7 +49,7 @@ def main(args: list) -> int:
         try:
             quotient = divide_it(cli_num, cli_den)
         except (TypeError, ValueError) as err:
-            print_exception(err)
+            _print_exception(err)
             success = 2
 
     # PRINT IT
@@ -58,3 +58,9 @@ def main(args: list) -> int:
 
     # DONE
     return success
+
+
+def _print_exception(err: Exception) -> None:
+    """Print err using hobo.misc's print_exception(), importing it on first use."""
+    from hobo.misc import print_exception  # pylint: disable=import-outside-toplevel
+    print_exception(err)
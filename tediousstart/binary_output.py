@@ -0,0 +1,106 @@
+"""Defines the BinaryOutput class.
+
+TediousFuncTest's binary capture modes store each output stream as a BinaryOutput instead of a
+str.  A BinaryOutput wraps a bytes-like buffer (e.g., bytes or an mmap of a spilled file) and
+answers the questions TediousFuncTest asks about output (the in operator, len(), truthiness, and
+slicing for failure excerpts) directly against those bytes.  Expectations are encoded instead of
+the output being decoded, and only the slices shown to a human are decoded.
+
+    Typical usage example:
+
+    stdout = BinaryOutput(mmap.mmap(spill_file.fileno(), 0, access=mmap.ACCESS_READ))
+    if 'Done' in stdout:  # Searches the mapped file in place
+        print(stdout[:80])  # Decodes just the first 80 bytes
+"""
+
+# Standard Imports
+from typing import Any
+# Third Party Imports
+# Local Imports
+
+
+class BinaryOutput():
+    """Captured output searched as bytes and decoded lazily.
+
+    len() and indices count bytes, not characters.
+
+    For more details:
+        import tediousstart.binary_output
+        help(tediousstart.binary_output)
+    """
+
+    __slots__ = ('_buffer', 'encoding', 'errors')
+
+    def __init__(self, buffer: Any, encoding: str = 'utf-8', errors: str = 'replace') -> None:
+        """BinaryOutput class ctor.
+
+        Args:
+            buffer: The captured output: bytes, bytearray, or mmap.
+            encoding: Optional; Encoding used to encode expectations and decode output.
+            errors: Optional; Error handling scheme used when decoding output.
+        """
+        self._buffer = buffer     # The captured output
+        self.encoding = encoding  # Encoding of the output
+        self.errors = errors      # Decoding error handling scheme
+
+    def __bool__(self) -> bool:
+        """True if anything was captured."""
+        return len(self._buffer) > 0
+
+    def __contains__(self, entry: Any) -> bool:
+        """Determine if entry, a str or bytes, is in the output."""
+        return self.find(entry) != -1
+
+    def __eq__(self, other: Any) -> bool:
+        """BinaryOutputs are equal to other output, and strs, with the same contents."""
+        if isinstance(other, BinaryOutput):
+            return self._buffer[:] == other._buffer[:]
+        if isinstance(other, str):
+            return self.text() == other
+        return self._buffer[:] == other
+
+    __hash__ = None  # Compared by contents
+
+    def __getitem__(self, index: Any) -> str:
+        """Decode one slice of the output."""
+        if not isinstance(index, slice):
+            index = slice(index, index + 1 or None)
+        return self._buffer[index].decode(self.encoding, self.errors)
+
+    def __len__(self) -> int:
+        """The number of bytes captured."""
+        return len(self._buffer)
+
+    def __reduce__(self) -> tuple:
+        """Pickle a copy of the captured bytes, since an mmap can't be pickled."""
+        return (BinaryOutput, (self.data(), self.encoding, self.errors))
+
+    def __repr__(self) -> str:
+        """Represent the output without decoding it."""
+        return f'BinaryOutput(<{len(self._buffer)} bytes>)'
+
+    def __str__(self) -> str:
+        """The output as a string."""
+        return self.text()
+
+    def data(self) -> bytes:
+        """Return a copy of the captured bytes."""
+        return bytes(self._buffer[:])
+
+    def encode(self, entry: Any) -> bytes:
+        """Encode entry, a str or bytes, for searching the output."""
+        if isinstance(entry, str):
+            return entry.encode(self.encoding)
+        return entry
+
+    def find(self, entry: Any, start: int = 0) -> int:
+        """Return the lowest byte index of entry, a str or bytes, or -1 if it isn't found."""
+        return self._buffer.find(self.encode(entry), start)
+
+    def search(self, pattern: Any, pos: int = 0) -> Any:
+        """Search the output, from byte index pos, with a compiled bytes regular expression."""
+        return pattern.search(self._buffer, pos)
+
+    def text(self) -> str:
+        """Decode all of the output."""
+        return self[:]
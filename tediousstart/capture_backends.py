@@ -0,0 +1,321 @@
+"""Defines bounded capture backends for RedirectStdStreams.
+
+The default RedirectStdStreams backend, io.StringIO, holds every character written to it.  The
+backends defined here are io.TextIOBase streams that can be passed to RedirectStdStreams instead
+so tests of very noisy code run in bounded memory.
+
+    RingBufferStream    # Keeps a fixed-size head and tail plus running character and line counts
+    SpooledTextStream   # Keeps output in memory up to a threshold then spills it to a file
+
+make_capture_file() and map_capture_file() provide the anonymous, mappable files (memfds, on
+Linux) that file descriptors are redirected to.
+
+    Typical usage example:
+
+    with RedirectStdStreams(stdout=RingBufferStream(), stderr=RingBufferStream()) as temp_obj:
+        very_noisy_function()
+        (std_out, std_err) = temp_obj.communicate()  # Heads and tails, with truncation markers
+
+    spooled_stdout = SpooledTextStream(spool_dir='/dev/shm')  # Spill to tmpfs
+    with RedirectStdStreams(stdout=spooled_stdout):
+        gigabyte_function()
+    print('Done' in spooled_stdout.output())  # Searched in place, through mmap
+"""
+
+# Standard Imports
+# mmap and tempfile are imported on first use to keep the import time of TediousFuncTest low.
+from collections import deque
+from typing import Any
+import io
+import os
+# Third Party Imports
+from hobo.validation import validate_type
+# Local Imports
+from tediousstart.binary_output import BinaryOutput
+from tediousstart.capture_mode import SPOOL_MAX_SIZE
+from tediousstart.failure_record import OMISSION_MARKER
+
+
+HEAD_CHARS = 64 * 1024  # Default number of leading characters RingBufferStream keeps
+TAIL_CHARS = 64 * 1024  # Default number of trailing characters RingBufferStream keeps
+
+
+# pylint: disable=too-many-instance-attributes
+class RingBufferStream(io.TextIOBase):
+    """A text stream that keeps its head and tail in constant memory.
+
+    The first head_chars characters are kept in a fixed-size head buffer.  Everything after that
+    passes through a ring buffer that keeps the last tail_chars characters.  read() (and so
+    RedirectStdStreams.communicate()) returns the head and tail joined by a truncation marker.
+
+    Attributes:
+        head_chars: Number of leading characters kept.
+        tail_chars: Number of trailing characters kept.
+        total_chars: Number of characters written.
+        total_lines: Number of newline characters written.
+    """
+
+    def __init__(self, head_chars: int = HEAD_CHARS, tail_chars: int = TAIL_CHARS) -> None:
+        """RingBufferStream class ctor.
+
+        Args:
+            head_chars: Optional; Number of leading characters to keep.
+            tail_chars: Optional; Number of trailing characters to keep.
+
+        Raises:
+            TypeError: Invalid data type.
+            ValueError: Negative head_chars or tail_chars.
+        """
+        # INPUT VALIDATION
+        validate_type(head_chars, 'head_chars', int)
+        validate_type(tail_chars, 'tail_chars', int)
+        if head_chars < 0 or tail_chars < 0:
+            raise ValueError(f'Invalid head_chars and tail_chars of {head_chars} and '
+                             f'{tail_chars}')
+
+        # ATTRIBUTES
+        super().__init__()
+        self.head_chars = head_chars  # Number of leading characters kept
+        self.tail_chars = tail_chars  # Number of trailing characters kept
+        self.total_chars = 0          # Number of characters written
+        self.total_lines = 0          # Number of newline characters written
+        self._head = []               # Chunks of the first head_chars characters
+        self._head_len = 0            # Number of characters in the head buffer
+        self._tail = deque()          # Ring buffer of chunks holding, at least, the last chars
+        self._tail_len = 0            # Number of characters in the ring buffer
+
+    @property
+    def truncated(self) -> bool:
+        """True if characters were dropped between the head and the tail."""
+        return self.total_chars > self._head_len + min(self._tail_len, self.tail_chars)
+
+    def getvalue(self) -> str:
+        """Return the head and the tail, joined by a truncation marker if anything was dropped."""
+        # LOCAL VARIABLES
+        head = ''.join(self._head)  # The head buffer
+        tail = ''                   # The last tail_chars characters of the ring buffer
+        omitted = 0                 # Number of characters dropped
+
+        # JOIN THEM
+        if self.tail_chars:
+            tail = ''.join(self._tail)[-self.tail_chars:]
+        omitted = self.total_chars - len(head) - len(tail)
+        if omitted:
+            return head + OMISSION_MARKER.format(omitted) + tail
+        return head + tail
+
+    def read(self, size: int = -1) -> str:
+        """Return getvalue(), or its first size characters."""
+        if size is None or size < 0:
+            return self.getvalue()
+        return self.getvalue()[:size]
+
+    def readable(self) -> bool:
+        """RingBufferStreams are readable through read() and getvalue()."""
+        return True
+
+    def writable(self) -> bool:
+        """RingBufferStreams are always writable."""
+        return True
+
+    def write(self, text: str) -> int:
+        """Count text, then keep it in the head buffer or pass it through the ring buffer."""
+        # LOCAL VARIABLES
+        text_len = len(text)  # Number of characters written
+        room = 0              # Room left in the head buffer
+
+        # COUNT IT
+        self.total_chars += text_len
+        self.total_lines += text.count('\n')
+
+        # HEAD
+        room = self.head_chars - self._head_len
+        if room > 0:
+            self._head.append(text[:room])
+            self._head_len += min(room, text_len)
+            text = text[room:]
+
+        # TAIL
+        if text and self.tail_chars:
+            text = text[-self.tail_chars:]
+            self._tail.append(text)
+            self._tail_len += len(text)
+            while self._tail_len - len(self._tail[0]) >= self.tail_chars:
+                self._tail_len -= len(self._tail.popleft())
+
+        # DONE
+        return text_len
+# pylint: enable=too-many-instance-attributes
+
+
+class SpooledTextStream(io.TextIOBase):
+    """A text stream that stays in memory up to max_size bytes then spills to a file.
+
+    Text is encoded as it is written.  output() wraps the encoded text in a BinaryOutput that
+    searches the spilled file in place, through mmap, without materializing a str.  read() (and
+    so RedirectStdStreams.communicate()) decodes all of it.
+    """
+
+    def __init__(self, max_size: int = SPOOL_MAX_SIZE, spool_dir: str = None,
+                 encoding: str = 'utf-8', errors: str = 'replace') -> None:
+        """SpooledTextStream class ctor.
+
+        Args:
+            max_size: Optional; Number of bytes to keep in memory before spilling to a file.  0
+                spills immediately.
+            spool_dir: Optional; Directory (e.g., a tmpfs mount) to spill to.  Defaults to the
+                tempfile module's default directory.
+            encoding: Optional; Encoding used to store the text.
+            errors: Optional; Error handling scheme used when decoding the text.
+
+        Raises:
+            TypeError: Invalid data type.
+            ValueError: Negative max_size.
+        """
+        # INPUT VALIDATION
+        validate_type(max_size, 'max_size', int)
+        if max_size < 0:
+            raise ValueError(f'Invalid max_size of {max_size}')
+
+        # ATTRIBUTES
+        super().__init__()
+        self.max_size = max_size                       # Bytes kept in memory before spilling
+        self._encoding = encoding                      # Encoding used to store the text
+        self._errors = errors                          # Decoding error handling scheme
+        self._spool = make_spool(max_size, spool_dir)  # Encoded text
+
+    @property
+    def encoding(self) -> str:
+        """The encoding used to store the text."""
+        return self._encoding
+
+    @property
+    def spilled(self) -> bool:
+        """True if the text has spilled to a file."""
+        return _has_spilled(self._spool)
+
+    def close(self) -> None:
+        """Close the stream, deleting any spilled file."""
+        self._spool.close()
+        super().close()
+
+    def output(self) -> BinaryOutput:
+        """Return a BinaryOutput of the text written so far."""
+        return BinaryOutput(_snapshot_spool(self._spool), self._encoding, self._errors)
+
+    def read(self, size: int = -1) -> str:
+        """Decode the text written so far, returning all of it or its first size characters."""
+        if size is None or size < 0:
+            return self.output().text()
+        return self.output().text()[:size]
+
+    def readable(self) -> bool:
+        """SpooledTextStreams are readable through read() and output()."""
+        return True
+
+    def writable(self) -> bool:
+        """SpooledTextStreams are always writable."""
+        return True
+
+    def write(self, text: str) -> int:
+        """Encode text and spool it."""
+        self._spool.write(text.encode(self._encoding, self._errors))
+        return len(text)
+
+
+def make_capture_file(name: str, spool_dir: str = None) -> io.BufferedRandom:
+    """Create an anonymous binary file for a file descriptor to write to.
+
+    The file is a memfd, where available, otherwise a temporary file in spool_dir.  Unlike a
+    pipe, it never blocks the writer and needs no reader.
+
+    Args:
+        name: Name of the memfd, shown in /proc/<pid>/fd.
+        spool_dir: Optional; Directory of the temporary file used when memfds are unavailable.
+    """
+    if hasattr(os, 'memfd_create'):
+        return os.fdopen(os.memfd_create(name, os.MFD_CLOEXEC), 'w+b')
+    import tempfile  # pylint: disable=import-outside-toplevel
+    return tempfile.TemporaryFile(dir=spool_dir)  # pylint: disable=consider-using-with
+
+
+def make_spool(max_size: int = SPOOL_MAX_SIZE, spool_dir: str = None) -> Any:
+    """Create a binary tempfile.SpooledTemporaryFile that spills beyond max_size bytes.
+
+    A max_size of 0 spills immediately: the spool is a temporary file in spool_dir.
+    """
+    import tempfile  # pylint: disable=import-outside-toplevel
+    if not max_size:
+        return tempfile.TemporaryFile(dir=spool_dir)  # pylint: disable=consider-using-with
+    return tempfile.SpooledTemporaryFile(max_size=max_size, dir=spool_dir)
+
+
+def map_spool(spool: Any, encoding: str = 'utf-8', errors: str = 'replace') -> BinaryOutput:
+    """Wrap everything written to spool in a BinaryOutput, then close spool.
+
+    Spilled output is mapped, with mmap, instead of read.  The mapping outlives the spool.
+
+    Args:
+        spool: A binary spool from make_spool().
+        encoding: Optional; Encoding of the spooled output.
+        errors: Optional; Error handling scheme used when decoding the spooled output.
+    """
+    # LOCAL VARIABLES
+    buffer = _snapshot_spool(spool)  # Spooled output: bytes or mmap
+
+    # DONE
+    spool.close()
+    return BinaryOutput(buffer, encoding, errors)
+
+
+def map_capture_file(capture_file: io.BufferedRandom, encoding: str = 'utf-8',
+                     errors: str = 'replace') -> BinaryOutput:
+    """Wrap everything written to capture_file, from make_capture_file(), in a BinaryOutput.
+
+    The file is mapped, with mmap, instead of read.  The mapping outlives the file.
+
+    Args:
+        capture_file: A binary file from make_capture_file().
+        encoding: Optional; Encoding of the captured output.
+        errors: Optional; Error handling scheme used when decoding the captured output.
+    """
+    import mmap  # pylint: disable=import-outside-toplevel
+
+    # LOCAL VARIABLES
+    file_fd = capture_file.fileno()  # File descriptor of the capture file
+    buffer = b''                     # Captured output: bytes or mmap
+
+    # MAP IT
+    if os.fstat(file_fd).st_size:  # Empty files can't be mapped
+        buffer = mmap.mmap(file_fd, 0, access=mmap.ACCESS_READ)
+
+    # DONE
+    return BinaryOutput(buffer, encoding, errors)
+
+
+def _has_spilled(spool: Any) -> bool:
+    """Determine if spool, from make_spool(), has spilled to a file.
+
+    A SpooledTemporaryFile rolls over once a write takes it past its max_size.  Any other spool
+    is already a file.
+    """
+    return getattr(spool, '_rolled', True)
+
+
+def _snapshot_spool(spool: Any) -> Any:
+    """Map spool, if it spilled, otherwise copy its bytes.  Leaves spool positioned at its end."""
+    import mmap  # pylint: disable=import-outside-toplevel
+
+    # LOCAL VARIABLES
+    buffer = b''  # Spooled output: bytes or mmap
+
+    # SNAPSHOT IT
+    if _has_spilled(spool) and spool.seek(0, io.SEEK_END):  # Empty files can't be mapped
+        buffer = mmap.mmap(spool.fileno(), 0, access=mmap.ACCESS_READ)
+    else:
+        spool.seek(0)
+        buffer = spool.read()
+        spool.seek(0, io.SEEK_END)
+
+    # DONE
+    return buffer
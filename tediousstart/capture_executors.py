@@ -0,0 +1,275 @@
+"""Defines the command executors behind TediousFuncTest's capture modes.
+
+execute_command() runs a command list once, capturing its output as its CaptureSettings
+describe, and measures its duration and resource usage.  The settings are normally read from
+a TediousFuncTest class, or test case, by make_capture_settings() so the same execution serves
+both individual test cases and the class-wide class_command_list.
+
+    Typical usage example:
+
+    execution = execute_command(['echo', 'hello'], make_capture_settings(TediousFuncTest))
+    if execution.exit_code == 0 and 'hello' in execution.stdout:
+        print(f'Took {execution.duration:.3f} seconds')
+"""
+
+# Standard Imports
+# hobo.subprocess_wrapper and subprocess are imported on first use to keep the import time of
+# TediousFuncTest low.
+from collections import namedtuple
+from typing import Any, Callable
+import contextlib
+import io
+import time
+try:
+    import resource
+except ImportError:  # resource is only available on Unix
+    resource = None
+# Third Party Imports
+# Local Imports
+from tediousstart.binary_output import BinaryOutput
+from tediousstart.capture_backends import (make_capture_file, make_spool, map_capture_file,
+                                           map_spool)
+from tediousstart.capture_mode import CaptureMode
+from tediousstart.chunk_log import ChunkLog
+from tediousstart.command_result import ResourceUsage
+from tediousstart.output_pump import OutputTee, pump_pipes, STREAM_NAMES
+
+
+# How to capture a command's output (see: the TediousFuncTest class attributes of the same names)
+# pylint:disable=undefined-variable
+CaptureSettings = namedtuple('CaptureSettings', ['capture_mode', 'decode_errors',
+                                                 'spool_max_size', 'spool_dir', 'tee_output',
+                                                 'tee_flush_interval'])
+# The captured output, exit code, and measurements of one command execution
+Execution = namedtuple('Execution', ['stdout', 'stderr', 'exit_code', 'chunk_log', 'duration',
+                                     'rusage'])
+# pylint:enable=undefined-variable
+
+
+def execute_command(cmd_list: list, settings: CaptureSettings) -> Execution:
+    """Execute cmd_list, capturing its output as settings describe.
+
+    Resource usage is measured across all child processes so it is only accurate when commands
+    are executed one at a time.
+
+    Args:
+        cmd_list: The command list to execute.
+        settings: How to capture the output.
+
+    Returns:
+        The Execution.  chunk_log is only defined for CaptureMode.MERGED.
+    """
+    # LOCAL VARIABLES
+    executor = _select_executor(settings)   # Captures the output as settings describe
+    rusage_before = _get_children_rusage()  # Child resource usage before execution
+    start_time = time.monotonic()           # Start time of execution
+    stdout, stderr, exit_code, chunk_log = executor(cmd_list, settings)  # Captured results
+
+    # DONE
+    return Execution(stdout, stderr, exit_code, chunk_log, time.monotonic() - start_time,
+                     _diff_rusage(rusage_before, _get_children_rusage()))
+
+
+def make_capture_settings(owner: Any) -> CaptureSettings:
+    """Read the CaptureSettings from owner, a TediousFuncTest class or test case."""
+    return CaptureSettings(*(getattr(owner, field) for field in CaptureSettings._fields))
+
+
+def _decode_text(data: bytes) -> str:
+    """Decode data, and translate its newlines, exactly as a text-mode pipe would."""
+    return io.TextIOWrapper(io.BytesIO(data)).read()
+
+
+def _diff_rusage(before: Any, after: Any) -> ResourceUsage:
+    """Calculate the resources consumed between two children resource usage samples.
+
+    Returns:
+        A ResourceUsage, None if either sample is unavailable.  max_rss is the largest resident
+        set size, in kilobytes, of any child process so far (it can't be attributed to one).
+    """
+    if before is None or after is None:
+        return None
+    return ResourceUsage(after.ru_utime - before.ru_utime, after.ru_stime - before.ru_stime,
+                         after.ru_maxrss)
+
+
+def _execute_bytes(cmd_list: list, settings: CaptureSettings) -> tuple:
+    """Capture both streams as undecoded BinaryOutputs.
+
+    Nothing is decoded, or newline-translated, unless it is shown in a failure report.
+    """
+    # LOCAL VARIABLES
+    chunks = {stream_name: [] for stream_name in STREAM_NAMES}  # Stream name: output chunks
+    exit_code = 0                                               # Exit code from execution
+
+    # RUN IT
+    exit_code = _pump(cmd_list, settings, {stream_name: stream_chunks.append
+                                           for stream_name, stream_chunks in chunks.items()})
+
+    # DONE
+    return tuple((BinaryOutput(b''.join(chunks['stdout']), errors=settings.decode_errors),
+                  BinaryOutput(b''.join(chunks['stderr']), errors=settings.decode_errors),
+                  exit_code, None))
+
+
+def _execute_memfd(cmd_list: list, settings: CaptureSettings) -> tuple:
+    """Capture both streams with memfds, instead of pipes, mapped once the command exits.
+
+    The command writes straight to the memfds so there is no reader loop.  Both memfds are
+    stored as BinaryOutputs which are searched in place.  Where memfds are unavailable,
+    temporary files in spool_dir are used instead.
+    """
+    import subprocess  # pylint: disable=import-outside-toplevel
+
+    # LOCAL VARIABLES
+    capture_files = {stream_name: make_capture_file(f'TediousFuncTest {stream_name}',
+                                                    settings.spool_dir)
+                     for stream_name in STREAM_NAMES}  # Stream name: capture file
+    exit_code = 0                                      # Exit code from execution
+
+    # RUN IT
+    try:
+        with subprocess.Popen(cmd_list, stdout=capture_files['stdout'],
+                              stderr=capture_files['stderr']) as popen_obj:
+            exit_code = popen_obj.wait()
+        return tuple((map_capture_file(capture_files['stdout'], errors=settings.decode_errors),
+                      map_capture_file(capture_files['stderr'], errors=settings.decode_errors),
+                      exit_code, None))
+    finally:
+        for capture_file in capture_files.values():
+            capture_file.close()
+
+
+def _execute_merged(cmd_list: list, settings: CaptureSettings) -> tuple:
+    """Log both streams' output, in arrival order, to a ChunkLog.
+
+    Both streams are also stored as BinaryOutputs that wrap the ChunkLog's stream buffers, so
+    the output is only held once.
+    """
+    # LOCAL VARIABLES
+    chunk_log = ChunkLog()  # Timestamped log of both streams
+    exit_code = 0           # Exit code from execution
+
+    # RUN IT
+    exit_code = _pump(cmd_list, settings, {stream_name: chunk_log.handler(stream_name)
+                                           for stream_name in STREAM_NAMES})
+
+    # DONE
+    return tuple((BinaryOutput(chunk_log.stream('stdout'), errors=settings.decode_errors),
+                  BinaryOutput(chunk_log.stream('stderr'), errors=settings.decode_errors),
+                  exit_code, chunk_log))
+
+
+def _execute_spooled(cmd_list: list, settings: CaptureSettings) -> tuple:
+    """Capture both streams, spilling output beyond spool_max_size bytes to spool_dir.
+
+    Both streams are stored as BinaryOutputs.  Spilled output is searched in place, through
+    mmap, instead of being decoded.
+    """
+    # LOCAL VARIABLES
+    spools = {stream_name: make_spool(settings.spool_max_size, settings.spool_dir)
+              for stream_name in STREAM_NAMES}  # Stream name: spool
+    exit_code = 0                               # Exit code from execution
+
+    # RUN IT
+    try:
+        exit_code = _pump(cmd_list, settings, {stream_name: spool.write
+                                               for stream_name, spool in spools.items()})
+        return tuple((map_spool(spools['stdout'], errors=settings.decode_errors),
+                      map_spool(spools['stderr'], errors=settings.decode_errors), exit_code, None))
+    finally:
+        for spool in spools.values():
+            spool.close()
+
+
+def _execute_teed(cmd_list: list, settings: CaptureSettings) -> tuple:
+    """Capture both streams as text while forwarding them to tee_output.
+
+    The output is decoded, and its newlines translated, exactly as a text-mode pipe would.
+    """
+    # LOCAL VARIABLES
+    chunks = {stream_name: [] for stream_name in STREAM_NAMES}  # Stream name: output chunks
+    exit_code = 0                                               # Exit code from execution
+
+    # RUN IT
+    exit_code = _pump(cmd_list, settings, {stream_name: stream_chunks.append
+                                           for stream_name, stream_chunks in chunks.items()})
+
+    # DONE
+    return tuple((_decode_text(b''.join(chunks['stdout'])),
+                  _decode_text(b''.join(chunks['stderr'])), exit_code, None))
+
+
+def _execute_text(cmd_list: list, settings: CaptureSettings) -> tuple:
+    """Capture both streams as text through text-mode pipes."""
+    # pylint: disable=import-outside-toplevel
+    from hobo.subprocess_wrapper import start_subprocess_cmd
+    # pylint: enable=import-outside-toplevel
+
+    del settings  # Text-mode pipes need no settings
+
+    # LOCAL VARIABLES
+    popen_obj = start_subprocess_cmd(cmd_list)  # Popen object
+    stdout, stderr = popen_obj.communicate()    # Captured output
+
+    # DONE
+    return tuple((stdout, stderr, popen_obj.returncode, None))
+
+
+def _get_children_rusage() -> Any:
+    """Sample the resource usage of terminated child processes, None if unavailable."""
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_CHILDREN)
+
+
+def _pump(cmd_list: list, settings: CaptureSettings, handlers: dict) -> int:
+    """Execute cmd_list with binary pipes, passing its output to handlers.
+
+    Output is also forwarded, live, to settings.tee_output if it is set.
+
+    Args:
+        cmd_list: The command list to execute.
+        settings: How to capture the output.
+        handlers: pump_pipes() callbacks, keyed by stream name, passed each chunk of output.
+
+    Returns:
+        Exit code from execution.
+    """
+    import subprocess  # pylint: disable=import-outside-toplevel
+
+    # LOCAL VARIABLES
+    exit_code = 0  # Exit code from execution
+    tee = None     # OutputTee forwarding to tee_output
+
+    # RUN IT
+    with contextlib.ExitStack() as stack:
+        if isinstance(settings.tee_output, str):
+            tee = OutputTee(stack.enter_context(open(settings.tee_output, 'ab')),
+                            settings.tee_flush_interval)
+        elif settings.tee_output is not None:
+            tee = OutputTee(settings.tee_output, settings.tee_flush_interval)
+        if tee is not None:
+            stack.callback(tee.close)
+            handlers = {stream_name: tee.wrap(stream_name, handler)
+                        for stream_name, handler in handlers.items()}
+        with subprocess.Popen(cmd_list, stdout=subprocess.PIPE,
+                              stderr=subprocess.PIPE) as popen_obj:
+            exit_code = pump_pipes(popen_obj, handlers, on_idle=tee.flush if tee else None,
+                                   idle_timeout=settings.tee_flush_interval)
+
+    # DONE
+    return exit_code
+
+
+def _select_executor(settings: CaptureSettings) -> Callable[[list, CaptureSettings], tuple]:
+    """Select the _execute_*() function for settings.capture_mode."""
+    # LOCAL VARIABLES
+    executors = {CaptureMode.SPOOL: _execute_spooled, CaptureMode.MEMFD: _execute_memfd,
+                 CaptureMode.BYTES: _execute_bytes,
+                 CaptureMode.MERGED: _execute_merged}  # Capture mode: executor
+
+    # SELECT IT
+    if settings.capture_mode is CaptureMode.TEXT and settings.tee_output is not None:
+        return _execute_teed
+    return executors.get(settings.capture_mode, _execute_text)
@@ -0,0 +1,45 @@
+"""Defines CaptureMode Enum class.
+
+The tediousstart.CaptureMode class will communicate how TediousFuncTest captures the output of
+the command it executes.
+
+    Typical usage example:
+
+    class HugeOutputTestCases(TediousFuncTest):
+
+        capture_mode = CaptureMode.SPOOL  # Spill output beyond spool_max_size bytes to disk
+        spool_dir = '/dev/shm'            # Spill it to tmpfs
+
+        def test_normal_01(self):
+            self.set_command_list(['generate_gigabytes'])
+            self.expect_stdout(['Done'])  # Searched in place, through mmap
+            self.run_test()
+"""
+
+# Standard Imports
+from enum import Enum
+# Third Party Imports
+# Local Imports
+
+
+SPOOL_MAX_SIZE = 16 * 1024 * 1024  # Default number of bytes kept in memory before spilling
+
+
+class CaptureMode(Enum):
+    """Communicates how TediousFuncTest captures command output.
+
+    Attributes:
+        TEXT    # Default behavior: Decode output into strs with a text-mode pipe
+        SPOOL   # Keep output in memory up to spool_max_size bytes then spill it to spool_dir
+        MEMFD   # The command writes straight to memfds (Linux) which are mapped once it exits
+        BYTES   # Read output as bytes, without decoding it or translating newlines (e.g., \r)
+        MERGED  # BYTES plus a timestamped ChunkLog of both streams, in arrival order
+
+    Every mode but TEXT stores output as a tediousstart.binary_output.BinaryOutput.  Expectations
+    are encoded and output is only decoded, using decode_errors, for failure reports.
+    """
+    TEXT = 0
+    SPOOL = 1
+    MEMFD = 2
+    BYTES = 3
+    MERGED = 4
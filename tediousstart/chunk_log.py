@@ -0,0 +1,151 @@
+"""Defines the ChunkLog class.
+
+TediousFuncTest's CaptureMode.MERGED reads stdout and stderr through one selector loop and records
+every chunk, in arrival order, in a ChunkLog.  Each chunk is tagged with its stream and a
+monotonic timestamp.  The log stores each stream's output in its own buffer, which is the only
+copy of the output, and describes each chunk with a few machine integers in array.arrays, so
+recording a chunk costs little more than appending it to a bytes buffer.  The merged output is
+only built, once, if it is asked for.
+
+    Typical usage example:
+
+    chunk_log = ChunkLog()
+    pump_pipes(popen_obj, {stream_name: chunk_log.handler(stream_name)
+                           for stream_name in STREAM_NAMES})
+    print(chunk_log.merged())                      # Interleaved stdout and stderr
+    print(chunk_log.find('stderr', 'WARNING') < chunk_log.find('stdout', 'Summary'))
+"""
+
+# Standard Imports
+from array import array
+from bisect import bisect_right
+from collections import namedtuple
+from typing import Any, Callable, Iterator
+import time
+# Third Party Imports
+# Local Imports
+from tediousstart.binary_output import BinaryOutput
+from tediousstart.output_pump import STREAM_NAMES
+
+
+# One chunk of output: stream name, seconds since the log was created, and the chunk's bytes
+# pylint:disable=undefined-variable
+Chunk = namedtuple('Chunk', ['stream_name', 'timestamp', 'data'])
+# pylint:enable=undefined-variable
+
+
+class ChunkLog():
+    """A timestamped, stream-tagged, arrival-ordered log of output chunks.
+
+    Chunk timestamps are seconds since the log was created, measured with time.monotonic_ns().
+    Chunks are ordered as they were read: chunks written to different pipes at nearly the same
+    instant may be read in either order.
+    """
+
+    __slots__ = ('_buffers', '_tags', '_times', '_sizes', '_starts', '_merged', '_epoch')
+
+    def __init__(self) -> None:
+        """ChunkLog class ctor."""
+        self._buffers = tuple(bytearray() for _ in STREAM_NAMES)  # Each stream's output
+        self._tags = array('B')                                   # Stream index of each chunk
+        self._times = array('q')                                  # Arrival time of each chunk
+        self._sizes = array('Q')                                  # Length of each chunk
+        # Per stream: offsets of each of its chunks in its buffer and in the merged output
+        self._starts = tuple((array('Q'), array('Q')) for _ in STREAM_NAMES)
+        self._merged = None                                       # Merged output, once built
+        self._epoch = time.monotonic_ns()                         # When the log was created
+
+    def __len__(self) -> int:
+        """The number of chunks logged."""
+        return len(self._tags)
+
+    def append(self, stream_name: str, chunk: bytes) -> None:
+        """Log a chunk of stream_name's output, timestamped now."""
+        # LOCAL VARIABLES
+        stream_tag = STREAM_NAMES.index(stream_name)             # Index of stream_name
+        stream_starts, merged_starts = self._starts[stream_tag]  # Offsets of its chunks
+
+        # LOG IT
+        stream_starts.append(len(self._buffers[stream_tag]))
+        merged_starts.append(sum(len(buffer) for buffer in self._buffers))
+        self._tags.append(stream_tag)
+        self._times.append(time.monotonic_ns() - self._epoch)
+        self._sizes.append(len(chunk))
+        self._buffers[stream_tag].extend(chunk)
+        self._merged = None
+
+    def chunks(self) -> Iterator[Chunk]:
+        """Iterate over the logged Chunks, in arrival order."""
+        # LOCAL VARIABLES
+        offsets = [0] * len(STREAM_NAMES)  # Offset of each stream's next chunk in its buffer
+
+        # ITERATE
+        for index, tag in enumerate(self._tags):
+            yield Chunk(STREAM_NAMES[tag], self._times[index] / 1e9,
+                        bytes(self._buffers[tag][offsets[tag]:offsets[tag] + self._sizes[index]]))
+            offsets[tag] += self._sizes[index]
+
+    def find(self, stream_name: str, entry: Any, encoding: str = 'utf-8') -> int:
+        """Find the first occurrence of entry, a str or bytes, in stream_name's output.
+
+        entry may span chunks.  Use the result to order entries from different streams.  Only
+        stream_name's buffer is searched; the offset is then mapped, by a binary search of the
+        stream's chunk offsets, to the merged output.
+
+        Args:
+            stream_name: The stream (see STREAM_NAMES) to search.
+            entry: The output to find.
+            encoding: Optional; Encoding used to encode a str entry.
+
+        Returns:
+            The offset, in the merged output, of entry's first byte or -1 if it isn't found.
+        """
+        # LOCAL VARIABLES
+        stream_tag = STREAM_NAMES.index(stream_name)             # Index of stream_name
+        stream_starts, merged_starts = self._starts[stream_tag]  # Offsets of its chunks
+        stream_offset = -1                                       # Offset of entry in its buffer
+        chunk_num = 0                                            # Stream chunk holding entry
+
+        # FIND IT
+        if isinstance(entry, str):
+            entry = entry.encode(encoding)
+        stream_offset = self._buffers[stream_tag].find(entry)
+
+        # MAP IT
+        chunk_num = bisect_right(stream_starts, stream_offset) - 1
+        if stream_offset < 0 or chunk_num < 0:
+            return -1  # Not found, or entry is empty and stream_name has no output
+        return merged_starts[chunk_num] + stream_offset - stream_starts[chunk_num]
+
+    def handler(self, stream_name: str) -> Callable[[bytes], None]:
+        """Create a pump_pipes() handler that logs stream_name's chunks."""
+        def log_chunk(chunk: bytes) -> None:
+            self.append(stream_name, chunk)
+        return log_chunk
+
+    def merged(self, encoding: str = 'utf-8', errors: str = 'replace') -> BinaryOutput:
+        """Wrap the merged output, stdout and stderr interleaved as they arrived, for searching.
+
+        The merged output is built the first time it's asked for then reused.
+        """
+        # LOCAL VARIABLES
+        offsets = [0] * len(STREAM_NAMES)  # Offset of each stream's next chunk in its buffer
+        views = []                         # Views of each buffer, to avoid copying each chunk twice
+        slices = []                        # Each chunk, in arrival order, as a view
+
+        # BUILD IT
+        if self._merged is None:
+            views = [memoryview(buffer) for buffer in self._buffers]
+            for tag, size in zip(self._tags, self._sizes):
+                slices.append(views[tag][offsets[tag]:offsets[tag] + size])
+                offsets[tag] += size
+            self._merged = b''.join(slices)
+            for view in slices + views:
+                view.release()  # Let the buffers grow again
+
+        # DONE
+        return BinaryOutput(self._merged, encoding, errors)
+
+    def stream(self, stream_name: str) -> bytearray:
+        """Return stream_name's buffer, all of its chunks joined, without copying it."""
+        return self._buffers[STREAM_NAMES.index(stream_name)]
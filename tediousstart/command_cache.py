@@ -0,0 +1,391 @@
+"""Defines the CommandCache and PersistentCommandCache classes and the run-scoped RUN_CACHE.
+
+TediousFuncTest test classes that opt in (by setting the use_command_cache attribute) execute
+each distinct command once per run.  Later test cases executing the identical command, in the
+identical environment, reuse the captured stdout, stderr, and exit code.  Commands are keyed on
+their command list, environment, working directory, and a digest of their stdin.  Entries are
+evicted, least recently used first, to stay within the cache's memory cap.  Test cases that call
+TediousFuncTest.mark_nondeterministic() always bypass the cache.
+
+    Typical usage example:
+
+    class TestBigReport(TediousFuncTest):
+        use_command_cache = True  # Every test case shares one execution of the report
+
+        def test_normal_01(self):
+            self.set_command_list(['big_report', '--all'])
+            self.expect_stdout(['Header'])
+            self.run_test()
+
+        def test_normal_02(self):
+            self.set_command_list(['big_report', '--all'])  # Reuses test_normal_01's results
+            self.expect_stdout(['Footer'])
+            self.run_test()
+
+Test classes may also share results across runs by setting the persistent_cache attribute to a
+PersistentCommandCache.  Persistent entries are content-addressed: the key hashes the executable,
+the command list, any input files declared with TediousFuncTest.declare_input_files(), and any
+environment variables declared with TediousFuncTest.declare_env_vars().  A hit skips execution
+entirely but every expectation still runs against the cached results.  Only successful
+executions (exit code 0) are stored unless the cache is created with cache_failures=True, so a
+failure caused by something undeclared (e.g., a flaky dependency) is not replayed by later runs.
+The on-disk store evicts its least recently used entries to stay within its size limit.
+
+    Typical usage example:
+
+    class TestConverter(TediousFuncTest):
+        persistent_cache = PersistentCommandCache('/var/cache/test-results')
+
+        def test_normal_01(self):
+            self.set_command_list(['converter', 'input.csv'])
+            self.declare_input_files(['input.csv'])
+            self.declare_env_vars(['LANG'])
+            self.expect_stdout(['3 rows converted'])
+            self.run_test()
+"""
+
+# Standard Imports
+# hashlib, json, pathlib, shutil, tempfile, and hobo.disk_operations are imported on first use
+# to keep the import time of TediousFuncTest low.
+from collections import OrderedDict, namedtuple
+from typing import Any
+import os
+import sys
+import threading
+# Third Party Imports
+from hobo.validation import validate_string, validate_type
+# Local Imports
+
+
+MB = 1048576  # Size of 1 MB
+
+# Stores the captured results of a single command execution
+# pylint:disable=undefined-variable
+CachedExecution = namedtuple('CachedExecution', ['stdout', 'stderr', 'exit_code'])
+# pylint:enable=undefined-variable
+
+
+class CommandCache():
+    """Least-recently-used cache of command executions bounded by memory usage.
+
+    For more details:
+        import tediousstart.command_cache
+        help(tediousstart.command_cache)
+    """
+
+    def __init__(self, max_bytes: int = 64 * MB) -> None:
+        """CommandCache class ctor.
+
+        Args:
+            max_bytes: Optional; Approximate memory cap, in bytes, for all cached output.
+
+        Raises:
+            TypeError: Invalid data type.
+            ValueError: Negative max_bytes.
+        """
+        # INPUT VALIDATION
+        validate_type(max_bytes, 'max_bytes', int)
+        if max_bytes < 0:
+            raise ValueError(f'Invalid max_bytes value of {max_bytes}')
+
+        # ATTRIBUTES
+        self.max_bytes = max_bytes      # Memory cap
+        self.hits = 0                   # Number of successful lookups
+        self.misses = 0                 # Number of failed lookups
+        self._entries = OrderedDict()   # Key: (CachedExecution, size), least recent first
+        self._size = 0                  # Current approximate memory usage
+        self._lock = threading.Lock()   # Guards the entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Approximate memory, in bytes, used by the cached output."""
+        return self._size
+
+    def clear(self) -> None:
+        """Empty the cache and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def discard(self, key: str) -> None:
+        """Remove key from the cache, if present."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry:
+                self._size -= entry[1]
+
+    def get(self, key: str) -> CachedExecution:
+        """Look up key, marking it most recently used.
+
+        Returns:
+            The CachedExecution stored for key or None if key is not cached.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: str, execution: CachedExecution) -> None:
+        """Cache execution under key, evicting least recently used entries as necessary.
+
+        Executions larger than the entire memory cap are not cached.
+        """
+        # LOCAL VARIABLES
+        entry_size = _estimate_size(execution.stdout) + _estimate_size(execution.stderr)
+
+        # CACHE IT
+        with self._lock:
+            old_entry = self._entries.pop(key, None)
+            if old_entry:
+                self._size -= old_entry[1]
+            if entry_size > self.max_bytes:
+                return
+            while self._entries and self._size + entry_size > self.max_bytes:
+                self._size -= self._entries.popitem(last=False)[1][1]
+            self._entries[key] = (execution, entry_size)
+            self._size += entry_size
+
+
+class PersistentCommandCache():
+    """Size-bounded on-disk store of command executions keyed by content.
+
+    Each entry is a JSON file, named for its key, in the cache directory.  Reading an entry
+    refreshes its modification time so eviction removes the least recently used entries first.
+
+    For more details:
+        import tediousstart.command_cache
+        help(tediousstart.command_cache)
+    """
+
+    _entry_ext = '.json'  # Filename extension for entries
+
+    def __init__(self, cache_dir: str, max_bytes: int = 256 * MB,
+                 cache_failures: bool = False) -> None:
+        """PersistentCommandCache class ctor.
+
+        Args:
+            cache_dir: Directory to store entries in.  Created if it does not exist.
+            max_bytes: Optional; Size limit, in bytes, for all entries on disk.
+            cache_failures: Optional; If True, also store executions with a non-zero exit code.
+
+        Raises:
+            TypeError: Invalid data type.
+            ValueError: Empty cache_dir or negative max_bytes.
+            OSError: Unable to create cache_dir.
+        """
+        # INPUT VALIDATION
+        validate_string(cache_dir, 'cache_dir', can_be_empty=False)
+        validate_type(max_bytes, 'max_bytes', int)
+        validate_type(cache_failures, 'cache_failures', bool)
+        if max_bytes < 0:
+            raise ValueError(f'Invalid max_bytes value of {max_bytes}')
+
+        # ATTRIBUTES
+        self.cache_dir = cache_dir            # Entry storage
+        self.max_bytes = max_bytes            # Size limit
+        self.cache_failures = cache_failures  # Store executions with a non-zero exit code
+        self._lock = threading.Lock()         # Serializes writes and evictions within this process
+
+        # PREPARATION
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def clear(self) -> None:
+        """Delete every entry."""
+        with self._lock:
+            for filename, _, _ in self._list_entries():
+                _remove_quietly(filename)
+
+    def discard(self, key: str) -> None:
+        """Remove key from the store, if present."""
+        _remove_quietly(self._entry_filename(key))
+
+    def get(self, key: str) -> CachedExecution:
+        """Look up key, marking it most recently used.
+
+        Returns:
+            The CachedExecution stored for key or None if key is not cached (or the entry is
+            unreadable).
+        """
+        import json  # pylint: disable=import-outside-toplevel
+
+        # LOCAL VARIABLES
+        filename = self._entry_filename(key)  # Entry for key
+        contents = None                       # Decoded JSON
+
+        # READ IT
+        try:
+            with open(filename, 'r', encoding='utf-8') as in_file:
+                contents = json.load(in_file)
+            os.utime(filename)
+        except (OSError, ValueError):
+            return None
+
+        # DONE
+        return CachedExecution(contents['stdout'], contents['stderr'], contents['exit_code'])
+
+    def put(self, key: str, execution: CachedExecution) -> None:
+        """Store execution under key, evicting least recently used entries as necessary.
+
+        Executions with a non-zero exit code are ignored unless cache_failures is True.
+        """
+        import json  # pylint: disable=import-outside-toplevel
+        import tempfile  # pylint: disable=import-outside-toplevel
+
+        # LOCAL VARIABLES
+        temp_fd = None        # File descriptor of the temporary entry
+        temp_filename = None  # Temporary entry, renamed into place once written
+
+        # INPUT VALIDATION
+        if execution.exit_code != 0 and not self.cache_failures:
+            return
+
+        # WRITE IT
+        with self._lock:
+            temp_fd, temp_filename = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(temp_fd, 'w', encoding='utf-8') as out_file:
+                    json.dump({'stdout': execution.stdout, 'stderr': execution.stderr,
+                               'exit_code': execution.exit_code}, out_file)
+                os.replace(temp_filename, self._entry_filename(key))
+            except (OSError, TypeError, ValueError):
+                _remove_quietly(temp_filename)
+                return
+            self._evict()
+
+    def _entry_filename(self, key: str) -> str:
+        """Translate a key into the entry's filename."""
+        return os.path.join(self.cache_dir, key + self._entry_ext)
+
+    def _evict(self) -> None:
+        """Delete the least recently used entries until the store fits within max_bytes."""
+        # LOCAL VARIABLES
+        entries = sorted(self._list_entries(), key=lambda entry: entry[1])  # Oldest first
+        total_size = sum(entry[2] for entry in entries)                       # Bytes on disk
+
+        # EVICT
+        for filename, _, entry_size in entries:
+            if total_size <= self.max_bytes:
+                break
+            _remove_quietly(filename)
+            total_size -= entry_size
+
+    def _list_entries(self) -> list:
+        """List (filename, modification time, size) for every entry."""
+        # LOCAL VARIABLES
+        entries = []  # List of (filename, mtime, size) tuples
+
+        # LIST THEM
+        with os.scandir(self.cache_dir) as dir_iter:
+            for dir_entry in dir_iter:
+                if dir_entry.name.endswith(self._entry_ext) and dir_entry.is_file():
+                    try:
+                        stat_result = dir_entry.stat()
+                    except OSError:
+                        continue  # Deleted by another process
+                    entries.append((dir_entry.path, stat_result.st_mtime,
+                                    stat_result.st_size))
+
+        # DONE
+        return entries
+
+
+RUN_CACHE = CommandCache()  # Run-scoped cache shared by all TediousFuncTest objects
+
+
+def make_command_key(cmd_list: list, env: dict = None, cwd: str = None,
+                     stdin: bytes = None) -> str:
+    """Create a cache key from everything that determines a command's results.
+
+    Args:
+        cmd_list: The command list passed to subprocess.
+        env: Optional; The command's environment.  Defaults to the current environment.
+        cwd: Optional; The command's working directory.  Defaults to the current directory.
+        stdin: Optional; The input fed to the command's stdin, if any.
+
+    Returns:
+        A hex digest uniquely identifying the command execution.
+    """
+    import hashlib  # pylint: disable=import-outside-toplevel
+
+    # LOCAL VARIABLES
+    hasher = hashlib.sha256()  # Builds the key
+    stdin_digest = ''          # Digest of stdin
+
+    # PREPARE
+    if env is None:
+        env = os.environ
+    if cwd is None:
+        cwd = os.getcwd()
+    if stdin is not None:
+        stdin_digest = hashlib.sha256(stdin).hexdigest()
+
+    # HASH IT
+    hasher.update(repr((tuple(cmd_list), sorted(env.items()), cwd, stdin_digest)).encode())
+
+    # DONE
+    return hasher.hexdigest()
+
+
+def make_persistent_key(cmd_list: list, input_files: list = None, env_vars: list = None) -> str:
+    """Create a content-addressed key for a PersistentCommandCache.
+
+    The key changes whenever the executable, the command list, the contents of an input file, or
+    the value of a declared environment variable changes.
+
+    Args:
+        cmd_list: The command list passed to subprocess.  The first entry is resolved against
+            PATH and, if found, the executable's contents are hashed.
+        input_files: Optional; Files the command reads.  Their contents are hashed.
+        env_vars: Optional; Names of environment variables that influence the command.
+
+    Returns:
+        A hex digest uniquely identifying the command's inputs.
+
+    Raises:
+        FileNotFoundError: An input file is missing.
+    """
+    # pylint: disable=import-outside-toplevel
+    from pathlib import Path
+    import hashlib
+    import shutil
+    from hobo.disk_operations import calc_file_md5sum
+    # pylint: enable=import-outside-toplevel
+
+    # LOCAL VARIABLES
+    hasher = hashlib.sha256()                # Builds the key
+    executable = shutil.which(cmd_list[0])   # Absolute path to the executable
+    exe_digest = ''                          # Digest of the executable
+
+    # HASH IT
+    if executable:
+        exe_digest = calc_file_md5sum(Path(executable))
+    hasher.update(repr((exe_digest, tuple(cmd_list))).encode())
+    for input_file in sorted(input_files or []):
+        hasher.update(repr((input_file, calc_file_md5sum(Path(input_file)))).encode())
+    for env_var in sorted(env_vars or []):
+        hasher.update(repr((env_var, os.environ.get(env_var))).encode())
+
+    # DONE
+    return hasher.hexdigest()
+
+
+def _estimate_size(output: Any) -> int:
+    """Approximate the memory used by captured output."""
+    return sys.getsizeof(output)
+
+
+def _remove_quietly(filename: str) -> None:
+    """Delete filename, ignoring errors (e.g., another process already deleted it)."""
+    try:
+        os.remove(filename)
+    except OSError:
+        pass
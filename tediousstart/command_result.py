@@ -0,0 +1,185 @@
+"""Defines the CommandResult and OutputView classes.
+
+TediousFuncTest.run_test() returns an immutable CommandResult describing the command execution
+it validated: the argv, exit code, terminating signal, timings, resource usage, and views of the
+captured output.  A CommandResult holds references to the captured output rather than copies,
+is independent of the test case object, and pickles cheaply so parallel runners can ship it
+between processes.
+
+    Typical usage example:
+
+    result = self.run_test()
+    if result.duration is not None and result.duration > 1.0:
+        print(f'{result.argv} took {result.duration:.2f} seconds')
+    if 'WARNING' in result.stdout:
+        print(result.stdout.text()[:80])
+"""
+
+# Standard Imports
+# signal is imported on first use to keep the import time of TediousFuncTest low.
+from collections import namedtuple
+from typing import Any, Optional
+# Third Party Imports
+# Local Imports
+
+
+# Resources consumed by a command execution
+# pylint:disable=undefined-variable
+ResourceUsage = namedtuple('ResourceUsage', ['user_time', 'system_time', 'max_rss'])
+# pylint:enable=undefined-variable
+
+
+class OutputView():
+    """A read-only view of captured output that avoids copying it.
+
+    Supports len(), the in operator, str(), find(), and text().
+    """
+
+    __slots__ = ('_source',)
+
+    def __init__(self, source: Any) -> None:
+        """OutputView class ctor.
+
+        Args:
+            source: The captured output.
+        """
+        self._source = source  # The captured output
+
+    def __contains__(self, entry: Any) -> bool:
+        """Determine if entry is in the output."""
+        return entry in self._source
+
+    def __eq__(self, other: Any) -> bool:
+        """Views are equal to other views, and to raw output, with the same contents."""
+        if isinstance(other, OutputView):
+            return self._source == other._source
+        return self._source == other
+
+    __hash__ = None  # Compared by contents
+
+    def __len__(self) -> int:
+        """The length of the output."""
+        return len(self._source)
+
+    def __repr__(self) -> str:
+        """Represent the view without embedding the output."""
+        return f'OutputView(<{len(self._source)} characters>)'
+
+    def __str__(self) -> str:
+        """The output as a string."""
+        return self.text()
+
+    def find(self, entry: Any, start: int = 0) -> int:
+        """Return the lowest index of entry in the output, or -1 if it isn't found."""
+        return self._source.find(entry, start)
+
+    def text(self) -> str:
+        """Return the output as a string."""
+        if isinstance(self._source, str):
+            return self._source
+        return str(self._source)
+
+
+class CommandResult():
+    """The immutable result of a TediousFuncTest command execution.
+
+    Attributes:
+        argv: The executed command, as a tuple.
+        exit_code: The exit code (negative if the command was terminated by a signal).
+        signal: The signal.Signals that terminated the command, None if it exited.
+        duration: Seconds spent executing the command, None if the results came from a cache.
+        rusage: A ResourceUsage, None if the results came from a cache or are unavailable.
+        stdout: An OutputView of the command's stdout.
+        stderr: An OutputView of the command's stderr.
+        cached: True if the results came from a command cache or the class-wide execution.
+        chunk_log: CaptureMode.MERGED: The ChunkLog of both streams, in arrival order, else None.
+        merged: CaptureMode.MERGED: An OutputView of stdout and stderr interleaved as they
+            arrived, else None.
+    """
+
+    __slots__ = ('argv', 'exit_code', 'signal', 'duration', 'rusage', 'stdout', 'stderr',
+                 'cached', 'chunk_log')
+    argv: tuple
+    exit_code: int
+    signal: Any
+    duration: Optional[float]
+    rusage: Optional[ResourceUsage]
+    stdout: OutputView
+    stderr: OutputView
+    cached: bool
+    chunk_log: Any
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, argv: tuple, exit_code: int, stdout: Any, stderr: Any, *,
+                 duration: Optional[float] = None, rusage: Optional[ResourceUsage] = None,
+                 cached: bool = False, chunk_log: Any = None) -> None:
+        """CommandResult class ctor.
+
+        Args:
+            argv: The executed command.
+            exit_code: The exit code.
+            stdout: The command's stdout (or an OutputView of it).
+            stderr: The command's stderr (or an OutputView of it).
+            duration: Optional; Seconds spent executing the command.
+            rusage: Optional; Resources consumed by the command.
+            cached: Optional; True if the results came from a cache.
+            chunk_log: Optional; The ChunkLog of a CaptureMode.MERGED execution.
+        """
+        self.__setstate__({'argv': tuple(argv), 'exit_code': exit_code,
+                           'signal': _exit_code_to_signal(exit_code), 'duration': duration,
+                           'rusage': rusage, 'stdout': _as_view(stdout),
+                           'stderr': _as_view(stderr), 'cached': cached,
+                           'chunk_log': chunk_log})
+    # pylint: enable=too-many-arguments
+
+    @property
+    def merged(self) -> Optional[OutputView]:
+        """CaptureMode.MERGED: An OutputView of the interleaved output, built on first use."""
+        return _merged_view(self.chunk_log)
+
+    def __getstate__(self) -> dict:
+        """Pickle the attributes by name."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state: dict) -> None:
+        """Set the read-only attributes, from the ctor or when unpickling."""
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    def __repr__(self) -> str:
+        """Represent the result without embedding its output."""
+        return (f'CommandResult(argv={self.argv!r}, exit_code={self.exit_code}, '
+                f'duration={self.duration}, cached={self.cached})')
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """CommandResults are immutable."""
+        raise AttributeError(f'CommandResult is immutable; unable to set {name}')
+
+    def __delattr__(self, name: str) -> None:
+        """CommandResults are immutable."""
+        raise AttributeError(f'CommandResult is immutable; unable to delete {name}')
+
+
+def _as_view(output: Any) -> OutputView:
+    """Wrap output in an OutputView unless it already is one."""
+    if isinstance(output, OutputView):
+        return output
+    return OutputView(output)
+
+
+def _exit_code_to_signal(exit_code: Optional[int]) -> Any:
+    """Translate a negative Popen exit code into the signal that terminated the command."""
+    if exit_code is None or exit_code >= 0:
+        return None
+    import signal  # pylint: disable=import-outside-toplevel
+    try:
+        return signal.Signals(-exit_code)
+    except ValueError:
+        return None
+
+
+def _merged_view(chunk_log: Any) -> Optional[OutputView]:
+    """Wrap the merged output of chunk_log, a ChunkLog, in an OutputView."""
+    if chunk_log is None:
+        return None
+    return OutputView(chunk_log.merged())
@@ -0,0 +1,439 @@
+"""Defines return value comparison strategies for TediousUnitTest.
+
+TediousUnitTest._validate_return_value() calls compare_values() to compare the expected return
+value with the actual return value.  The comparison strategy is selected by type:
+
+    * NumPy arrays (and large numeric sequences, if NumPy is importable) are compared with a
+      vectorized numpy.isclose()/numpy.array_equal().
+    * Large sequences, strings, and bytes are compared in chunks.  Equal chunks are skipped with
+      a single C-level comparison; only unequal chunks are compared item by item.
+    * Dictionaries, sets, and nested containers are compared by structural_diff().
+    * Numbers are compared with math.isclose() when a tolerance is defined.
+    * Everything else is compared with !=.
+
+Failure messages never embed entire values.  They report, at most, the first max_diffs
+differences, each addressed by its index or path (e.g., ['users'][3]['name']), and a summary
+count.
+
+    Typical usage example:
+
+    failure_msg = compare_values(expected, actual, rel_tol=1e-9, abs_tol=0.0, max_diffs=10)
+    if failure_msg:
+        self._add_test_failure(failure_msg)
+"""
+
+# Standard Imports
+from numbers import Number
+from typing import Any, Callable, List, Optional, Tuple
+import math
+# Third Party Imports
+# Local Imports
+
+
+CHUNK_SIZE = 4096           # Number of items compared at once by the chunked strategy
+LARGE_SEQUENCE = 64         # Sequences at least this long use the chunked strategy
+MAX_VALUE_CHARS = 256       # Maximum characters of a single value embedded in a failure message
+MAX_ITEM_CHARS = 64         # Maximum characters of a single difference's values
+_CONTAINERS = (dict, list, tuple, set, frozenset)  # Types structural_diff() descends into
+_SEQUENCES = (list, tuple, str, bytes, bytearray)   # Types the chunked strategy compares
+_NUMPY_SENTINEL = object()  # Indicates numpy has not been imported yet
+_numpy = _NUMPY_SENTINEL    # The numpy module, None if it isn't importable
+
+
+def compare_values(expected: Any, actual: Any, *, rel_tol: float = 0.0, abs_tol: float = 0.0,
+                   max_diffs: int = 10) -> str:
+    """Compare expected to actual using a strategy selected by type.
+
+    Args:
+        expected: The expected value.
+        actual: The actual value.
+        rel_tol: Optional; Relative tolerance for numeric comparisons (see: math.isclose()).
+        abs_tol: Optional; Absolute tolerance for numeric comparisons (see: math.isclose()).
+        max_diffs: Optional; Maximum number of differences to describe in the failure message.
+
+    Returns:
+        An empty string if the values match, otherwise a size-bounded failure message.
+    """
+    # LOCAL VARIABLES
+    strategy = _select_strategy(expected, actual, rel_tol > 0 or abs_tol > 0)  # Compares them
+
+    # DONE
+    return strategy(expected, actual, rel_tol=rel_tol, abs_tol=abs_tol, max_diffs=max_diffs)
+
+
+def shorten(value: Any, max_chars: int = MAX_VALUE_CHARS) -> str:
+    """Convert value to a string of, at most, roughly max_chars characters."""
+    # LOCAL VARIABLES
+    value_str = ''  # String representation of value
+
+    # STRINGIFY IT
+    try:
+        value_str = str(value)
+    except RecursionError:
+        return f'<{type(value).__name__} nested too deeply to display>'
+
+    # SHORTEN IT
+    if len(value_str) > max_chars:
+        value_str = f'{value_str[:max_chars]}... ({len(value_str)} characters total)'
+
+    # DONE
+    return value_str
+
+
+# pylint: disable=too-many-arguments,too-many-branches,too-many-locals
+def structural_diff(expected: Any, actual: Any, *, rel_tol: float = 0.0, abs_tol: float = 0.0,
+                    max_diffs: int = 10, path: str = '') -> Tuple[int, List[str]]:
+    """Find the path-addressed differences between two nested structures.
+
+    Dictionaries, lists, tuples, sets, and frozensets are walked with an explicit stack, so
+    nesting depth is not limited by the recursion limit.  Identical subtrees are skipped by
+    identity.  Tuples and frozensets are skipped when their (cached) hashes and values match.
+    Equal chunks of long lists are skipped with a single comparison.
+
+    Args:
+        expected: The expected structure.
+        actual: The actual structure.
+        rel_tol: Optional; Relative tolerance for numeric leaves (see: math.isclose()).
+        abs_tol: Optional; Absolute tolerance for numeric leaves (see: math.isclose()).
+        max_diffs: Optional; Maximum number of differences to describe.
+        path: Optional; Path prefix for every difference (e.g., '[3]').
+
+    Returns:
+        A tuple containing the total number of differences and a list of, at most, max_diffs
+        difference descriptions.
+    """
+    # LOCAL VARIABLES
+    tolerant = rel_tol > 0 or abs_tol > 0  # Were tolerances defined?
+    stack = [(path, expected, actual)]     # Nodes left to compare: (path, expected, actual)
+    hash_cache = {}                        # id(immutable node): hash, None if unhashable
+    diffs = []                             # First max_diffs differences
+    diff_count = 0                         # Total number of differences
+
+    # WALK IT
+    while stack:
+        node_path, exp_node, act_node = stack.pop()
+        where = _shorten_path(node_path)  # Printable path to this node
+        new_diffs = []                    # Differences found at this node
+        # Identity
+        if exp_node is act_node:
+            continue
+        # Type
+        if type(exp_node) is not type(act_node) \
+                and not (_is_number(exp_node) and _is_number(act_node)):
+            new_diffs.append(f'{where} expected {type(exp_node).__name__} but received '
+                             f'{type(act_node).__name__}')
+        # Dictionaries
+        elif isinstance(exp_node, dict):
+            new_diffs.extend(f'{_shorten_path(node_path, "")}[{_shorten_repr(key)}] '
+                             'unexpected' for key in act_node if key not in exp_node)
+            for key in reversed(list(exp_node)):
+                if key in act_node:
+                    stack.append((f'{node_path}[{_shorten_repr(key)}]', exp_node[key],
+                                  act_node[key]))
+                else:
+                    new_diffs.append(f'{_shorten_path(node_path, "")}[{_shorten_repr(key)}] '
+                                     'missing')
+        # Sets
+        elif isinstance(exp_node, (set, frozenset)):
+            if not _same_immutable(exp_node, act_node, hash_cache):
+                new_diffs.extend(f'{where} missing {_shorten_repr(item)}'
+                                 for item in exp_node - act_node)
+                new_diffs.extend(f'{where} unexpected {_shorten_repr(item)}'
+                                 for item in act_node - exp_node)
+        # Sequences
+        elif isinstance(exp_node, (list, tuple)):
+            if isinstance(exp_node, tuple) and _same_immutable(exp_node, act_node, hash_cache):
+                continue
+            if len(exp_node) != len(act_node):
+                new_diffs.append(f'{where} expected length {len(exp_node)} but received length '
+                                 f'{len(act_node)}')
+            for start in reversed(range(0, min(len(exp_node), len(act_node)), CHUNK_SIZE)):
+                end = min(start + CHUNK_SIZE, len(exp_node), len(act_node))
+                if _safe_equal(exp_node[start:end], act_node[start:end]):
+                    continue  # Fast path: the entire chunk matches
+                stack.extend((f'{node_path}[{index}]', exp_node[index], act_node[index])
+                             for index in reversed(range(start, end)))
+        # Leaves
+        elif not _items_match(exp_node, act_node, rel_tol, abs_tol, tolerant):
+            new_diffs.append(_describe_item(where, exp_node, act_node))
+        # Record
+        diff_count += len(new_diffs)
+        diffs.extend(new_diffs[:max(max_diffs - len(diffs), 0)])
+
+    # DONE
+    return tuple((diff_count, diffs))
+# pylint: enable=too-many-arguments,too-many-branches,too-many-locals
+
+
+def _as_numeric_arrays(expected: Any, actual: Any) -> Optional[tuple]:
+    """Convert two equal-length lists or tuples of real numbers to numpy arrays.
+
+    Returns:
+        A tuple of the expected and actual arrays, None if numpy isn't importable or the values
+        can't be compared as numeric arrays.
+    """
+    # LOCAL VARIABLES
+    numpy = _import_numpy()  # Optional numpy module
+    exp_array = None         # Expected value as an array
+    act_array = None         # Actual value as an array
+
+    # CONVERT THEM
+    if numpy is None or not isinstance(expected, (list, tuple)) \
+            or not isinstance(actual, (list, tuple)) or len(expected) != len(actual):
+        return None
+    exp_array = numpy.asarray(expected)
+    act_array = numpy.asarray(actual)
+    if exp_array.dtype.kind in 'iuf' and act_array.dtype.kind in 'iuf':
+        return tuple((exp_array, act_array))
+    return None
+
+
+def _compare_arrays(expected: Any, actual: Any, *, rel_tol: float, abs_tol: float,
+                    max_diffs: int) -> str:
+    """Vectorized comparison of array-likes using numpy."""
+    # LOCAL VARIABLES
+    numpy = _import_numpy()              # The numpy module
+    exp_array = numpy.asarray(expected)  # Expected value as an array
+    act_array = numpy.asarray(actual)    # Actual value as an array
+    matches = None                       # Boolean array of matching elements
+    diff_indices = None                  # Flat indices of differing elements
+
+    # SHAPE
+    if exp_array.shape != act_array.shape:
+        return f'Expected shape {exp_array.shape} but received shape {act_array.shape} instead'
+
+    # VALUES
+    if (rel_tol > 0 or abs_tol > 0) and exp_array.dtype.kind in 'iufc' \
+            and act_array.dtype.kind in 'iufc':
+        matches = numpy.isclose(act_array, exp_array, rtol=rel_tol, atol=abs_tol)
+    else:
+        matches = numpy.asarray(act_array == exp_array)  # Exact, without converting integers
+    if matches.all():
+        return ''
+
+    # REPORT
+    diff_indices = numpy.flatnonzero(~matches)
+    return _format_diffs([_describe_item(''.join(f'[{int(axis_index)}]' for axis_index in
+                                                 numpy.unravel_index(index, exp_array.shape)),
+                                         exp_array.flat[index], act_array.flat[index])
+                          for index in diff_indices[:max_diffs]],
+                         len(diff_indices), exp_array.size)
+
+
+def _compare_sequences(expected: Any, actual: Any, *, rel_tol: float, abs_tol: float,
+                       max_diffs: int) -> str:
+    """Chunked comparison of sequences, strings, and bytes.
+
+    Differing items that are both containers are described by structural_diff().
+    """
+    # LOCAL VARIABLES
+    tolerant = rel_tol > 0 or abs_tol > 0          # Were tolerances defined?
+    diffs = []                                     # First max_diffs differences
+    diff_count = 0                                 # Total number of differing items
+    common_len = min(len(expected), len(actual))   # Number of items to compare
+    arrays = _as_numeric_arrays(expected, actual)  # Numeric numpy arrays of expected and actual
+    nested_count = 0                               # Number of differences in a nested item
+    nested_diffs = []                              # Differences in a nested item
+
+    # VECTORIZE IT
+    if arrays:
+        return _compare_arrays(*arrays, rel_tol=rel_tol, abs_tol=abs_tol, max_diffs=max_diffs)
+
+    # COMPARE CHUNKS
+    for start in range(0, common_len, CHUNK_SIZE):
+        end = min(start + CHUNK_SIZE, common_len)
+        if _safe_equal(expected[start:end], actual[start:end]):
+            continue  # Fast path: the entire chunk matches
+        for index in range(start, end):
+            if isinstance(expected[index], _CONTAINERS) \
+                    and isinstance(actual[index], _CONTAINERS):
+                nested_count, nested_diffs = structural_diff(expected[index], actual[index],
+                                                             rel_tol=rel_tol, abs_tol=abs_tol,
+                                                             max_diffs=max_diffs - len(diffs),
+                                                             path=f'[{index}]')
+                if nested_count:
+                    diff_count += 1
+                    diffs.extend(nested_diffs)
+            elif not _items_match(expected[index], actual[index], rel_tol, abs_tol, tolerant):
+                diff_count += 1
+                if len(diffs) < max_diffs:
+                    diffs.append(_describe_item(f'[{index}]', expected[index], actual[index]))
+
+    # LENGTH
+    if len(expected) != len(actual):
+        return (f'Expected length {len(expected)} but received length {len(actual)} instead'
+                + (f'; {_format_diffs(diffs, diff_count, common_len)}' if diff_count else ''))
+    if not diff_count:
+        return ''
+    return _format_diffs(diffs, diff_count, common_len)
+
+
+def _compare_numbers(expected: Any, actual: Any, *, rel_tol: float, abs_tol: float,
+                     max_diffs: int) -> str:
+    """Compare two numbers with math.isclose()."""
+    del max_diffs  # A number has one difference, at most
+    if math.isclose(expected, actual, rel_tol=rel_tol, abs_tol=abs_tol):
+        return ''
+    return (f'Expected value "{expected}" but received "{actual}" instead '
+            f'(rel_tol={rel_tol}, abs_tol={abs_tol})')
+
+
+def _compare_others(expected: Any, actual: Any, *, rel_tol: float, abs_tol: float,
+                    max_diffs: int) -> str:
+    """Compare any other values with ==."""
+    del rel_tol, abs_tol, max_diffs  # Not applicable
+    if _safe_equal(expected, actual):
+        return ''
+    return f'Expected value "{shorten(expected)}" but received "{shorten(actual)}" instead'
+
+
+def _compare_structures(expected: Any, actual: Any, *, rel_tol: float, abs_tol: float,
+                        max_diffs: int) -> str:
+    """Compare dictionaries, sets, and nested containers with structural_diff()."""
+    # LOCAL VARIABLES
+    diff_count = 0  # Total number of structural differences
+    diffs = []      # First max_diffs structural differences
+
+    # COMPARE THEM
+    if expected is actual or _safe_equal(expected, actual):
+        return ''
+    diff_count, diffs = structural_diff(expected, actual, rel_tol=rel_tol, abs_tol=abs_tol,
+                                        max_diffs=max_diffs)
+    if not diff_count:
+        return ''
+    return f'{diff_count} differences; first {len(diffs)}: {"; ".join(diffs)}'
+
+
+def _describe_item(path: str, exp_item: Any, act_item: Any) -> str:
+    """Describe one differing item, shortening both values."""
+    return (f'{path} expected {shorten(exp_item, MAX_ITEM_CHARS)} '
+            f'but received {shorten(act_item, MAX_ITEM_CHARS)}')
+
+
+def _format_diffs(diffs: List[str], diff_count: int, total: int) -> str:
+    """Format the first differences and a summary count into a failure message."""
+    return f'{diff_count} of {total} items differ; first {len(diffs)}: {"; ".join(diffs)}'
+
+
+def _import_numpy() -> Any:
+    """Import numpy on first use.
+
+    Returns:
+        The numpy module or None if it is not installed.
+    """
+    # pylint: disable=global-statement
+    global _numpy
+    # pylint: enable=global-statement
+    if _numpy is _NUMPY_SENTINEL:
+        try:
+            # pylint: disable=import-outside-toplevel
+            import numpy
+            # pylint: enable=import-outside-toplevel
+            _numpy = numpy
+        except ImportError:
+            _numpy = None
+    return _numpy
+
+
+def _is_number(value: Any) -> bool:
+    """Determine if value is a real number (bool excluded)."""
+    return isinstance(value, Number) and not isinstance(value, (bool, complex))
+
+
+def _items_match(exp_item: Any, act_item: Any, rel_tol: float, abs_tol: float,
+                 tolerant: bool) -> bool:
+    """Compare two sequence items, honoring tolerances for numbers."""
+    if tolerant and _is_number(exp_item) and _is_number(act_item):
+        return math.isclose(exp_item, act_item, rel_tol=rel_tol, abs_tol=abs_tol)
+    return _safe_equal(exp_item, act_item)
+
+
+def _safe_equal(expected: Any, actual: Any) -> bool:
+    """Compare with ==, treating values nested too deeply to compare as unequal.
+
+    structural_diff() then locates the difference, if any, without recursing.
+    """
+    try:
+        return bool(expected == actual)
+    except RecursionError:
+        return False
+
+
+def _same_immutable(expected: Any, actual: Any, hash_cache: dict) -> bool:
+    """Determine if two tuples or frozensets are equal, short-circuiting on cached hashes.
+
+    Args:
+        expected: The expected tuple or frozenset.
+        actual: The actual tuple or frozenset.
+        hash_cache: Maps id(node) to hash(node), None if unhashable.  The compared structures
+            keep every node alive so the ids remain unique for the duration of the walk.
+
+    Returns:
+        True if the values are equal, False if they differ or can't be hashed.
+    """
+    # LOCAL VARIABLES
+    hashes = []  # Hashes of expected and actual
+
+    # HASH THEM
+    for node in (expected, actual):
+        if id(node) not in hash_cache:
+            try:
+                hash_cache[id(node)] = hash(node)
+            except (TypeError, RecursionError):
+                hash_cache[id(node)] = None  # Contains mutable items or nested too deeply
+        hashes.append(hash_cache[id(node)])
+
+    # COMPARE THEM
+    if None in hashes or hashes[0] != hashes[1]:
+        return False
+    return _safe_equal(expected, actual)
+
+
+def _select_strategy(expected: Any, actual: Any, tolerant: bool) -> Callable[..., str]:
+    """Select the compare_values() strategy for the types of expected and actual.
+
+    Args:
+        expected: The expected value.
+        actual: The actual value.
+        tolerant: True if numeric tolerances were defined.
+
+    Returns:
+        A _compare_*() function.
+    """
+    # LOCAL VARIABLES
+    numpy = _import_numpy()  # Optional numpy module
+
+    # ARRAYS
+    if numpy is not None and (isinstance(expected, numpy.ndarray)
+                              or isinstance(actual, numpy.ndarray)):
+        return _compare_arrays
+    # SEQUENCES
+    if isinstance(expected, _SEQUENCES) and isinstance(actual, _SEQUENCES):
+        if max(len(expected), len(actual)) >= LARGE_SEQUENCE \
+                or (tolerant and isinstance(expected, (list, tuple))):
+            return _compare_sequences
+    # STRUCTURES
+    if isinstance(expected, _CONTAINERS) and isinstance(actual, _CONTAINERS):
+        return _compare_structures
+    # NUMBERS
+    if tolerant and _is_number(expected) and _is_number(actual):
+        return _compare_numbers
+    # EVERYTHING ELSE
+    return _compare_others
+
+
+def _shorten_path(path: str, root: str = '$') -> str:
+    """Shorten a deeply nested path to its last MAX_VALUE_CHARS characters."""
+    if not path:
+        return root
+    if len(path) > MAX_VALUE_CHARS:
+        return f'...{path[-MAX_VALUE_CHARS:]}'
+    return path
+
+
+def _shorten_repr(value: Any) -> str:
+    """Shorten the repr() of a dictionary key or set item."""
+    try:
+        return shorten(repr(value), MAX_ITEM_CHARS)
+    except RecursionError:
+        return f'<{type(value).__name__} nested too deeply to display>'
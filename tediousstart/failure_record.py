@@ -0,0 +1,88 @@
+"""Defines the FailureRecord class.
+
+TediousStart._add_test_failure() stores each test case failure as a FailureRecord instead of a
+pre-formatted string.  A FailureRecord holds a reference to any output it describes (e.g., the
+command's stdout) and only renders its message when the failure is presented.  Embedded output
+is capped at max_output characters: longer output is rendered as a head and tail excerpt.
+Failures that are never presented (e.g., a failed attempt that is retried) cost nothing to
+format.
+
+    Typical usage example:
+
+    self._add_test_failure('Stdout was not empty', output=self._raw_stdout)
+    ...
+    print(excerpt(huge_string, max_chars=1024))  # First 512 and last 512 characters
+"""
+
+# Standard Imports
+from typing import Any
+# Third Party Imports
+# Local Imports
+
+
+MAX_OUTPUT_CHARS = 4096  # Default maximum number of output characters embedded in a failure
+OMISSION_MARKER = '\n... ({} characters omitted) ...\n'  # Joins the head and tail of output
+
+
+class FailureRecord():
+    """A test case failure message rendered lazily.
+
+    For more details:
+        import tediousstart.failure_record
+        help(tediousstart.failure_record)
+    """
+
+    __slots__ = ('message', 'output', 'max_output')
+
+    def __init__(self, message: str, output: Any = None,
+                 max_output: int = MAX_OUTPUT_CHARS) -> None:
+        """FailureRecord class ctor.
+
+        Args:
+            message: The failure message.
+            output: Optional; Output to embed, as an excerpt, after the message.
+            max_output: Optional; Maximum number of output characters to embed.
+        """
+        self.message = message        # The failure message
+        self.output = output          # Output to embed after the message, if any
+        self.max_output = max_output  # Maximum number of output characters to embed
+
+    def __str__(self) -> str:
+        """Render the failure message."""
+        return self.render()
+
+    def __repr__(self) -> str:
+        """Represent the record without rendering its output."""
+        return f'FailureRecord({self.message!r})'
+
+    def render(self) -> str:
+        """Render the failure message, embedding an excerpt of the output if there is any."""
+        if self.output is None:
+            return self.message
+        return f'{self.message}: {excerpt(self.output, self.max_output)}'
+
+
+def excerpt(output: Any, max_chars: int = MAX_OUTPUT_CHARS) -> str:
+    """Shorten output to a head and tail excerpt of, at most, max_chars characters.
+
+    Args:
+        output: The output to shorten.  Bytes are converted with repr() after they have been
+            shortened.  Other output (e.g., a BinaryOutput) must support len() and slicing.
+        max_chars: Optional; Maximum number of output characters to keep.
+
+    Returns:
+        The entire output if it fits, otherwise its first and last characters joined by a
+        note about the omitted characters.
+    """
+    # LOCAL VARIABLES
+    head_len = max_chars // 2          # Number of leading characters to keep
+    tail_len = max_chars - head_len    # Number of trailing characters to keep
+    omitted = len(output) - max_chars  # Number of characters left out
+
+    # SHORTEN IT
+    if omitted <= 0:
+        return repr(output) if isinstance(output, (bytes, bytearray)) else str(output)
+    if isinstance(output, (bytes, bytearray)):
+        return (f'{output[:head_len]!r}... ({omitted} bytes omitted) ...'
+                f'{output[len(output) - tail_len:]!r}')
+    return output[:head_len] + OMISSION_MARKER.format(omitted) + output[len(output) - tail_len:]
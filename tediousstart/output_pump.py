@@ -0,0 +1,175 @@
+"""Defines pump_pipes(), a single selector-driven loop over a child's stdout and stderr pipes.
+
+Popen.communicate() hides each chunk of output until the child exits.  pump_pipes() reads both
+of a child's pipes in one loop, as the output arrives, and hands every chunk to a callback for
+its stream.  Both pipes are drained as they fill so the child never blocks on a full pipe.
+Chunks from one stream are always delivered in order.
+
+OutputTee wraps those callbacks to also forward the output, live, to a terminal or log file.
+
+    Typical usage example:
+
+    popen_obj = subprocess.Popen(cmd_list, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    pump_pipes(popen_obj, {'stdout': stdout_spool.write, 'stderr': stderr_spool.write})
+
+    tee = OutputTee(sys.__stderr__)  # Forward whole lines, flushing at most every 0.1 seconds
+    pump_pipes(popen_obj, {'stdout': tee.wrap('stdout', stdout_spool.write),
+                           'stderr': tee.wrap('stderr', stderr_spool.write)},
+               on_idle=tee.flush, idle_timeout=tee.flush_interval)
+    tee.close()  # Forward any unterminated lines
+"""
+
+# Standard Imports
+# selectors is imported on first use to keep the import time of TediousFuncTest low.
+from typing import Any, Callable, Dict
+import io
+import os
+import time
+# Third Party Imports
+from hobo.validation import validate_type
+# Local Imports
+
+
+CHUNK_SIZE = 64 * 1024  # Maximum number of bytes read from a pipe at once
+STREAM_NAMES = ('stdout', 'stderr')  # Names of the pumped streams, in Popen attribute order
+TEE_FLUSH_INTERVAL = 0.1  # Default minimum number of seconds between OutputTee flushes
+
+
+class OutputTee():
+    """Forwards pumped output to a target stream as it arrives.
+
+    Only whole lines (ending in a newline or carriage return) are forwarded so lines from
+    different streams are never spliced together.  A stream's unterminated line is held back
+    until it ends, grows beyond CHUNK_SIZE bytes, or close() is called.  The target is flushed
+    at most once every flush_interval seconds.
+
+    Attributes:
+        flush_interval: Minimum number of seconds between flushes of the target.
+    """
+
+    def __init__(self, target: Any, flush_interval: float = TEE_FLUSH_INTERVAL) -> None:
+        """OutputTee class ctor.
+
+        Args:
+            target: A binary or text stream (e.g., sys.__stderr__ or a log file) to forward to.
+            flush_interval: Optional; Minimum number of seconds between flushes of the target.
+
+        Raises:
+            TypeError: Invalid data type.
+            ValueError: Negative flush_interval.
+        """
+        # INPUT VALIDATION
+        validate_type(flush_interval, 'flush_interval', (int, float))
+        if flush_interval < 0:
+            raise ValueError(f'Invalid flush_interval of {flush_interval}')
+
+        # ATTRIBUTES
+        self.flush_interval = flush_interval       # Minimum number of seconds between flushes
+        self._target = target                      # Stream output is forwarded to
+        self._binary = _get_binary_stream(target)  # Binary stream under target, if any
+        self._partial = {}                         # Stream name: Unterminated line
+        self._last_flush = time.monotonic()        # When the target was last flushed
+        self._dirty = False                        # Output was forwarded since the last flush
+
+        # PREPARE
+        if self._binary is not None and self._binary is not target:
+            target.flush()  # Forwarded bytes must follow any text already written to target
+
+    def close(self) -> None:
+        """Forward every unterminated line and flush the target.  Does not close the target."""
+        for stream_name in list(self._partial):
+            self._write(self._partial.pop(stream_name))
+        self.flush()
+
+    def flush(self) -> None:
+        """Flush the target, if anything was forwarded since the last flush."""
+        if self._dirty:
+            self._target.flush()
+            self._dirty = False
+        self._last_flush = time.monotonic()
+
+    def forward(self, stream_name: str, chunk: bytes) -> None:
+        """Forward the whole lines of stream_name's output, holding back an unterminated line."""
+        # LOCAL VARIABLES
+        pending = self._partial.pop(stream_name, b'') + chunk  # Output not yet forwarded
+        cut = max(pending.rfind(b'\n'), pending.rfind(b'\r')) + 1  # End of the last whole line
+
+        # FORWARD IT
+        if len(pending) - cut > CHUNK_SIZE:
+            cut = len(pending)  # Don't hold back an endless line (e.g., no newlines at all)
+        self._write(pending[:cut])
+        if cut < len(pending):
+            self._partial[stream_name] = pending[cut:]
+
+        # RATE-LIMITED FLUSH
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def wrap(self, stream_name: str, handler: Callable[[bytes], Any]) -> Callable[[bytes], None]:
+        """Wrap a pump_pipes() handler for stream_name so its chunks are also forwarded."""
+        def tee_handler(chunk: bytes) -> None:
+            handler(chunk)
+            self.forward(stream_name, chunk)
+        return tee_handler
+
+    def _write(self, data: bytes) -> None:
+        """Write data to the target, decoding it if the target is a text-only stream."""
+        if not data:
+            return
+        if self._binary is None:
+            self._target.write(data.decode('utf-8', errors='replace'))
+        else:
+            self._binary.write(data)
+        self._dirty = True
+
+
+def pump_pipes(popen_obj: Any, handlers: Dict[str, Callable[[bytes], None]],
+               on_idle: Callable[[], None] = None, idle_timeout: float = None) -> int:
+    """Read popen_obj's stdout and stderr pipes until both are closed, then wait for it.
+
+    Args:
+        popen_obj: A Popen object started with binary stdout and stderr pipes.
+        handlers: Callbacks, keyed by stream name (see STREAM_NAMES), passed each chunk read from
+            that stream's pipe.
+        on_idle: Optional; Callback called whenever neither pipe has output for idle_timeout
+            seconds.
+        idle_timeout: Optional; Number of seconds without output before on_idle is called.  If
+            it's 0, or None, on_idle is never called (a zero timeout would poll the pipes).
+
+    Returns:
+        The child's exit code.
+    """
+    import selectors  # pylint: disable=import-outside-toplevel
+
+    # LOCAL VARIABLES
+    pipe = None  # The pipe a chunk was read from
+    chunk = b''  # A chunk of output
+    events = []  # Pipes ready to be read
+
+    # PUMP IT
+    with selectors.DefaultSelector() as selector:
+        for stream_name in STREAM_NAMES:
+            pipe = getattr(popen_obj, stream_name)
+            if pipe is not None:
+                selector.register(pipe, selectors.EVENT_READ, handlers[stream_name])
+        while selector.get_map():
+            events = selector.select(idle_timeout if on_idle and idle_timeout else None)
+            if not events:
+                on_idle()
+            for key, _ in events:
+                chunk = os.read(key.fd, CHUNK_SIZE)
+                if chunk:
+                    key.data(chunk)
+                else:
+                    selector.unregister(key.fileobj)
+                    key.fileobj.close()
+
+    # DONE
+    return popen_obj.wait()
+
+
+def _get_binary_stream(stream: Any) -> Any:
+    """Find the binary stream under stream, None if stream is a text-only (e.g., StringIO)."""
+    if not isinstance(stream, io.TextIOBase):
+        return stream
+    return getattr(stream, 'buffer', None)
@@ -0,0 +1,147 @@
+"""Defines a process-wide cache of compiled regular expressions and a combined pattern scan.
+
+TediousFuncTest's regex expectations are compiled once per process, no matter how many test
+cases use them, by compile_pattern().  scan_entries() finds which of many literal and regex
+entries occur in one output with a single pass: the entries are combined into one alternation,
+compiled (and cached) by compile_alternation(), so adding entries doesn't multiply the passes
+over a large output.
+
+    Typical usage example:
+
+    entries = (make_literal_entry('Done'), (r'took \\d+ ms', 0))
+    found = scan_entries(lambda pattern, pos: pattern.search(stdout, pos), entries)
+    if 1 not in found:
+        print('No timing was reported')
+"""
+
+# Standard Imports
+from functools import lru_cache
+from typing import Callable, Optional, Set, Tuple
+import re
+# Third Party Imports
+# Local Imports
+
+
+PATTERN_CACHE_SIZE = 1024  # Maximum number of compiled patterns, and alternations, cached
+# Flags that can be scoped to one alternative of a combined pattern
+SCOPED_FLAGS = {re.IGNORECASE: 'i', re.MULTILINE: 'm', re.DOTALL: 's'}
+_BACKREFERENCE = re.compile(r'\\[1-9]|\(\?P=')  # Backreferences break once groups are renumbered
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def compile_pattern(pattern: str, flags: int = 0, as_bytes: bool = False,
+                    encoding: str = 'utf-8') -> re.Pattern:
+    """Compile pattern, or fetch it from the process-wide cache.
+
+    Args:
+        pattern: The regular expression.
+        flags: Optional; re module flags.
+        as_bytes: Optional; Compile a bytes pattern, to search bytes output, instead.
+        encoding: Optional; Encoding of the bytes output.
+
+    Raises:
+        re.error: pattern is invalid.
+    """
+    if as_bytes:
+        return re.compile(pattern.encode(encoding), flags)
+    return re.compile(pattern, flags)
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def compile_alternation(entries: Tuple[Tuple[str, int], ...], as_bytes: bool = False,
+                        encoding: str = 'utf-8') -> Optional[re.Pattern]:
+    """Combine (pattern, flags) entries into one alternation, or fetch it from the cache.
+
+    Each entry becomes a named group, _0 through _N, so a match identifies its entry.
+
+    Returns:
+        The compiled alternation, None if the entries can't be combined.
+    """
+    # LOCAL VARIABLES
+    alternatives = []  # One named group per entry
+
+    # COMBINE THEM
+    for index, (pattern, flags) in enumerate(entries):
+        if not can_combine(pattern, flags):
+            return None
+        alternatives.append(f'(?P<_{index}>{_scope_flags(pattern, flags)})')
+    try:
+        return compile_pattern('|'.join(alternatives), 0, as_bytes, encoding)
+    except re.error:
+        return None  # E.g., global inline flags in the middle of the alternation
+
+
+def can_combine(pattern: str, flags: int) -> bool:
+    """Determine if pattern can be one alternative of a combined pattern."""
+    if flags & ~sum(SCOPED_FLAGS):
+        return False
+    if _BACKREFERENCE.search(pattern):
+        return False
+    return not compile_pattern(pattern, flags).groupindex  # Named groups could collide
+
+
+def make_literal_entry(literal: str) -> Tuple[str, int]:
+    """Create a (pattern, flags) entry that matches literal exactly."""
+    return (re.escape(literal), 0)
+
+
+def scan_entries(search: Callable[[re.Pattern, int], Optional[re.Match]],
+                 entries: Tuple[Tuple[str, int], ...], as_bytes: bool = False,
+                 encoding: str = 'utf-8') -> Set[int]:
+    """Determine which (pattern, flags) entries occur in an output.
+
+    The entries are searched for as one alternation.  After each match, the entry that matched
+    is dropped from the alternation and the search resumes from the same position, so entries
+    that overlap are never hidden by each other.  Entries that can't be combined are searched
+    for separately.
+
+    Args:
+        search: Callable that searches the output for a compiled pattern starting at an index.
+        entries: The (pattern, flags) entries to search for.
+        as_bytes: Optional; The output is bytes.
+        encoding: Optional; Encoding of the bytes output.
+
+    Returns:
+        The indices of the entries found.
+    """
+    # LOCAL VARIABLES
+    found = set()       # Indices of the entries found
+    remaining = []      # Indices of the combinable entries not yet found
+    position = 0        # Index in the output to resume the combined search from
+    alternation = None  # The combined pattern
+    match = None        # A match of the combined pattern
+
+    # SEPARATE SEARCHES
+    for index, (pattern, flags) in enumerate(entries):
+        if can_combine(pattern, flags):
+            remaining.append(index)
+        elif search(compile_pattern(pattern, flags, as_bytes, encoding), 0):
+            found.add(index)
+
+    # COMBINED SEARCH
+    while remaining:
+        alternation = compile_alternation(tuple(entries[index] for index in remaining),
+                                          as_bytes, encoding)
+        if alternation is None:  # Fall back to separate searches
+            found.update(index for index in remaining
+                         if search(compile_pattern(*entries[index], as_bytes, encoding), 0))
+            break
+        match = search(alternation, position)
+        if match is None:
+            break
+        found.add(remaining.pop(int(match.lastgroup[1:])))
+        position = match.start()
+
+    # DONE
+    return found
+
+
+def _scope_flags(pattern: str, flags: int) -> str:
+    """Apply flags, from SCOPED_FLAGS, to pattern alone."""
+    # LOCAL VARIABLES
+    letters = ''.join(letter for flag, letter in SCOPED_FLAGS.items() if flags & flag)
+
+    # DONE
+    if letters:
+        return f'(?{letters}:{pattern})'
+    return f'(?:{pattern})'
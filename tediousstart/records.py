@@ -0,0 +1,152 @@
+"""Defines compact, slotted records of per-test state.
+
+TediousFuncTest and TediousUnitTest group their per-test configuration and results into these
+records instead of storing each value as a separate instance attribute.  Records use __slots__
+so they carry no per-instance __dict__, and they pickle cheaply so they can be shipped to
+parallel workers.  List fields start as the shared empty tuple and extend() only builds a list
+once something is added, so unused fields cost nothing.
+
+    TediousFuncTest:
+        CommandSpec         # The command to execute and its cache key inputs
+        StreamExpectations  # Expectations for one output stream (stdout or stderr)
+        ExitExpectation     # Expected exit code
+        CommandOutput       # Results of command execution
+
+    TediousUnitTest:
+        CallSpec            # Test input passed to call_callable()
+        CallExpectations    # Expected return value or Exception, tolerances, and deadline
+
+    Typical usage example:
+
+    self._stdout_exp = StreamExpectations()
+    self._stdout_exp.check = True
+    self._stdout_exp.extend('expected', ['I succeeded!'])
+"""
+
+# Standard Imports
+from typing import Any
+# Third Party Imports
+# Local Imports
+
+
+class _SlottedRecord():
+    """Base class for records: compared, represented, and pickled by their slots."""
+
+    __slots__ = ()
+
+    def __eq__(self, other: Any) -> bool:
+        """Records of the same type are equal if all their fields are equal."""
+        if type(self) is not type(other):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        """Represent the record by its fields."""
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)
+        return f'{type(self).__name__}({fields})'
+
+    __hash__ = None  # Records are mutable
+
+    def extend(self, name: str, entries: Any) -> None:
+        """Append entries to the list field name, building the list on first use."""
+        # LOCAL VARIABLES
+        values = getattr(self, name)  # The field's current list, or the shared empty tuple
+
+        # EXTEND IT
+        if not isinstance(values, list):
+            values = list(values)
+            setattr(self, name, values)
+        values.extend(entries)
+
+
+# Records are plain data, without public methods
+# pylint: disable=too-few-public-methods
+class CommandSpec(_SlottedRecord):
+    """The command TediousFuncTest executes and the inputs to its persistent cache key."""
+
+    __slots__ = ('cmd_list', 'deterministic', 'input_files', 'env_vars')
+
+    def __init__(self) -> None:
+        """CommandSpec class ctor."""
+        self.cmd_list = ()         # Command list to pass to subprocess as args
+        self.deterministic = True  # False if the command must bypass the caches
+        self.input_files = ()      # Files the command reads (persistent cache key)
+        self.env_vars = ()         # Env vars the command reads (persistent cache key)
+
+
+class StreamExpectations(_SlottedRecord):
+    """The test author's expectations for one output stream (stdout or stderr)."""
+
+    __slots__ = ('check', 'expected', 'excluded', 'ordered', 'expected_regex', 'excluded_regex',
+                 'verify_empty')
+
+    def __init__(self) -> None:
+        """StreamExpectations class ctor."""
+        self.check = False         # Test author's desire to verify the stream
+        self.expected = ()         # List of strings to verify in the stream
+        self.excluded = ()         # List of strings to verify are *not* in the stream
+        self.ordered = ()          # Lists of strings to verify appear in the stream in order
+        self.expected_regex = ()   # List of (pattern, flags) to match in the stream
+        self.excluded_regex = ()   # List of (pattern, flags) to verify do *not* match the stream
+        self.verify_empty = False  # Test author's desire to verify the stream is empty
+
+
+class ExitExpectation(_SlottedRecord):
+    """The test author's expected exit code."""
+
+    __slots__ = ('check', 'exit_code')
+
+    def __init__(self) -> None:
+        """ExitExpectation class ctor."""
+        self.check = False  # Test author's desire to verify exit codes
+        self.exit_code = 0  # Optional expected exit code defined by the user
+
+
+class CommandOutput(_SlottedRecord):
+    """The results of TediousFuncTest's command execution."""
+
+    __slots__ = ('stdout', 'stderr', 'exit_code', 'duration', 'rusage', 'cached', 'chunk_log')
+
+    def __init__(self, stdout: str = '', stderr: str = '', exit_code: int = None) -> None:
+        """CommandOutput class ctor.
+
+        Args:
+            stdout: Optional; Stdout from command execution.
+            stderr: Optional; Stderr from command execution.
+            exit_code: Optional; Exit code from command execution, None if it hasn't exited.
+        """
+        self.stdout = stdout        # Stdout from command execution
+        self.stderr = stderr        # Stderr from command execution
+        self.exit_code = exit_code  # Exit code from command execution
+        self.duration = None        # Seconds spent executing the command, if it was executed
+        self.rusage = None          # ResourceUsage of the command, if it was executed
+        self.cached = False         # True if the results came from a cache
+        self.chunk_log = None       # CaptureMode.MERGED: ChunkLog of both streams
+
+
+class CallSpec(_SlottedRecord):
+    """The test input TediousUnitTest passes to call_callable()."""
+
+    __slots__ = ('args', 'kwargs', 'defined')
+
+    def __init__(self) -> None:
+        """CallSpec class ctor."""
+        self.args = None      # *args from set_test_input()
+        self.kwargs = None    # **kwargs from set_test_input()
+        self.defined = False  # Set True by set_test_input()
+
+
+class CallExpectations(_SlottedRecord):
+    """The test author's expected results for TediousUnitTest's call_callable()."""
+
+    __slots__ = ('exp_return', 'exception_data', 'defined', 'rel_tol', 'abs_tol', 'deadline')
+
+    def __init__(self) -> None:
+        """CallExpectations class ctor."""
+        self.exp_return = None      # Defined by expect_return()
+        self.exception_data = None  # Defined by expect_exception()
+        self.defined = False        # Set True by expect_*()
+        self.rel_tol = 0.0          # Defined by set_return_tolerance()
+        self.abs_tol = 0.0          # Defined by set_return_tolerance()
+        self.deadline = None        # Defined by expect_completion_within()
+# pylint: enable=too-few-public-methods
@@ -33,15 +33,113 @@ not be exactly as expected so take care when comparing the actual output to the
         loud_function()
     stdout_stream.seek(0)
     print(f'loud_function() tried to output {std_out.read()}')
+
+    # To also capture output written directly to file descriptors 1 and 2 (e.g., by C extensions,
+    # os.write(), or subprocesses) use CaptureScope.FD.  communicate() returns the Python-level
+    # output followed by the native output.
+    with RedirectStdStreams(scope=CaptureScope.FD) as temp_obj:
+        subprocess.run(['echo', 'native'], check=True)
+        (std_out, std_err) = temp_obj.communicate()
+
+    # To capture output per thread (or per asyncio task) use CaptureScope.CONTEXT.  Concurrent
+    # captures on different threads stay isolated from each other.
+    with RedirectStdStreams(scope=CaptureScope.CONTEXT) as temp_obj:
+        loud_function()
+        (std_out, std_err) = temp_obj.communicate()
 """
 
 # Standard Imports
-from typing import Tuple
+from contextvars import ContextVar
+from enum import Enum
+from typing import Any, Tuple
 import io
+import os
 import sys
+import threading
 # Third Party Imports
 from hobo.validation import validate_type
 # Local Imports
+from tediousstart.capture_backends import make_capture_file
+
+
+STD_FDS = (1, 2)  # File descriptors redirected by CaptureScope.FD: stdout and stderr
+# CaptureScope.CONTEXT destinations for the current thread or asyncio task
+STDOUT_TARGET = ContextVar('STDOUT_TARGET', default=None)
+STDERR_TARGET = ContextVar('STDERR_TARGET', default=None)
+_INSTALL_LOCK = threading.Lock()  # Serializes the installation of the DispatchingStreams
+_CONTEXT_CAPTURES = 0             # Number of active CaptureScope.CONTEXT captures
+
+
+class CaptureScope(Enum):
+    """Communicates what RedirectStdStreams captures.
+
+    Attributes:
+        SYS  # Default behavior: Replace sys.stdout and sys.stderr
+        FD   # Also redirect file descriptors 1 and 2 to capture native and subprocess output
+        CONTEXT  # Capture the current thread's (or asyncio task's) output, isolated from others
+    """
+    SYS = 0
+    FD = 1
+    CONTEXT = 2
+
+
+class DispatchingStream(io.TextIOBase):
+    """Route writes to the current context's capture stream or, if none, the replaced stream.
+
+    CaptureScope.CONTEXT installs one DispatchingStream each as sys.stdout and sys.stderr while
+    any context-scoped capture is active, and restores the replaced streams when the last one
+    exits.  Each capture then just sets a ContextVar so entering and exiting (even nested)
+    captures costs O(1) and threads never overwrite each other's sys.stdout.  New threads start
+    without a capture stream.
+    """
+
+    def __init__(self, target: ContextVar, fallback: io.TextIOBase) -> None:
+        """DispatchingStream class ctor.
+
+        Args:
+            target: The ContextVar holding the current context's capture stream.
+            fallback: The stream to write to when the current context isn't capturing.
+        """
+        super().__init__()
+        self._target = target      # ContextVar holding the capture stream
+        self._fallback = fallback  # The replaced stream
+
+    @property
+    def fallback(self) -> io.TextIOBase:
+        """The replaced stream."""
+        return self._fallback
+
+    @property
+    def encoding(self) -> str:
+        """The encoding of the current destination."""
+        return getattr(self._destination(), 'encoding', None)
+
+    def fileno(self) -> int:
+        """The file descriptor of the replaced stream."""
+        return self._fallback.fileno()
+
+    def flush(self) -> None:
+        """Flush the current destination."""
+        self._destination().flush()
+
+    def isatty(self) -> bool:
+        """Only the replaced stream might be a terminal."""
+        return self._target.get() is None and self._fallback.isatty()
+
+    def writable(self) -> bool:
+        """DispatchingStreams are always writable."""
+        return True
+
+    def write(self, text: str) -> int:
+        """Write text to the current destination."""
+        return self._destination().write(text)
+
+    def _destination(self) -> Any:
+        """The current context's capture stream, if any, otherwise the replaced stream."""
+        target = self._target.get()  # The current context's capture stream
+        if target is None:
+            return self._fallback
+        return target
 
 
 class RedirectStdStreams():
@@ -61,7 +159,8 @@ class RedirectStdStreams():
         import tediousstart.redirect_std_streams
         help(tediousstart.redirect_std_streams)
     """
-    def __init__(self, stdout: io.TextIOBase = None, stderr: io.TextIOBase = None) -> None:
+    def __init__(self, stdout: io.TextIOBase = None, stderr: io.TextIOBase = None,
+                 scope: CaptureScope = CaptureScope.SYS) -> None:
         """RedirectStdStreams class ctor.
 
         Args:
@@ -69,12 +168,16 @@ class RedirectStdStreams():
                 class instantiates an io.TextIOBase object to use as a stream instead.
             stderr: Optional; Text based io stream to replace stderr with.  If not defined, the
                 class instantiates an io.TextIOBase object to use as a stream instead.
+            scope: Optional; What to capture.  See CaptureScope.
         """
         # ATTRIBUTES
-        self._stdout = None      # Redirect stdout here
-        self._stderr = None      # Redirect stderr here
-        self._old_stdout = None  # Save the original stdout
-        self._old_stderr = None  # Save the original stderr
+        self._stdout = None             # Redirect stdout here
+        self._stderr = None             # Redirect stderr here
+        self._old_streams = ()          # Save the original stdout and stderr
+        self._scope = scope             # What to capture
+        self._fd_redirects = []         # (Saved original, capture file) for file descriptors 1, 2
+        self._native_output = ('', '')  # CaptureScope.FD output, read back on exit
+        self._context_tokens = ()       # CaptureScope.CONTEXT ContextVar tokens, to reset on exit
 
         # PREPARATION
         # stdout
@@ -92,20 +195,37 @@ class RedirectStdStreams():
         """Validates the attributes."""
         validate_type(self._stdout, 'stdout', io.TextIOBase)
         validate_type(self._stderr, 'stderr', io.TextIOBase)
+        validate_type(self._scope, 'scope', CaptureScope)
+        if self._scope == CaptureScope.FD and not hasattr(os, 'pread'):
+            raise ValueError(f'{self._scope} is not supported on this platform')
 
     def __enter__(self) -> object:
         self._validate()
-        self._old_stdout, self._old_stderr = sys.stdout, sys.stderr
-        self._old_stdout.flush()
-        self._old_stderr.flush()
+        if self._scope == CaptureScope.CONTEXT:
+            _install_dispatching_streams()
+            self._context_tokens = (STDOUT_TARGET.set(self._stdout),
+                                    STDERR_TARGET.set(self._stderr))
+            return self
+        self._old_streams = (sys.stdout, sys.stderr)
+        for old_stream in self._old_streams:
+            old_stream.flush()
+        if self._scope == CaptureScope.FD:
+            self._redirect_fds()
         sys.stdout, sys.stderr = self._stdout, self._stderr
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
         self._stdout.flush()
         self._stderr.flush()
-        sys.stdout = self._old_stdout
-        sys.stderr = self._old_stderr
+        if self._context_tokens:
+            STDOUT_TARGET.reset(self._context_tokens[0])
+            STDERR_TARGET.reset(self._context_tokens[1])
+            self._context_tokens = ()
+            _uninstall_dispatching_streams()
+            return
+        sys.stdout, sys.stderr = self._old_streams
+        if self._fd_redirects:
+            self._restore_fds()
 
     def communicate(self) -> Tuple[str, str]:
         """Extricate the text streams: (stdout, stderr).
@@ -116,7 +236,79 @@ class RedirectStdStreams():
         Raises:
             TypeError: If the redirected stream was an invalid data type.
         """
-        return tuple((_read_text_stream(self._stdout), _read_text_stream(self._stderr)))
+        # LOCAL VARIABLES
+        std_out = _read_text_stream(self._stdout)  # Captured stdout
+        std_err = _read_text_stream(self._stderr)  # Captured stderr
+
+        # NATIVE OUTPUT
+        if self._fd_redirects:
+            std_out += _read_capture_file(self._fd_redirects[0][1])
+            std_err += _read_capture_file(self._fd_redirects[1][1])
+        else:
+            std_out += self._native_output[0]
+            std_err += self._native_output[1]
+
+        # DONE
+        return tuple((std_out, std_err))
+
+    def _redirect_fds(self) -> None:
+        """Point file descriptors 1 and 2 at capture files, saving the originals.
+
+        The capture files are memfds, where available, or temporary files.  Unlike pipes, they
+        never block the writer so large writes can't deadlock.
+        """
+        _flush_c_streams()
+        for std_fd in STD_FDS:
+            capture_file = make_capture_file(f'RedirectStdStreams fd {std_fd}')
+            self._fd_redirects.append((os.dup(std_fd), capture_file))
+            os.dup2(capture_file.fileno(), std_fd)
+
+    def _restore_fds(self) -> None:
+        """Restore the original file descriptors 1 and 2, then read back and close the captures."""
+        _flush_c_streams()
+        for std_fd, (saved_fd, _) in zip(STD_FDS, self._fd_redirects):
+            os.dup2(saved_fd, std_fd)
+            os.close(saved_fd)
+        self._native_output = tuple(_read_capture_file(capture_file)
+                                    for _, capture_file in self._fd_redirects)
+        for _, capture_file in self._fd_redirects:
+            capture_file.close()
+        self._fd_redirects = []
+
+
+def _flush_c_streams() -> None:
+    """Flush Python's original standard streams and, if possible, the C library's."""
+    for std_stream in (sys.__stdout__, sys.__stderr__):
+        if std_stream is not None:
+            std_stream.flush()
+    try:
+        import ctypes  # pylint: disable=import-outside-toplevel
+        ctypes.CDLL(None).fflush(None)
+    except (AttributeError, OSError, TypeError):
+        pass  # No C library to flush (e.g., Windows)
+
+
+def _install_dispatching_streams() -> None:
+    """Replace sys.stdout and sys.stderr with DispatchingStreams unless they already are."""
+    # pylint: disable=global-statement
+    global _CONTEXT_CAPTURES
+    # pylint: enable=global-statement
+    with _INSTALL_LOCK:
+        if not isinstance(sys.stdout, DispatchingStream):
+            sys.stdout = DispatchingStream(STDOUT_TARGET, sys.stdout)
+        if not isinstance(sys.stderr, DispatchingStream):
+            sys.stderr = DispatchingStream(STDERR_TARGET, sys.stderr)
+        _CONTEXT_CAPTURES += 1
+
+
+def _read_capture_file(read_this: io.BufferedRandom) -> str:
+    """Read all of a capture file, without moving the shared file offset, as text."""
+    # LOCAL VARIABLES
+    file_fd = read_this.fileno()           # File descriptor of the capture file
+    file_size = os.fstat(file_fd).st_size  # Bytes captured so far
+
+    # READ IT
+    return os.pread(file_fd, file_size, 0).decode('utf-8', errors='replace')
 
 
 def _read_text_stream(read_this: io.TextIOBase) -> str:
@@ -134,3 +326,18 @@ def _read_text_stream(read_this: io.TextIOBase) -> str:
 
     # DONE
     return text_from_stream
+
+
+def _uninstall_dispatching_streams() -> None:
+    """Restore the streams the DispatchingStreams replaced once no context is capturing."""
+    # pylint: disable=global-statement
+    global _CONTEXT_CAPTURES
+    # pylint: enable=global-statement
+    with _INSTALL_LOCK:
+        _CONTEXT_CAPTURES -= 1
+        if _CONTEXT_CAPTURES:
+            return
+        if isinstance(sys.stdout, DispatchingStream):
+            sys.stdout = sys.stdout.fallback
+        if isinstance(sys.stderr, DispatchingStream):
+            sys.stderr = sys.stderr.fallback
@@ -0,0 +1,179 @@
+"""Defines RetryPolicy class and the run-wide retry history.
+
+A RetryPolicy tells TediousFuncTest.run_test() to re-execute a failing test case up to
+max_retries additional times.  Every retry attempt is charged against the policy's total
+retry-time budget, so a policy shared by many test cases (e.g., the global policy) can never
+spend more than budget seconds re-running tests.  Policies may be applied per test case
+(TediousFuncTest.set_retry_policy()), per test class (the TediousFuncTest.retry_policy class
+attribute), or globally (set_global_retry_policy()).  The most specific policy wins.
+
+Each attempt is recorded in RETRY_HISTORY.  A test case that fails at least once but eventually
+passes is reported as flaky instead of failed.
+
+    Typical usage example:
+
+    class TestDaemon(TediousFuncTest):
+        retry_policy = RetryPolicy(max_retries=2, budget=30.0)  # Applies to the whole class
+
+        def test_normal_01(self):
+            self.set_command_list(['daemon_ctl', 'status'])
+            self.expect_stdout(['running'])
+            self.run_test()
+
+    # After the run...
+    for test_id in RETRY_HISTORY.flaky_tests():
+        print(f'{test_id} is flaky')
+"""
+
+# Standard Imports
+from collections import namedtuple
+from typing import Dict, List
+import threading
+# Third Party Imports
+from hobo.validation import validate_type
+# Local Imports
+
+
+# Stores the results of a single test case execution attempt
+# pylint:disable=undefined-variable
+AttemptRecord = namedtuple('AttemptRecord', ['attempt', 'passed', 'duration'])
+# pylint:enable=undefined-variable
+
+
+class RetryPolicy():
+    """Re-execute failing test cases within a total retry-time budget.
+
+    For more details:
+        import tediousstart.retry_policy
+        help(tediousstart.retry_policy)
+    """
+
+    def __init__(self, max_retries: int = 1, budget: float = None) -> None:
+        """RetryPolicy class ctor.
+
+        Args:
+            max_retries: Optional; Maximum number of re-executions per test case.  Must be 0
+                or greater.
+            budget: Optional; Total number of seconds, summed across every test case using this
+                policy, that may be spent on retries.  None means unlimited.
+
+        Raises:
+            TypeError: Invalid data type.
+            ValueError: Negative max_retries or budget.
+        """
+        # INPUT VALIDATION
+        validate_type(max_retries, 'max_retries', int)
+        if max_retries < 0:
+            raise ValueError(f'Invalid max_retries value of {max_retries}')
+        if budget is not None:
+            if isinstance(budget, int):
+                budget = float(budget)
+            validate_type(budget, 'budget', float)
+            if budget < 0:
+                raise ValueError(f'Invalid budget value of {budget}')
+
+        # ATTRIBUTES
+        self.max_retries = max_retries  # Re-executions allowed per test case
+        self.budget = budget            # Total retry seconds allowed, None for unlimited
+        self._spent = 0.0               # Retry seconds charged against the budget so far
+        self._lock = threading.Lock()   # Guards self._spent
+
+    @property
+    def remaining_budget(self) -> float:
+        """Seconds left in the retry budget (None if unlimited)."""
+        if self.budget is None:
+            return None
+        return max(self.budget - self._spent, 0.0)
+
+    def charge(self, duration: float) -> None:
+        """Charge the duration of a retry attempt against the budget."""
+        with self._lock:
+            self._spent += duration
+
+    def may_retry(self, attempts: int) -> bool:
+        """Determine if a test case that has failed attempts times may be re-executed.
+
+        Args:
+            attempts: The number of attempts already made, including the first execution.
+
+        Returns:
+            True if another attempt is permitted, False otherwise.
+        """
+        if attempts > self.max_retries:
+            return False
+        if self.budget is not None and self._spent >= self.budget:
+            return False
+        return True
+
+
+class RetryHistory():
+    """Records every attempt made by test cases executing under a RetryPolicy."""
+
+    def __init__(self) -> None:
+        """RetryHistory class ctor."""
+        self._history = {}             # Test ID: list of AttemptRecords
+        self._lock = threading.Lock()  # Guards self._history
+
+    def clear(self) -> None:
+        """Forget all recorded attempts."""
+        with self._lock:
+            self._history.clear()
+
+    def flaky_tests(self) -> List[str]:
+        """List the IDs of test cases that failed at least once but eventually passed."""
+        return [test_id for test_id, attempts in self.get_history().items()
+                if _is_flaky(attempts)]
+
+    def get_history(self) -> Dict[str, List[AttemptRecord]]:
+        """Return a copy of the recorded attempts keyed by test ID."""
+        with self._lock:
+            return {test_id: list(attempts) for test_id, attempts in self._history.items()}
+
+    def is_flaky(self, test_id: str) -> bool:
+        """Determine if test_id failed at least once but eventually passed."""
+        with self._lock:
+            return _is_flaky(self._history.get(test_id, []))
+
+    def record(self, test_id: str, attempts: List[AttemptRecord]) -> None:
+        """Record the attempts made by test_id."""
+        with self._lock:
+            self._history[test_id] = list(attempts)
+
+    def summary(self, test_id: str) -> tuple:
+        """Count the passed and failed attempts made by test_id.
+
+        Returns:
+            A tuple containing the number of passed attempts and failed attempts.
+        """
+        with self._lock:
+            attempts = self._history.get(test_id, [])
+        passed = sum(1 for attempt in attempts if attempt.passed)
+        return tuple((passed, len(attempts) - passed))
+
+
+RETRY_HISTORY = RetryHistory()  # Run-wide retry history
+_GLOBAL_POLICY = None           # Applies to every TediousFuncTest without a narrower policy
+
+
+def get_global_retry_policy() -> RetryPolicy:
+    """Return the global RetryPolicy, if any."""
+    return _GLOBAL_POLICY
+
+
+def set_global_retry_policy(policy: RetryPolicy = None) -> None:
+    """Set (or clear, with None) the RetryPolicy applied to every TediousFuncTest.
+
+    Raises:
+        TypeError: Invalid data type.
+    """
+    # pylint: disable=global-statement
+    global _GLOBAL_POLICY
+    # pylint: enable=global-statement
+    if policy is not None:
+        validate_type(policy, 'policy', RetryPolicy)
+    _GLOBAL_POLICY = policy
+
+
+def _is_flaky(attempts: List[AttemptRecord]) -> bool:
+    """A flaky test had more than one attempt and its last attempt passed."""
+    return len(attempts) > 1 and attempts[-1].passed
@@ -12,33 +12,58 @@ interface.
     4. Define unittest Test Cases that:
         4.1. Set Test Input
         self.set_command_list()
+        -or-
+        class_command_list = ['cmd', 'arg']  # Class attribute; executed once per test class
         4.2. Set Expected Exit Code
         self.expect_exit_code(exit_code=exitcode)  # OPTIONAL
         4.3. Set Expected Output
         4.3.1. Standard Output
         self.expect_stdout(output=['I succeeded!'])  # OPTIONAL
+        self.expect_stdout_in_order(output=['Starting', 'Finished'])  # OPTIONAL
+        self.expect_stdout_regex(patterns=[r'took \\d+ ms'])  # OPTIONAL
         -or-
         self.verify_stdout_empty()  # OPTIONAL
         4.3.2. Standard Error
         self.expect_stderr(output=['...but I also had an error'])  # OPTIONAL
         -or-
         self.verify_stderr_empty()  # OPTIONAL
-        4.4. Run Test
-        self.run_test()
+        4.4. Cache Command Results
+        self.declare_input_files(['input.csv'])  # OPTIONAL; Part of the persistent cache key
+        self.declare_env_vars(['LANG'])          # OPTIONAL; Part of the persistent cache key
+        -or-
+        self.mark_nondeterministic()             # OPTIONAL; Bypasses the command caches
+        4.5. Retry Flaky Test Cases
+        self.set_retry_policy(RetryPolicy(max_retries=2))  # OPTIONAL
+        4.6. Run Test
+        result = self.run_test()  # Returns a CommandResult for post-hoc analysis
 """
 
 # Standard Imports
+# tediousstart.capture_executors, and its capture backends, are imported on first use.
 from typing import Any, List
+import codecs
+import re
 import sys
+import time
 # Third Party Imports
-from hobo.subprocess_wrapper import start_subprocess_cmd
 # Local Imports
+from tediousstart.binary_output import BinaryOutput
+from tediousstart.capture_mode import CaptureMode, SPOOL_MAX_SIZE
+from tediousstart.command_cache import (CachedExecution, RUN_CACHE, make_command_key,
+                                        make_persistent_key)
+from tediousstart.command_result import CommandResult
+from tediousstart.output_pump import STREAM_NAMES
+from tediousstart.pattern_cache import compile_pattern, make_literal_entry, scan_entries
+from tediousstart.records import CommandOutput, CommandSpec, ExitExpectation, StreamExpectations
+from tediousstart.retry_policy import (AttemptRecord, RETRY_HISTORY, RetryPolicy,
+                                       get_global_retry_policy)
 from tediousstart.tediousstart import TediousStart
 from tediousstart.verbosity import Verbosity
 
 
+# pylint: disable=too-many-lines
+# pylint: disable=too-many-public-methods
 # pylint: disable=too-many-instance-attributes
-# TO DO: DON'T DO NOW... Refactor a couple of these attributes into tuples
 class TediousFuncTest(TediousStart):
     """TEST functional test class.
 
@@ -55,6 +80,18 @@ class TediousFuncTest(TediousStart):
     _verb_failure_hdr = 'FAILURE LIST'
     _verb_empty_msg = '<EMPTY>'
 
+    retry_policy = None              # Class-wide RetryPolicy; overrides the global policy
+    use_command_cache = False        # Reuse identical command executions from the RUN_CACHE
+    persistent_cache = None          # PersistentCommandCache to reuse executions across runs
+    class_command_list = None        # Command list executed once and shared by the test class
+    _class_execution = None          # CachedExecution of class_command_list, set per test class
+    capture_mode = CaptureMode.TEXT  # How command output is captured
+    spool_max_size = SPOOL_MAX_SIZE  # CaptureMode.SPOOL: Bytes kept in memory before spilling
+    spool_dir = None                 # SPOOL and MEMFD: Directory to spill to (e.g., a tmpfs)
+    decode_errors = 'replace'        # Binary capture modes: Error handling scheme for decoding
+    tee_output = None                # Stream, or filename, to forward live command output to
+    tee_flush_interval = 0.1         # Minimum seconds between tee_output flushes (0: every write)
+
     # CORE CLASS METHODS
     # Methods listed in call order
     def __init__(self, *args, **kwargs) -> None:
@@ -75,23 +112,40 @@ class TediousFuncTest(TediousStart):
         """
         super().__init__(*args, **kwargs)
 
-        self._cmd_list = []                  # Command list to pass to subprocess as args
-        self._verbosity = Verbosity.DEFAULT  # Current test case verbosity level
-        # stdout
-        self._raw_stdout = ''                # Stdout from command execution
-        self._check_stdout = False           # Test author's desire to verify stdout
-        self._exp_stdout = []                # List of strings to verify in stdout
-        self._excl_stdout = []               # List of strings to verify are *not* in stdout
-        self._verify_stdout_empty = False    # Test author's desire to verify stdout is empty
-        # stderr
-        self._raw_stderr = ''                # Stderr from command execution
-        self._check_stderr = False           # Test author's desire to verify stderr
-        self._exp_stderr = []                # List of strings to verify in stderr
-        self._excl_stderr = []               # List of strings to verify are *not* in stderr
-        self._verify_stderr_empty = False    # Test author's desire to verify stderr is empty
-        # Exit Code
-        self._check_exit_code = False        # Test author's desire to verify exit codes
-        self._exp_exit_code = 0              # Optional expected exit code defined by the user
+        self._command = CommandSpec()            # Command to execute and its cache key inputs
+        self._stdout_exp = StreamExpectations()  # Test author's stdout expectations
+        self._stderr_exp = StreamExpectations()  # Test author's stderr expectations
+        self._exit_exp = ExitExpectation()       # Test author's exit code expectation
+        self._order_exp = ()                     # Test author's lists of ordered output
+        self._output = CommandOutput()           # Results of command execution
+        self._verbosity = Verbosity.DEFAULT      # Current test case verbosity level
+        self._retry_policy = None                # Test case RetryPolicy; overrides all others
+
+    # STATE ACCESSORS
+    # Child classes may read and write captured output through these properties
+    @property
+    def _raw_stdout(self) -> str:
+        """Stdout from command execution."""
+        return self._output.stdout
+
+    @_raw_stdout.setter
+    def _raw_stdout(self, value: str) -> None:
+        self._output.stdout = value
+
+    @property
+    def _raw_stderr(self) -> str:
+        """Stderr from command execution."""
+        return self._output.stderr
+
+    @_raw_stderr.setter
+    def _raw_stderr(self, value: str) -> None:
+        self._output.stderr = value
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Discard the test class's shared class_command_list results, if any."""
+        super().tearDownClass()
+        cls._class_execution = None
 
     def validate_results(self) -> Any:
         """Child class defines how to validate results of the command.
@@ -143,15 +197,25 @@ class TediousFuncTest(TediousStart):
             None.  Calls self.fail() instead.
         """
         # INPUT VALIDATION
-        # cmd_list
-        self._validate_list(validate_this=cmd_list, param_name='cmd_list', can_be_empty=False)
-        # cmd_list contents
-        for cmd_entry in cmd_list:
-            self._validate_string(validate_this=cmd_entry, param_name='cmd_list entry',
-                                  can_be_empty=False)
+        self._validate_string_list(validate_this=cmd_list, param_name='cmd_list',
+                                   can_be_empty=False, entries_can_be_empty=False)
 
         # STORE IT
-        self._cmd_list = cmd_list
+        self._command.cmd_list = cmd_list
+
+    @classmethod
+    def execute_class_command(cls) -> None:
+        """Execute class_command_list now instead of during the first test case.
+
+        Call this from setUpClass() to front-load the class-wide execution.  Otherwise, the
+        first test case to call run_test() without calling set_command_list() executes it.
+        Every test case in the class then validates the same, shared, read-only results.
+
+        Raises:
+            AssertionError: class_command_list is invalid.
+        """
+        if cls.__dict__.get('_class_execution') is None:
+            cls._execute_class_command()
 
     # 2. Set Expected Exit Code (OPTIONAL)
     def expect_exit_code(self, exit_code: int = 0) -> None:
@@ -159,8 +223,8 @@ class TediousFuncTest(TediousStart):
         # INPUT VALIDATION
         self._validate_type(validate_this=exit_code, param_name='exit_code', param_type=int)
         # SET IT
-        self._check_exit_code = True
-        self._exp_exit_code = exit_code
+        self._exit_exp.check = True
+        self._exit_exp.exit_code = exit_code
 
     # 3. Set Expected Output (OPTIONAL)
     # 3.1 Stdout
@@ -169,20 +233,44 @@ class TediousFuncTest(TediousStart):
         # INPUT VALIDATION
         self._validate_expected_output(output=output)
         # SET IT
-        self._check_stdout = True
-        self._exp_stdout += output
+        self._stdout_exp.check = True
+        self._stdout_exp.extend('expected', output)
+
+    def expect_stdout_in_order(self, output: list) -> None:
+        """Search stdout for output entries, each after the end of the one before it."""
+        # INPUT VALIDATION
+        self._validate_expected_output(output=output)
+        # SET IT
+        self._stdout_exp.check = True
+        self._stdout_exp.extend('ordered', [output])
+
+    def expect_stdout_regex(self, patterns: list, flags: int = 0) -> None:
+        """Search stdout for matches of regular expression patterns (compiled with flags)."""
+        # INPUT VALIDATION
+        self._validate_patterns(patterns=patterns, flags=flags)
+        # SET IT
+        self._stdout_exp.check = True
+        self._stdout_exp.extend('expected_regex', [(pattern, flags) for pattern in patterns])
 
     def verify_stdout_empty(self) -> None:
         """Verify stdout is empty."""
-        self._check_stdout = True
-        self._verify_stdout_empty = True
+        self._stdout_exp.check = True
+        self._stdout_exp.verify_empty = True
 
     def verify_stdout_missing(self, output: list) -> None:
         """Verify stdout is missing the output list entries."""
         # INPUT VALIDATION
         self._validate_expected_output(output=output)
-        self._check_stdout = True
-        self._excl_stdout += output
+        self._stdout_exp.check = True
+        self._stdout_exp.extend('excluded', output)
+
+    def verify_stdout_regex_missing(self, patterns: list, flags: int = 0) -> None:
+        """Verify regular expression patterns (compiled with flags) do not match stdout."""
+        # INPUT VALIDATION
+        self._validate_patterns(patterns=patterns, flags=flags)
+        # SET IT
+        self._stdout_exp.check = True
+        self._stdout_exp.extend('excluded_regex', [(pattern, flags) for pattern in patterns])
 
     # 3.2 Stderr
     def expect_stderr(self, output: list) -> None:
@@ -190,36 +278,135 @@ class TediousFuncTest(TediousStart):
         # INPUT VALIDATION
         self._validate_expected_output(output=output)
         # SET IT
-        self._check_stderr = True
-        self._exp_stderr += output
+        self._stderr_exp.check = True
+        self._stderr_exp.extend('expected', output)
+
+    def expect_stderr_in_order(self, output: list) -> None:
+        """Search stderr for output entries, each after the end of the one before it."""
+        # INPUT VALIDATION
+        self._validate_expected_output(output=output)
+        # SET IT
+        self._stderr_exp.check = True
+        self._stderr_exp.extend('ordered', [output])
+
+    def expect_stderr_regex(self, patterns: list, flags: int = 0) -> None:
+        """Search stderr for matches of regular expression patterns (compiled with flags)."""
+        # INPUT VALIDATION
+        self._validate_patterns(patterns=patterns, flags=flags)
+        # SET IT
+        self._stderr_exp.check = True
+        self._stderr_exp.extend('expected_regex', [(pattern, flags) for pattern in patterns])
 
     def verify_stderr_empty(self) -> None:
         """Verify stdout is empty."""
-        self._check_stderr = True
-        self._verify_stderr_empty = True
+        self._stderr_exp.check = True
+        self._stderr_exp.verify_empty = True
 
     def verify_stderr_missing(self, output: list) -> None:
         """Verify stderr is missing the output list entries."""
         # INPUT VALIDATION
         self._validate_expected_output(output=output)
-        self._check_stderr = True
-        self._excl_stderr += output
+        self._stderr_exp.check = True
+        self._stderr_exp.extend('excluded', output)
+
+    def verify_stderr_regex_missing(self, patterns: list, flags: int = 0) -> None:
+        """Verify regular expression patterns (compiled with flags) do not match stderr."""
+        # INPUT VALIDATION
+        self._validate_patterns(patterns=patterns, flags=flags)
+        # SET IT
+        self._stderr_exp.check = True
+        self._stderr_exp.extend('excluded_regex', [(pattern, flags) for pattern in patterns])
+
+    # 3.3 Stdout and Stderr (requires CaptureMode.MERGED)
+    def expect_output_order(self, entries: list) -> None:
+        """Verify entries, from either stream, were output in the given order.
+
+        Each entry is matched to its first occurrence in its stream.  Entries from different
+        streams are ordered by when their output was read, so output written to both streams
+        within the same instant may be read in either order.
+
+        Args:
+            entries: A list of (stream name, text) tuples (e.g., [('stderr', 'WARNING'),
+                ('stdout', 'Summary')]).
+        """
+        # INPUT VALIDATION
+        self._validate_list(entries, 'entries', can_be_empty=False)
+        for entry in entries:
+            if not isinstance(entry, tuple) or len(entry) != 2 or entry[0] not in STREAM_NAMES:
+                self.fail(self._test_error.format('Each expect_output_order() entry must be a '
+                                                  f'(stream name, text) tuple, not {entry!r}'))
+            self._validate_string(entry[1], 'expect_output_order() text')
+        # SET IT
+        self._order_exp += (entries,)
+
+    # 4. Cache Command Results (OPTIONAL)
+    def declare_env_vars(self, env_vars: list) -> None:
+        """Declare environment variables, by name, that influence the command's results.
+
+        Their values become part of the persistent_cache key so a change invalidates the cached
+        results.
+        """
+        # INPUT VALIDATION
+        self._validate_string_list(validate_this=env_vars, param_name='env_vars',
+                                   can_be_empty=False, entries_can_be_empty=False)
+        # SET IT
+        self._command.extend('env_vars', env_vars)
+
+    def declare_input_files(self, input_files: list) -> None:
+        """Declare files the command reads.
+
+        Their contents become part of the persistent_cache key so a change invalidates the cached
+        results.
+        """
+        # INPUT VALIDATION
+        self._validate_list(validate_this=input_files, param_name='input_files',
+                            can_be_empty=False)
+        for input_file in input_files:
+            self._validate_file(filename=input_file, param_name='input_files entry',
+                                must_exist=True)
+        # SET IT
+        self._command.extend('input_files', input_files)
+
+    def mark_nondeterministic(self) -> None:
+        """Always execute this test case's command, bypassing the command caches."""
+        self._command.deterministic = False
+
+    # 5. Retry Flaky Test Cases (OPTIONAL)
+    def set_retry_policy(self, policy: RetryPolicy) -> None:
+        """Re-execute this test case, if it fails, according to policy.
 
-    # 4. Run Test
-    def run_test(self, verbosity: Verbosity = Verbosity.DEFAULT) -> None:
+        Overrides the class-wide retry_policy attribute and the global retry policy.
+
+        Args:
+            policy: The RetryPolicy to apply to this test case.
+
+        Returns:
+            None
+
+        Raises:
+            None.  Calls self.fail() instead.
+        """
+        # INPUT VALIDATION
+        self._validate_type(validate_this=policy, param_name='policy', param_type=RetryPolicy)
+        # SET IT
+        self._retry_policy = policy
+
+    # 6. Run Test
+    def run_test(self, verbosity: Verbosity = Verbosity.DEFAULT) -> CommandResult:
         """Execute the test case.
 
         Execute the test author's command and validate the results accordingly.
         This method:
         1. Validates the test author's usage
-        2. Executes the command list and validates the results
+        2. Executes the command list and validates the results, retrying failed attempts
+            if a RetryPolicy applies
         3. Presents all test failures
 
         Args:
             verbosity: Optional; Desired verbosity level for this test case.
 
         Returns:
-            None
+            An immutable CommandResult describing the validated command execution.
 
         Raises:
             None.  Calls self.fail() or self._add_test_failure() instead.
@@ -233,29 +420,152 @@ class TediousFuncTest(TediousStart):
         self._validate_usage()
 
         # 2. RUN TEST
-        self._run_test()
+        self._run_test_attempts()
 
         # 3. REPORT
         self._present_test_results()
 
+        # DONE
+        return self._make_command_result()
+
     # CLASS HELPER METHODS
     # Methods listed in alphabetical order
     def _execute_cmd(self) -> int:
         """Execute the command list, store output, and return the exit code.
 
-        Override this method if you want to control execution.
+        Output is captured as the capture_mode, and related class attributes, describe (see:
+        tediousstart.capture_executors).  Override this method if you want to control execution.
 
         Returns:
             Exit code from execution.
         """
+        from tediousstart import capture_executors  # pylint: disable=import-outside-toplevel
         # LOCAL VARIABLES
-        popen_obj = start_subprocess_cmd(self._cmd_list)  # Popen object
+        settings = capture_executors.make_capture_settings(self)  # How to capture the output
+        execution = capture_executors.execute_command(self._command.cmd_list, settings)  # Results
+
+        # STORE IT
+        self._raw_stdout, self._raw_stderr = execution.stdout, execution.stderr
+        self._output.chunk_log = execution.chunk_log
+        self._output.duration, self._output.rusage = execution.duration, execution.rusage
+
+        # DONE
+        return execution.exit_code
+
+    def _fetch_results(self) -> int:
+        """Obtain the command's output and exit code, from the command caches if possible.
+
+        Calls self._execute_cmd() unless the test class opted into a command cache and an
+        identical, deterministic command has already been executed: earlier this run (the
+        RUN_CACHE) or during a previous run (the persistent_cache).
+
+        Returns:
+            Exit code from execution.
+        """
+        # LOCAL VARIABLES
+        run_key = None      # RUN_CACHE key for this command
+        persist_key = None  # persistent_cache key for this command
+        cached = None       # CachedExecution from a cache
+        exit_code = 0       # Exit code from execution
+
+        # BYPASS
+        if self._uses_class_command():
+            return self._fetch_class_results()
+        if not self._uses_command_cache():
+            return self._execute_cmd()
+
+        # CHECK THE CACHES
+        if self.use_command_cache:
+            run_key = make_command_key(self._command.cmd_list)
+            cached = RUN_CACHE.get(run_key)
+        if cached is None and self.persistent_cache is not None:
+            persist_key = self._make_persistent_key()
+            cached = self.persistent_cache.get(persist_key)
+            if cached and run_key:
+                RUN_CACHE.put(run_key, cached)
+        if cached:
+            self._raw_stdout, self._raw_stderr = cached.stdout, cached.stderr
+            self._output.duration, self._output.rusage = None, None
+            self._output.cached = True
+            return cached.exit_code
+
+        # RUN IT
+        exit_code = self._execute_cmd()
+        cached = CachedExecution(self._raw_stdout, self._raw_stderr, exit_code)
+        if run_key:
+            RUN_CACHE.put(run_key, cached)
+        if persist_key:
+            self.persistent_cache.put(persist_key, cached)
+
+        # DONE
+        return exit_code
+
+    @classmethod
+    def _execute_class_command(cls) -> Any:
+        """Execute class_command_list, without a test case, and share its results.
+
+        Raises:
+            AssertionError: class_command_list is invalid.
+        """
+        # INPUT VALIDATION
+        if not isinstance(cls.class_command_list, (list, tuple)) or not cls.class_command_list \
+                or not all(entry and isinstance(entry, str) for entry in cls.class_command_list):
+            raise AssertionError(cls._test_error.format(
+                f'Invalid class_command_list of {cls.class_command_list!r}'))
 
         # RUN IT
-        self._raw_stdout, self._raw_stderr = popen_obj.communicate()
+        from tediousstart import capture_executors  # pylint: disable=import-outside-toplevel
+        execution = capture_executors.execute_command(list(cls.class_command_list),
+                                                      capture_executors.make_capture_settings(cls))
+        cls._class_execution = CachedExecution(*execution[:3])  # stdout, stderr, exit_code
+        return execution
+
+    def _fetch_class_results(self) -> int:
+        """Obtain the shared results of class_command_list, executing it if necessary."""
+        # LOCAL VARIABLES
+        execution = None  # This test case's execution of class_command_list, if any
+
+        # RUN IT ONCE
+        if type(self).__dict__.get('_class_execution') is None:
+            execution = self._execute_class_command()
+            self._output.chunk_log = execution.chunk_log
+            self._output.duration, self._output.rusage = execution.duration, execution.rusage
+        else:
+            self._output.cached = True  # Another test case executed it
 
         # DONE
-        return popen_obj.returncode  # Exit code
+        self._raw_stdout, self._raw_stderr = self._class_execution[:2]
+        return self._class_execution.exit_code
+
+    def _invalidate_cached_results(self) -> None:
+        """Remove this test case's command from the command caches."""
+        if self.use_command_cache:
+            RUN_CACHE.discard(make_command_key(self._command.cmd_list))
+        if self.persistent_cache is not None:
+            self.persistent_cache.discard(self._make_persistent_key())
+
+    def _make_command_result(self) -> CommandResult:
+        """Create a CommandResult from this test case's command execution."""
+        return CommandResult(self._command.cmd_list or self.class_command_list,
+                             self._output.exit_code, self._output.stdout, self._output.stderr,
+                             duration=self._output.duration, rusage=self._output.rusage,
+                             cached=self._output.cached, chunk_log=self._output.chunk_log)
+
+    def _make_persistent_key(self) -> str:
+        """Create this test case's persistent_cache key."""
+        # LOCAL VARIABLES
+        persist_key = ''  # Content-addressed key
+
+        # MAKE IT
+        try:
+            persist_key = make_persistent_key(self._command.cmd_list,
+                                              input_files=self._command.input_files,
+                                              env_vars=self._command.env_vars)
+        except OSError as err:
+            self.fail_test_case(f'Unable to hash the command inputs: {err}')
+
+        # DONE
+        return persist_key
 
     def _present_verbose_failures(self) -> None:
         """Present test failures in a verbose manner."""
@@ -278,6 +588,40 @@ class TediousFuncTest(TediousStart):
             formatted_failures.append(f'{str(index+1)}. {failure_item}')
         self._print_verbose_output(self._verb_failure_hdr, formatted_failures)
 
+    def _release_test_state(self) -> None:
+        """Discard captured output and expectations, keeping a compact TestSummary.
+
+        Extends the parent method.  Shared class_command_list results are left untouched.
+        """
+        # LOCAL VARIABLES
+        output_size = len(self._raw_stdout) + len(self._raw_stderr)  # Captured output size
+
+        # RELEASE IT
+        super()._release_test_state()
+        self.test_summary = self.test_summary._replace(output_size=output_size)
+        self._command = CommandSpec()
+        self._stdout_exp = StreamExpectations()
+        self._stderr_exp = StreamExpectations()
+        self._order_exp = ()
+        self._output = CommandOutput()
+
+    def _reset_attempt(self) -> None:
+        """Discard the results of a failed attempt prior to a retry."""
+        self._test_failure_list = []
+        self._output = CommandOutput()
+        if self._uses_class_command():
+            type(self)._class_execution = None  # Retries must re-execute
+        elif self._uses_command_cache():
+            self._invalidate_cached_results()  # Retries must re-execute
+
+    def _resolve_retry_policy(self) -> RetryPolicy:
+        """Return the most specific RetryPolicy: test case, class, then global."""
+        if self._retry_policy is not None:
+            return self._retry_policy
+        if self.retry_policy is not None:
+            return self.retry_policy
+        return get_global_retry_policy()
+
     def _run_test(self) -> None:
         """Execute the test case and test results.
 
@@ -289,7 +633,10 @@ class TediousFuncTest(TediousStart):
             None.  Calls self.fail() or self._add_test_failure() instead.
         """
         # LOCAL VARIABLES
-        exit_code = self._execute_cmd()  # Exit code
+        exit_code = self._fetch_results()  # Exit code
+
+        # STORE IT
+        self._output.exit_code = exit_code
 
         # TEST RESULTS
         # Output and exit code
@@ -297,6 +644,52 @@ class TediousFuncTest(TediousStart):
         # Other results
         self.validate_results()
 
+    def _run_test_attempts(self) -> None:
+        """Execute the test case, retrying failed attempts as the RetryPolicy allows.
+
+        Every attempt is recorded in RETRY_HISTORY.  A test case that passes after a failed
+        attempt is reported as flaky by RETRY_HISTORY.flaky_tests().  An attempt fails if it
+        adds a test failure or raises self.failureException (e.g., validate_results() called
+        self.fail()).
+
+        Raises:
+            self.failureException: The last attempt raised it.
+        """
+        # LOCAL VARIABLES
+        policy = self._resolve_retry_policy()  # RetryPolicy for this test case
+        attempts = []                          # AttemptRecords for this test case
+        start_time = 0.0                       # Start time of the current attempt
+        duration = 0.0                         # Duration of the current attempt
+        failure = None                         # failureException raised by the current attempt
+
+        # NO RETRIES
+        if policy is None:
+            self._run_test()
+            return
+
+        # RUN IT
+        while True:
+            start_time = time.monotonic()
+            failure = None
+            try:
+                self._run_test()
+            except self.failureException as err:
+                failure = err
+            duration = time.monotonic() - start_time
+            if attempts:
+                policy.charge(duration)  # Only retries count against the budget
+            attempts.append(AttemptRecord(len(attempts) + 1,
+                                          failure is None and not self._test_failure_list,
+                                          duration))
+            if attempts[-1].passed or not policy.may_retry(len(attempts)):
+                break
+            self._reset_attempt()
+
+        # RECORD IT
+        RETRY_HISTORY.record(self.id(), attempts)
+        if failure is not None:
+            raise failure
+
     def _present_test_results(self) -> None:
         """Handles verbosity reporting for this test case."""
         # INTERNAL VALIDATION
@@ -370,14 +763,9 @@ class TediousFuncTest(TediousStart):
             None.  Calls self.fail() instead.
         """
         # INPUT VALIDATION
-        # output
-        self._validate_list(validate_this=output, param_name='output', can_be_empty=False)
-        # output entries
-        for output_entry in output:
-            self._validate_string(validate_this=output_entry, param_name='stdout entry',
-                                  can_be_empty=True)
-
-    # pylint: disable=too-many-branches
+        self._validate_string_list(validate_this=output, param_name='output',
+                                   can_be_empty=False, entries_can_be_empty=True)
+
     def _validate_default_results(self, exit_code: int = 0) -> None:
         """Checks stdout, stderr and the exit code as applicable.
 
@@ -395,33 +783,162 @@ class TediousFuncTest(TediousStart):
         """
         # TEST THE RESULTS
         # stdout
-        if self._check_stdout:
-            if self._verify_stdout_empty and self._raw_stdout:
-                self._add_test_failure(f'Stdout was not empty: {self._raw_stdout}')
-            else:
-                for entry in self._exp_stdout:
-                    if entry not in self._raw_stdout:
-                        self._add_test_failure(f'Unable to locate {entry} in stdout')
-                for entry in self._excl_stdout:
-                    if entry in self._raw_stdout:
-                        self._add_test_failure(f'Found excluded entry {entry} in stdout')
+        self._validate_stream('stdout', self._stdout_exp, self._raw_stdout)
         # stderr
-        if self._check_stderr:
-            if self._verify_stderr_empty and self._raw_stderr:
-                self._add_test_failure(f'Stderr was not empty: {self._raw_stderr}')
-            else:
-                for entry in self._exp_stderr:
-                    if entry not in self._raw_stderr:
-                        self._add_test_failure(f'Unable to locate {entry} in stderr')
-                for entry in self._excl_stderr:
-                    if entry in self._raw_stderr:
-                        self._add_test_failure(f'Found excluded entry {entry} in stderr')
+        self._validate_stream('stderr', self._stderr_exp, self._raw_stderr)
+        # Output order
+        for entries in self._order_exp:
+            self._validate_output_order(entries)
         # Exit code
-        if self._check_exit_code:
-            if self._exp_exit_code != exit_code:
-                self._add_test_failure(f'Expected exit code ({self._exp_exit_code}) '
+        if self._exit_exp.check:
+            if self._exit_exp.exit_code != exit_code:
+                self._add_test_failure(f'Expected exit code ({self._exit_exp.exit_code}) '
                                        f'does not match actual exit code ({exit_code})')
-    # pylint: enable=too-many-branches
+
+    def _validate_output_order(self, entries: list) -> None:
+        """Checks that entries, (stream name, text) tuples, were output in order.
+
+        Raises:
+            None.  Calls self._add_test_failure() instead.
+        """
+        # LOCAL VARIABLES
+        chunk_log = self._output.chunk_log  # Timestamped log of both streams
+        previous = None                     # The previous entry found
+        previous_offset = -1                # Offset of the previous entry in the merged output
+        offset = -1                         # Offset of an entry in the merged output
+
+        # CHECK IT
+        for stream_name, text in entries:
+            offset = chunk_log.find(stream_name, text)
+            if offset < 0:
+                self._add_test_failure(f'Unable to locate {text} in {stream_name}')
+                return
+            if offset <= previous_offset:
+                self._add_test_failure(f'Expected {text} in {stream_name} after {previous[1]} '
+                                       f'in {previous[0]}')
+                return
+            previous, previous_offset = (stream_name, text), offset
+
+    def _validate_patterns(self, patterns: list, flags: int) -> None:
+        """Validate regular expression patterns, compiling each into the process-wide cache."""
+        # INPUT VALIDATION
+        self._validate_expected_output(output=patterns)
+        self._validate_type(flags, 'flags', param_type=int)
+        # COMPILE THEM
+        for pattern in patterns:
+            try:
+                compile_pattern(pattern, flags)
+            except re.error as err:
+                self.fail(self._test_error.format(f'Invalid regular expression {pattern}: {err}'))
+
+    def _validate_stream(self, stream_name: str, stream_exp: StreamExpectations,
+                         raw_output: str) -> None:
+        """Checks one output stream against the test author's expectations for it.
+
+        Args:
+            stream_name: The name of the stream (e.g., stdout) used in failure messages.
+            stream_exp: The test author's expectations for the stream.
+            raw_output: The stream's output from command execution.
+
+        Raises:
+            None.  Calls self._add_test_failure() instead.
+        """
+        if not stream_exp.check:
+            return
+        if stream_exp.verify_empty and raw_output:
+            self._add_test_failure(f'{stream_name.capitalize()} was not empty',
+                                   output=raw_output)
+            return
+        if stream_exp.expected_regex or stream_exp.excluded_regex:
+            self._validate_stream_patterns(stream_name, stream_exp, raw_output)
+        else:
+            for entry, search_term in _make_search_terms(stream_exp.expected, raw_output):
+                if search_term not in raw_output:
+                    self._add_test_failure(f'Unable to locate {entry} in {stream_name}')
+            for entry, search_term in _make_search_terms(stream_exp.excluded, raw_output):
+                if search_term in raw_output:
+                    self._add_test_failure(f'Found excluded entry {entry} in {stream_name}')
+        for ordered in stream_exp.ordered:
+            self._validate_stream_order(stream_name, ordered, raw_output)
+
+    def _validate_stream_patterns(self, stream_name: str, stream_exp: StreamExpectations,
+                                  raw_output: Any) -> None:
+        """Checks one stream's literal and regex expectations with a single combined scan.
+
+        Args:
+            stream_name: The name of the stream (e.g., stdout) used in failure messages.
+            stream_exp: The test author's expectations for the stream.
+            raw_output: The stream's output from command execution: str or BinaryOutput.
+
+        Raises:
+            None.  Calls self._add_test_failure() instead.
+        """
+        # LOCAL VARIABLES
+        # (pattern, flags) entry, failure message, and whether it is expected, for each check
+        checks = ([(make_literal_entry(entry), f'Unable to locate {entry} in {stream_name}', True)
+                   for entry in stream_exp.expected]
+                  + [(entry, f'Unable to match {entry[0]} in {stream_name}', True)
+                     for entry in stream_exp.expected_regex]
+                  + [(make_literal_entry(entry), f'Found excluded entry {entry} in {stream_name}',
+                      False) for entry in stream_exp.excluded]
+                  + [(entry, f'Found excluded pattern {entry[0]} in {stream_name}', False)
+                     for entry in stream_exp.excluded_regex])
+        entries = tuple(check[0] for check in checks)  # Every (pattern, flags) entry
+        found = set()                                  # Indices of the entries found
+
+        # SCAN IT
+        if isinstance(raw_output, BinaryOutput):
+            found = scan_entries(raw_output.search, entries, True, raw_output.encoding)
+        else:
+            found = scan_entries(lambda pattern, pos: pattern.search(raw_output, pos), entries)
+
+        # REPORT IT
+        for index, (_, failure_msg, expected) in enumerate(checks):
+            if (index in found) != expected:
+                self._add_test_failure(failure_msg)
+
+    def _validate_stream_order(self, stream_name: str, ordered: list, raw_output: Any) -> None:
+        """Checks that the ordered entries appear in one stream's output in order.
+
+        A single cursor advances through the output so each entry is searched for only after
+        the end of the entry before it.  Verification is O(output) no matter how many entries
+        there are.  Only the first out of order, or missing, entry is reported.
+
+        Args:
+            stream_name: The name of the stream (e.g., stdout) used in failure messages.
+            ordered: The entries expected to appear in order.
+            raw_output: The stream's output from command execution: str or BinaryOutput.
+
+        Raises:
+            None.  Calls self._add_test_failure() instead.
+        """
+        # LOCAL VARIABLES
+        cursor = 0       # Index in raw_output to search from
+        index = -1       # Index of an entry in raw_output
+        previous = None  # The previous entry found
+
+        # CHECK IT
+        for entry, search_term in _make_search_terms(ordered, raw_output):
+            index = raw_output.find(search_term, cursor)
+            if index < 0:
+                if previous is not None and search_term in raw_output:
+                    self._add_test_failure(f'Found {entry} in {stream_name} out of order: '
+                                           f'expected it after {previous}')
+                else:
+                    self._add_test_failure(f'Unable to locate {entry} in {stream_name}')
+                return
+            cursor = index + len(search_term)
+            previous = entry
+
+    def _uses_class_command(self) -> bool:
+        """Determine if this test case validates the class-wide execution."""
+        return not self._command.cmd_list and bool(self.class_command_list)
+
+    def _uses_command_cache(self) -> bool:
+        """Determine if this test case's command may use the command cache."""
+        if not self._command.deterministic or self.capture_mode is not CaptureMode.TEXT:
+            return False  # Binary captures may be mapped files, which aren't cached
+        return self.use_command_cache or self.persistent_cache is not None
 
     def _validate_usage(self) -> None:
         """Validate test author's usage.
@@ -437,18 +954,58 @@ class TediousFuncTest(TediousStart):
         Raises:
             None.  Calls self.fail() instead.
         """
+        # Capture mode
+        self._validate_type(self.capture_mode, 'capture_mode', param_type=CaptureMode)
+        self._validate_string(self.decode_errors, 'decode_errors')
+        try:
+            codecs.lookup_error(self.decode_errors)
+        except LookupError:
+            self.fail(self._test_error.format(f'Unknown decode_errors of {self.decode_errors}'))
+        # Output order
+        if self._order_exp:
+            if self.capture_mode is not CaptureMode.MERGED:
+                self.fail(self._test_error.format('expect_output_order() requires '
+                                                  'capture_mode = CaptureMode.MERGED'))
+            if self._uses_class_command():
+                self.fail(self._test_error.format('expect_output_order() requires the test '
+                                                  "case's own command list"))
+        # Tee
+        if self.tee_output is not None:
+            if not isinstance(self.tee_output, str) and not hasattr(self.tee_output, 'write'):
+                self.fail(self._test_error.format('tee_output must be a stream or a filename, '
+                                                  f'not {type(self.tee_output)}'))
+            if self.capture_mode is CaptureMode.MEMFD:
+                self.fail(self._test_error.format('CaptureMode.MEMFD has no pipes to tee'))
+            self._validate_type(self.tee_flush_interval, 'tee_flush_interval',
+                                param_type=(int, float))
+            if self.tee_flush_interval < 0:
+                self.fail(self._test_error.format('Invalid tee_flush_interval of '
+                                                  f'{self.tee_flush_interval} seconds'))
         # Command list
-        if not self._cmd_list:
+        if not self._command.cmd_list and not self.class_command_list:
             self.fail(self._test_error.format('No command list was found.  '
                                               'Call self.set_command_list()'))
         # Check stdout
-        if self._exp_stdout and self._verify_stdout_empty:
+        if self._stdout_exp.verify_empty and (self._stdout_exp.expected or self._stdout_exp.ordered
+                                              or self._stdout_exp.expected_regex):
             self.fail(self._test_error.format('Decide whether or not you want stdout'))
         # Check stderr
-        if self._exp_stderr and self._verify_stderr_empty:
+        if self._stderr_exp.verify_empty and (self._stderr_exp.expected or self._stderr_exp.ordered
+                                              or self._stderr_exp.expected_regex):
             self.fail(self._test_error.format('Decide whether or not you want stderr'))
 
     def _validate_verbosity(self) -> None:
         """Validate self._verbosity."""
         self._validate_type(self._verbosity, 'TediousFuncTest._verbosity', param_type=Verbosity)
 # pylint: enable=too-many-instance-attributes
+# pylint: enable=too-many-public-methods
+
+
+def _make_search_terms(entries: List[str], raw_output: Any) -> List[tuple]:
+    """Pair each expectation entry with the term searched for in raw_output.
+
+    Entries are encoded once, up front, when raw_output is a BinaryOutput.
+    """
+    if isinstance(raw_output, BinaryOutput):
+        return [(entry, raw_output.encode(entry)) for entry in entries]
+    return [(entry, entry) for entry in entries]
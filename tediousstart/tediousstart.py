@@ -8,6 +8,7 @@ Tedious Start (TEST) base class.  Implements the core functionality of the test
     2. Define additional functionality if necessary
     3. Utilize class functionality as appropriate:
         self._add_test_failure('Present this failure later')  # Use when a Test Case fails
+        self._add_test_failure('Unexpected output', output=raw_output)  # Embeds an excerpt
         self.fail(self._test_error.format('Present this failure NOW'))  # Immediate error
         self.validate_*()  # Validate test author input
         self._present_test_failures()  # Call this after test execution to present test failures
@@ -19,15 +20,20 @@ from collections import namedtuple
 from typing import Any
 import unittest
 # Third Party Imports
-from hobo.disk_operations import delete_files, validate_directory, validate_file
+# hobo.disk_operations is imported on first use to keep the import time of TediousStart low.
 from hobo.validation import validate_list, validate_string, validate_type
 # Local Imports
+from tediousstart.failure_record import excerpt, FailureRecord, MAX_OUTPUT_CHARS
 
 
 # Stores test author's expected Exception data
 # pylint:disable=undefined-variable
 ExceptionData = namedtuple('ExceptionData', ['exception_type', 'exception_msg'])
 # pylint:enable=undefined-variable
+# Compact summary of a finished test case, kept after its per-test state has been released
+# pylint:disable=undefined-variable
+TestSummary = namedtuple('TestSummary', ['test_id', 'failure_count', 'output_size'])
+# pylint:enable=undefined-variable
 
 
 def execute_test_cases(sys_exit: bool = True, verbosity: int = 2) -> None:
@@ -75,6 +81,9 @@ class TediousStart(unittest.TestCase):
     """
 
     _test_error = 'TEST CASE ERROR: {}'  # Pre-formatted test error string
+    max_failure_output = MAX_OUTPUT_CHARS  # Maximum output characters embedded in a failure
+    release_test_state = True  # Release heavy per-test state once the test case has finished
+    trusted_input = False  # Skip validation of test author list input (e.g., generated suites)
 
     # CORE CLASS METHODS
     # Methods listed in call order
@@ -96,7 +105,28 @@ class TediousStart(unittest.TestCase):
         """
         super().__init__(*args, **kwargs)
 
-        self._test_failure_list = []  # List of failures presented at the end
+        self._test_failure_list = []  # List of FailureRecords presented at the end
+        self.test_summary = None      # TestSummary, set once per-test state is released
+
+    def run(self, result: unittest.TestResult = None) -> unittest.TestResult:
+        """Run the test case, then release its per-test state.
+
+        Extends the parent method.  unittest keeps every TestCase object alive until the entire
+        run has finished.  Releasing each test case's heavy state (e.g., captured output) once
+        its result has been recorded keeps peak memory flat as the suite grows.  Set the
+        release_test_state class attribute to False to keep the state (e.g., for debugging).
+
+        Args:
+            result: Optional; The unittest.TestResult to record the result in.
+
+        Returns:
+            The parent method's return value.
+        """
+        try:
+            return super().run(result)
+        finally:
+            if self.release_test_state:
+                self._release_test_state()
 
     # TEST AUTHOR METHODS
     # Methods listed in "suggested" call order
@@ -119,13 +149,17 @@ class TediousStart(unittest.TestCase):
 
     # CLASS HELPER METHODS
     # Methods listed in alphabetical order
-    def _add_test_failure(self, failure_msg: str) -> None:
+    def _add_test_failure(self, failure_msg: str, output: Any = None) -> None:
         """Add a Test Case failure message.
 
-        Adds Test Case failures to an internal list.
+        Adds Test Case failures to an internal list.  The failure message is not rendered until
+        it is presented.
 
         Args:
             failure_msg: Non-empty string containing a failure message.
+            output: Optional; Output (e.g., stdout) to embed after the failure message.  At most,
+                max_failure_output characters of it will be presented as a head and tail
+                excerpt.
 
         Returns:
             None
@@ -138,12 +172,21 @@ class TediousStart(unittest.TestCase):
         self._validate_string(failure_msg, 'failure_msg')
 
         # ADD IT
-        self._test_failure_list.append(failure_msg)
+        self._test_failure_list.append(FailureRecord(failure_msg, output=output,
+                                                     max_output=self.max_failure_output))
+
+    def _release_test_state(self) -> None:
+        """Discard per-test state, keeping a compact TestSummary in self.test_summary.
+
+        Child classes extend this method to release their own state.
+        """
+        self.test_summary = TestSummary(self.id(), len(self._test_failure_list), 0)
+        self._test_failure_list = []
 
     def _present_test_failures(self) -> None:
         """Present test failures.
 
-        Present all of the collated test failures as self.fail().
+        Render all of the collated test failures and present them as self.fail().
 
         Args:
             None
@@ -160,12 +203,10 @@ class TediousStart(unittest.TestCase):
                             param_name='TediousStart._test_failure_list',
                             can_be_empty=True)
 
-        # LOCAL VARIABLES
-        test_fail_str = '\n' + '\n'.join(self._test_failure_list) + '\n'
-
         # SHOULD WE FAIL?
         if self._test_failure_list:
-            self.fail(test_fail_str)
+            self.fail('\n' + '\n'.join(str(failure) for failure in self._test_failure_list)
+                      + '\n')
 
     def _delete_files(self, dirname: str, exempt: list = None) -> None:
         """Deletes all files found in a directory.
@@ -178,6 +219,8 @@ class TediousStart(unittest.TestCase):
             dirname: The relative or absolute pathname of the directory to empty.
             exempt: Optional; A list of filenames, as strings, to avoid deleting.
         """
+        from hobo.disk_operations import delete_files  # pylint: disable=import-outside-toplevel
+
         # LOCAL VARIABLES
         # Templated format for reporting delete_files() Exceptions
         error_template = 'Failed to delete all "{}" files with a {}: {}'
@@ -221,6 +264,10 @@ class TediousStart(unittest.TestCase):
         Raises:
             None.  Calls self.fail() instead.
         """
+        # pylint: disable=import-outside-toplevel
+        from hobo.disk_operations import validate_directory
+        # pylint: enable=import-outside-toplevel
+
         # LOCAL VARIABLES
         error_message = ''  # Store the error message here
 
@@ -251,6 +298,8 @@ class TediousStart(unittest.TestCase):
         Raises:
             None.  Calls self.fail() instead.
         """
+        from hobo.disk_operations import validate_file  # pylint: disable=import-outside-toplevel
+
         # LOCAL VARIABLES
         error_message = ''  # Store the error message here
 
@@ -330,6 +379,55 @@ class TediousStart(unittest.TestCase):
         if error_message:
             self.fail(error_message)
 
+    def _validate_string_list(self, validate_this: list, param_name: str,
+                              can_be_empty: bool = False,
+                              entries_can_be_empty: bool = False) -> None:
+        """Validate a list of strings in one pass.
+
+        Checks the types of all entries at once and only inspects entries individually if a
+        problem is found.  Every problem is reported in one failure.  Skipped entirely if
+        trusted_input is True.
+
+        Args:
+            validate_this: The parameter to validate
+            param_name: The name of the parameter (used in failure messages)
+            can_be_empty: [OPTIONAL] If False, this function will verify that validate_this is
+                *not* empty.
+            entries_can_be_empty: [OPTIONAL] If False, this function will verify that none of
+                the entries are empty strings.
+
+        Returns:
+            None
+
+        Raises:
+            None.  Calls self.fail() instead.
+        """
+        # LOCAL VARIABLES
+        problems = []  # Description of each invalid entry
+
+        # FAST PATH
+        if self.trusted_input:
+            return
+        self._validate_list(validate_this=validate_this, param_name=param_name,
+                            can_be_empty=can_be_empty)
+        if set(map(type, validate_this)) <= {str} \
+                and (entries_can_be_empty or '' not in validate_this):
+            return
+
+        # VALIDATION
+        for index, entry in enumerate(validate_this):
+            if not isinstance(entry, str):
+                problems.append(f'[{index}] expected type str, instead received type '
+                                f'{type(entry).__name__}')
+            elif not entry and not entries_can_be_empty:
+                problems.append(f'[{index}] can not be empty')
+
+        # REPORTING
+        if problems:
+            self.fail(self._test_error.format(
+                excerpt(f'{len(problems)} invalid "{param_name}" entries: ' + '; '.join(problems),
+                        self.max_failure_output)))
+
     def _validate_type(self, validate_this: Any, param_name: str, param_type: type) -> None:
         """Validate a type.
 
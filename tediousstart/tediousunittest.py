@@ -14,20 +14,47 @@ functions and basic class implementations.
         self.set_test_input()
         5.2. Set Expected Results
         self.expect_return()
+        self.set_return_tolerance(rel_tol=1e-9)  # OPTIONAL; Compare numbers approximately
         -or-
         self.expect_exception()
+        self.expect_completion_within(seconds=5)  # OPTIONAL
         5.3. Run Test
         self.run_test()
+        -or-
+        5.1. Run Many Table-Driven Cases At Once
+        self.run_test_table([((1, 2), {}, 0.5),
+                             ((1, 0), {}, ExceptionData(ValueError, 'divide by zero'))])
     6. Call execute_test_cases() (see: test.tediousstart)
+
+call_callable() may return an awaitable (e.g., call an async def function without awaiting it).
+TediousUnitTest awaits it on an event loop shared by every test case in the test class before
+validating the results.  Pass concurrent=True to run_test_table() to await every row's awaitable
+concurrently on that loop.  An expect_completion_within() deadline then applies to each row's
+awaitable.
 """
 
 # Standard Imports
-from typing import Any
+# asyncio and ctypes are imported on first use to keep the import time of TediousUnitTest low.
+from typing import Any, Optional, Tuple
+import inspect
+import sys
+import threading
+import traceback
 # Third Party Imports
 # Local Imports
+from tediousstart.comparison import compare_values
+from tediousstart.records import CallExpectations, CallSpec
 from tediousstart.tediousstart import ExceptionData, TediousStart
 
 
+class DeadlineExceededError(Exception):
+    """call_callable() did not complete within the expect_completion_within() deadline."""
+
+
+class _AbandonedWorkerError(BaseException):
+    """Raised inside a stuck worker thread to unwind it once its deadline has passed."""
+
+
 class TediousUnitTest(TediousStart):
     """TEST unit test class.
 
@@ -39,6 +66,9 @@ class TediousUnitTest(TediousStart):
         3. Define the functionality you need
     """
 
+    _event_loop = None       # Event loop shared by the test class to await call_callable()
+    max_reported_diffs = 10  # Maximum number of differing items described in a failure message
+
     # CORE CLASS METHODS
     # Methods listed in call order
     def __init__(self, *args, **kwargs) -> None:
@@ -59,12 +89,55 @@ class TediousUnitTest(TediousStart):
         """
         super().__init__(*args, **kwargs)
 
-        self._args = None                       # *args from set_test_input()
-        self._expected_exception_data = None    # Defined by expect_exception()
-        self._defined_expected_results = False  # Set True by expect_*()
-        self._defined_test_input = False        # Set True by set_test_input()
-        self._exp_return = None                 # Defined by expect_return()
-        self._kwargs = None                     # **kwargs from set_test_input()
+        self._call = CallSpec()            # Test input from set_test_input()
+        self._expect = CallExpectations()  # Expected results from expect_*()
+
+    # STATE ACCESSORS
+    # Child classes may read and write test input and expected results through these properties
+    @property
+    def _args(self) -> tuple:
+        """*args from set_test_input()."""
+        return self._call.args
+
+    @_args.setter
+    def _args(self, value: tuple) -> None:
+        self._call.args = value
+
+    @property
+    def _kwargs(self) -> dict:
+        """**kwargs from set_test_input()."""
+        return self._call.kwargs
+
+    @_kwargs.setter
+    def _kwargs(self, value: dict) -> None:
+        self._call.kwargs = value
+
+    @property
+    def _defined_test_input(self) -> bool:
+        """True if set_test_input() was called."""
+        return self._call.defined
+
+    @_defined_test_input.setter
+    def _defined_test_input(self, value: bool) -> None:
+        self._call.defined = value
+
+    @property
+    def _exp_return(self) -> Any:
+        """Expected return value from expect_return()."""
+        return self._expect.exp_return
+
+    @_exp_return.setter
+    def _exp_return(self, value: Any) -> None:
+        self._expect.exp_return = value
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Close the test class's shared event loop, if one was created."""
+        super().tearDownClass()
+        event_loop = cls.__dict__.get('_event_loop')
+        if event_loop is not None:
+            event_loop.close()
+            cls._event_loop = None
 
     def call_callable(self) -> Any:
         """Child class defines test case callable.
@@ -86,6 +159,8 @@ class TediousUnitTest(TediousStart):
         """
         # Example Usage:
         # return the_function_you_are_testing(*self._args, **self._kwargs)
+        # Example Async Usage (TediousUnitTest awaits it):
+        # return the_coroutine_function_you_are_testing(*self._args, **self._kwargs)
         raise NotImplementedError(
             self._test_error.format('The child class must override the call_callable method'))
 
@@ -157,12 +232,40 @@ class TediousUnitTest(TediousStart):
         Raises:
             None.  Calls self.fail() instead.
         """
-        if self._defined_expected_results:
+        if self._expect.defined:
             self.fail(self._test_error.format('Expected results were already specified'))
 
         # STORE IT
         self._exp_return = expected_result
-        self._defined_expected_results = True
+        self._expect.defined = True
+
+    def set_return_tolerance(self, rel_tol: float = 0.0, abs_tol: float = 0.0) -> None:
+        """Define tolerances for comparing numeric return values.
+
+        Numbers, including those inside sequences and NumPy arrays, are considered equal if they
+        are within tolerance of each other (see: math.isclose()).
+
+        Args:
+            rel_tol: Optional; Maximum allowed difference relative to the larger absolute value.
+            abs_tol: Optional; Maximum allowed absolute difference.
+
+        Returns:
+            None
+
+        Raises:
+            None.  Calls self.fail() instead.
+        """
+        # INPUT VALIDATION
+        for tol_value, tol_name in ((rel_tol, 'rel_tol'), (abs_tol, 'abs_tol')):
+            if isinstance(tol_value, bool) or not isinstance(tol_value, (int, float)):
+                self.fail(self._test_error.format(f'{tol_name} expected type float but was '
+                                                  f'{type(tol_value)}'))
+            if tol_value < 0:
+                self.fail(self._test_error.format(f'Invalid {tol_name} of {tol_value}'))
+
+        # STORE IT
+        self._expect.rel_tol = float(rel_tol)
+        self._expect.abs_tol = float(abs_tol)
 
     # Exception Raised
     def expect_exception(self, exception_type: Exception, exception_msg: str) -> None:
@@ -180,7 +283,7 @@ class TediousUnitTest(TediousStart):
         Raises:
             None.  Calls self.fail() instead.
         """
-        if self._defined_expected_results:
+        if self._expect.defined:
             self.fail(self._test_error.format('Expected results were already specified'))
 
         # INPUT VALIDATION
@@ -190,8 +293,37 @@ class TediousUnitTest(TediousStart):
         self._validate_string(exception_msg, 'exception_msg', can_be_empty=True)
 
         # STORE IT
-        self._expected_exception_data = ExceptionData(exception_type, exception_msg)
-        self._defined_expected_results = True
+        self._expect.exception_data = ExceptionData(exception_type, exception_msg)
+        self._expect.defined = True
+
+    # Deadline
+    def expect_completion_within(self, seconds: float) -> None:
+        """Define the maximum number of seconds call_callable() may execute.
+
+        self.call_callable() will execute in a watchdog-supervised worker thread.  If it fails to
+        complete in time, the test case fails with a sample of the worker's stack, showing where
+        it was stuck, and the test moves on.  The stuck worker is then interrupted, to keep it
+        from consuming resources during later test cases, but code blocked inside a C extension
+        or system call can not be interrupted until it returns to the interpreter.
+
+        Args:
+            seconds: The deadline, in seconds.  Must be greater than zero.
+
+        Returns:
+            None
+
+        Raises:
+            None.  Calls self.fail() instead.
+        """
+        # INPUT VALIDATION
+        if isinstance(seconds, bool) or not isinstance(seconds, (int, float)):
+            self.fail(self._test_error.format(f'seconds expected type int or float but was '
+                                              f'{type(seconds)}'))
+        if seconds <= 0:
+            self.fail(self._test_error.format(f'Invalid deadline of {seconds} seconds'))
+
+        # STORE IT
+        self._expect.deadline = seconds
 
     # 3. Run Test
     def run_test(self) -> None:
@@ -216,7 +348,7 @@ class TediousUnitTest(TediousStart):
         self._validate_usage()
 
         # 2. RUN TEST
-        if self._expected_exception_data:
+        if self._expect.exception_data:
             self._run_test_exception()
         else:
             self._run_test_return()
@@ -224,8 +356,216 @@ class TediousUnitTest(TediousStart):
         # 3. REPORT
         self._present_test_failures()
 
+    # 4. Run Table-Driven Tests
+    def run_test_table(self, rows: list, concurrent: bool = False) -> None:
+        """Execute many test cases, one per row, in a single loop.
+
+        Each row is a tuple of (args, kwargs, expected).  The args and kwargs are passed to
+        self.call_callable() (as self._args and self._kwargs).  If expected is an ExceptionData
+        the row expects that Exception, otherwise expected is the expected return value which is
+        checked by self.validate_return_value().  This avoids the unittest and TediousUnitTest
+        per-test overhead of defining one test method per input.  Do not call set_test_input(),
+        expect_*(), or run_test() when using this method.
+
+        Every failing row is presented as its own subTest, identified by its row index.
+
+        Args:
+            rows: A list (or tuple) of (args, kwargs, expected) tuples.
+            concurrent: Optional; Call self.call_callable() for every row first, then await all
+                of the resulting awaitables concurrently on the test class's event loop.  Only
+                use this if the rows are independent of each other.  An
+                expect_completion_within() deadline applies to each row's awaitable.
+
+        Returns:
+            None
+
+        Raises:
+            None.  Calls self.fail() instead.
+        """
+        # LOCAL VARIABLES
+        row_failures = []  # List of (row index, failure list) tuples
+
+        # INPUT VALIDATION
+        if not isinstance(rows, (list, tuple)):
+            self.fail(self._test_error.format(f'rows must be a list, not {type(rows)}'))
+        if not rows:
+            self.fail(self._test_error.format('rows may not be empty'))
+
+        # RUN THEM
+        if concurrent:
+            row_failures = self._run_table_concurrently(rows)
+        else:
+            for index, row in enumerate(rows):
+                self._load_table_row(index, row)
+                if self._expect.exception_data:
+                    self._run_test_exception()
+                else:
+                    self._run_test_return()
+                if self._test_failure_list:
+                    row_failures.append((index, self._test_failure_list))
+                    self._test_failure_list = []
+
+        # REPORT
+        for index, failure_list in row_failures:
+            with self.subTest(row=index):
+                self.fail('\n' + '\n'.join(str(failure) for failure in failure_list) + '\n')
+
     # CLASS HELPER METHODS
     # Methods listed in alphabetical order
+    def _call_and_await(self) -> Any:
+        """Call self.call_callable(), awaiting the result on the shared loop if necessary.
+
+        Enforces the expect_completion_within() deadline, if one was defined.
+
+        Raises:
+            DeadlineExceededError: The deadline passed before the call completed.
+        """
+        # LOCAL VARIABLES
+        result = None  # Return value of self.call_callable()
+
+        # DEADLINE
+        if self._expect.deadline is not None:
+            return self._call_with_deadline()
+
+        # CALL IT
+        result = self.call_callable()
+        if inspect.isawaitable(result):
+            result = self._get_event_loop().run_until_complete(result)
+
+        # DONE
+        return result
+
+    def _call_with_deadline(self, await_result: bool = True) -> Any:
+        """Call self.call_callable() in a worker thread supervised by a watchdog.
+
+        Awaitables are run on a private event loop in the worker thread so a stuck coroutine
+        can't block the test class's shared event loop.
+
+        Args:
+            await_result: Optional; If False, return awaitables unawaited so the caller can
+                await them, under the same deadline, on the shared event loop.
+
+        Raises:
+            DeadlineExceededError: The deadline passed before the call completed.
+        """
+        # LOCAL VARIABLES
+        outcome = {}  # 'result' or 'error' from the worker
+
+        # WORKER
+        def _worker() -> None:
+            event_loop = None  # Private event loop
+            try:
+                result = self.call_callable()
+                if await_result and inspect.isawaitable(result):
+                    import asyncio  # pylint: disable=import-outside-toplevel
+                    event_loop = asyncio.new_event_loop()
+                    result = event_loop.run_until_complete(result)
+                outcome['result'] = result
+            except _AbandonedWorkerError:
+                pass  # The watchdog gave up on this worker
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                outcome['error'] = err
+            finally:
+                if event_loop is not None:
+                    event_loop.close()
+
+        # RUN IT
+        worker = threading.Thread(target=_worker, name=f'{self.id()} worker', daemon=True)
+        worker.start()
+        worker.join(self._expect.deadline)
+
+        # WATCHDOG
+        if worker.is_alive():
+            stack_sample = _sample_stack(worker)
+            _interrupt_thread(worker)
+            raise DeadlineExceededError('Execution did not complete within '
+                                        f'{self._expect.deadline} seconds.  The callable was '
+                                        f'stuck at:\n{stack_sample}')
+
+        # DONE
+        if 'error' in outcome:
+            raise outcome['error']
+        return outcome.get('result')
+
+    @classmethod
+    def _get_event_loop(cls) -> Any:
+        """Return the test class's shared asyncio event loop, creating it on first use."""
+        import asyncio  # pylint: disable=import-outside-toplevel
+        event_loop = cls.__dict__.get('_event_loop')  # Don't share a parent class's loop
+        if event_loop is None or event_loop.is_closed():
+            event_loop = asyncio.new_event_loop()
+            cls._event_loop = event_loop
+        return event_loop
+
+    def _load_table_row(self, index: int, row: tuple) -> None:
+        """Store a run_test_table() row as the current test input and expected results."""
+        # LOCAL VARIABLES
+        expected = None  # Expected return value or ExceptionData
+
+        # LOAD IT
+        try:
+            self._args, self._kwargs, expected = row
+        except (TypeError, ValueError):
+            self.fail(self._test_error.format(f'Row {index} is not an (args, kwargs, '
+                                              f'expected) tuple: {row!r}'))
+        if isinstance(expected, ExceptionData):
+            self._expect.exception_data = expected
+        else:
+            self._expect.exception_data = None
+            self._exp_return = expected
+
+    def _release_test_state(self) -> None:
+        """Discard test input and expected results, keeping a compact TestSummary.
+
+        Extends the parent method.
+        """
+        super()._release_test_state()
+        self._call = CallSpec()
+        self._expect = CallExpectations()
+
+    def _run_table_concurrently(self, rows: list) -> list:
+        """Execute run_test_table() rows, awaiting their results concurrently.
+
+        The expect_completion_within() deadline applies to each row's call, through
+        self._call_with_deadline(), and to each awaitable it returns.
+
+        Returns:
+            A list of (row index, failure list) tuples for the failing rows.
+        """
+        # LOCAL VARIABLES
+        outcomes = []      # (result, Exception) for each row
+        awaitables = {}    # Row index: awaitable returned by self.call_callable()
+        row_failures = []  # List of (row index, failure list) tuples
+
+        # CALL THEM
+        for index, row in enumerate(rows):
+            self._load_table_row(index, row)
+            try:
+                if self._expect.deadline is None:
+                    outcomes.append((self.call_callable(), None))
+                else:
+                    outcomes.append((self._call_with_deadline(await_result=False), None))
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                outcomes.append((None, err))
+            if inspect.isawaitable(outcomes[-1][0]):
+                awaitables[index] = outcomes[-1][0]
+
+        # AWAIT THEM
+        if awaitables:
+            for index, outcome in zip(awaitables, self._get_event_loop().run_until_complete(
+                    _capture_all(awaitables.values(), self._expect.deadline))):
+                outcomes[index] = outcome
+
+        # VALIDATE THEM
+        for index, (row, outcome) in enumerate(zip(rows, outcomes)):
+            self._load_table_row(index, row)
+            self._validate_outcome(*outcome)
+            if self._test_failure_list:
+                row_failures.append((index, self._test_failure_list))
+                self._test_failure_list = []
+
+        # DONE
+        return row_failures
 
     def _run_test_exception(self) -> None:
         """Execute a test expected to fail.
@@ -242,22 +582,13 @@ class TediousUnitTest(TediousStart):
             None.  Calls self.fail() or self._add_test_failure() instead.
         """
         try:
-            self.call_callable()
+            self._call_and_await()
         # pylint: disable=broad-except
         except Exception as err:
-            if not isinstance(err, self._expected_exception_data.exception_type):
-                self._add_test_failure('Expected Exception of type '
-                                       f'{self._expected_exception_data.exception_type} but '
-                                       f'caught an Exception of type {type(err)}')
-            elif self._expected_exception_data.exception_msg.lower() not in str(err).lower():
-                self._add_test_failure(
-                    'Expected the message '
-                    f'"{self._expected_exception_data.exception_msg}" in {str(err)}')
+            self._validate_exception(err)
         # pylint: enable=broad-except
         else:
-            self._add_test_failure('Expected Exception of type '
-                                   f'{self._expected_exception_data.exception_type} but '
-                                   'no Exception was raised')
+            self._validate_exception(None)
 
     def _run_test_return(self) -> None:
         """Execute a test expected to pass.
@@ -278,7 +609,9 @@ class TediousUnitTest(TediousStart):
 
         # RUN IT
         try:
-            result = self.call_callable()
+            result = self._call_and_await()
+        except DeadlineExceededError as err:
+            self._add_test_failure(str(err))
         # pylint: disable=broad-except
         except Exception as err:
             self._add_test_failure(f'Execution failed unexpectedly with {str(err)}')
@@ -286,11 +619,62 @@ class TediousUnitTest(TediousStart):
             self.validate_return_value(result)
         # pylint: enable=broad-except
 
+    def _validate_exception(self, err: Exception) -> None:
+        """Validate a raised Exception against the expected Exception data.
+
+        Args:
+            err: The Exception raised by execution or None if no Exception was raised.
+
+        Returns:
+            None
+
+        Raises:
+            None.  Calls self._add_test_failure() instead.
+        """
+        if err is None:
+            self._add_test_failure('Expected Exception of type '
+                                   f'{self._expect.exception_data.exception_type} but '
+                                   'no Exception was raised')
+        elif isinstance(err, DeadlineExceededError):
+            self._add_test_failure(str(err))
+        elif not isinstance(err, self._expect.exception_data.exception_type):
+            self._add_test_failure('Expected Exception of type '
+                                   f'{self._expect.exception_data.exception_type} but '
+                                   f'caught an Exception of type {type(err)}')
+        elif self._expect.exception_data.exception_msg.lower() not in str(err).lower():
+            self._add_test_failure(
+                'Expected the message '
+                f'"{self._expect.exception_data.exception_msg}" in {str(err)}')
+
+    def _validate_outcome(self, result: Any, err: Exception) -> None:
+        """Validate the outcome of an execution against the expected results.
+
+        Args:
+            result: The return value of the execution.
+            err: The Exception raised by execution or None if no Exception was raised.
+
+        Returns:
+            None
+
+        Raises:
+            None.  Calls self._add_test_failure() instead.
+        """
+        if self._expect.exception_data:
+            self._validate_exception(err)
+        elif isinstance(err, DeadlineExceededError):
+            self._add_test_failure(str(err))
+        elif err is not None:
+            self._add_test_failure(f'Execution failed unexpectedly with {str(err)}')
+        else:
+            self.validate_return_value(result)
+
     def _validate_return_value(self, return_value: Any) -> None:
         """Validate the return value.
 
         Validate a return value's type and value against the expected return value provided by
-        the test author.
+        the test author.  Values are compared using tediousstart.comparison.compare_values(),
+        honoring any set_return_tolerance() tolerances.  Failure messages describe, at most,
+        self.max_reported_diffs differences.
 
         Args:
             return_value: The data to check against what the test author defined as the expected
@@ -308,9 +692,13 @@ class TediousUnitTest(TediousStart):
             self._add_test_failure(f'Expected type {type(self._exp_return)} '
                                    f'but it was of type {type(return_value)}')
         # Value
-        elif return_value != self._exp_return:
-            self._add_test_failure(f'Expected value "{self._exp_return}" '
-                                   f'but received "{return_value}" instead')
+        else:
+            failure_msg = compare_values(self._exp_return, return_value,
+                                         rel_tol=self._expect.rel_tol,
+                                         abs_tol=self._expect.abs_tol,
+                                         max_diffs=self.max_reported_diffs)
+            if failure_msg:
+                self._add_test_failure(failure_msg)
 
     def _validate_usage(self) -> None:
         """Validate test author's usage.
@@ -328,5 +716,55 @@ class TediousUnitTest(TediousStart):
         """
         if not self._defined_test_input:
             self.fail(self._test_error.format('No test input was found'))
-        if not self._defined_expected_results:
+        if not self._expect.defined:
             self.fail(self._test_error.format('Expected results were not specified'))
+
+
+async def _capture(awaitable: Any, deadline: Optional[float] = None) -> Tuple[Any, Exception]:
+    """Await awaitable, capturing its result or Exception as a (result, Exception) tuple.
+
+    Args:
+        awaitable: The awaitable returned by call_callable().
+        deadline: Optional; Seconds to wait before cancelling awaitable and capturing a
+            DeadlineExceededError instead.
+    """
+    import asyncio  # pylint: disable=import-outside-toplevel
+    task = asyncio.ensure_future(awaitable)  # awaitable, scheduled on the running loop
+
+    # DEADLINE
+    if deadline is not None:
+        await asyncio.wait([task], timeout=deadline)
+        if not task.done():
+            task.cancel()
+            await asyncio.wait([task])
+            return tuple((None, DeadlineExceededError('Execution did not complete within '
+                                                      f'{deadline} seconds')))
+
+    # DONE
+    try:
+        return tuple((await task, None))
+    except Exception as err:  # pylint: disable=broad-exception-caught
+        return tuple((None, err))
+
+
+async def _capture_all(awaitables: list, deadline: Optional[float] = None) -> list:
+    """Concurrently await all awaitables, capturing each (result, Exception) tuple."""
+    import asyncio  # pylint: disable=import-outside-toplevel
+    return await asyncio.gather(*[_capture(awaitable, deadline) for awaitable in awaitables])
+
+
+def _interrupt_thread(thread: threading.Thread) -> None:
+    """Asynchronously raise _AbandonedWorkerError in thread to unwind it."""
+    import ctypes  # pylint: disable=import-outside-toplevel
+    ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(thread.ident),
+                                               ctypes.py_object(_AbandonedWorkerError))
+
+
+def _sample_stack(thread: threading.Thread) -> str:
+    """Format the current stack of thread."""
+    # pylint: disable=protected-access
+    frame = sys._current_frames().get(thread.ident)
+    # pylint: enable=protected-access
+    if frame is None:
+        return '<unavailable>'
+    return ''.join(traceback.format_stack(frame))
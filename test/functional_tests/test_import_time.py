@@ -0,0 +1,171 @@
+"""Functionally test the import time of the tediousstart and badcode packages.
+
+Functionally test the deferred imports by executing `python -X importtime` and parsing its
+report.  Modules that are only needed on first use (e.g., to execute a command or hash a cache
+key) must not be imported along with the package.  The standard library modules every test case
+imports anyway (e.g., unittest) are imported first so the budget only covers the package's own
+import time.
+
+Run the test cases defined in this module using any of the example commands below:
+
+    Usage:
+    python -m unittest                                  # Run *ALL* test cases
+    python -m unittest -k TestImportTime                # Match this test class
+    python -m test.functional_tests                     # Run all functional tests
+    python -m test.functional_tests.test_import_time    # Run just these tests
+"""
+
+# Standard Imports
+from typing import Any, Dict
+import sys
+# Third Party Imports
+# Local Imports
+from tediousstart.tediousfunctest import TediousFuncTest
+from tediousstart.tediousstart import execute_test_cases
+
+
+IMPORT_BUDGET_US = 40000  # Cumulative import time budget, in microseconds, for one module
+# Standard library modules imported before the module under test
+BASELINE_MODULES = ('typing', 'unittest')
+# Modules importing tediousstart.tediousfunctest must not import
+TEDIOUS_DEFERRED = ('asyncio', 'ctypes', 'hashlib', 'hobo.disk_operations',
+                    'hobo.subprocess_wrapper', 'json', 'pathlib', 'resource', 'selectors',
+                    'shutil', 'subprocess', 'tediousstart.capture_backends',
+                    'tediousstart.capture_executors', 'tediousstart.chunk_log', 'tempfile')
+
+
+def parse_importtime(report: str) -> Dict[str, int]:
+    """Parse a `python -X importtime` report.
+
+    Returns:
+        A dictionary mapping each imported module name to its cumulative import time, in
+        microseconds.
+    """
+    # LOCAL VARIABLES
+    import_times = {}  # Module name: cumulative microseconds
+
+    # PARSE IT
+    for line in report.splitlines():
+        fields = line.split('|')
+        if len(fields) == 3 and fields[1].strip().isdigit():
+            import_times[fields[2].strip()] = int(fields[1])
+
+    # DONE
+    return import_times
+
+
+class TestImportTime(TediousFuncTest):
+    """TestImportTime functional test class.
+
+    This class provides base functionality to run NEBS functional tests for the import time of
+    this repository's packages.
+    """
+
+    # CORE CLASS METHODS
+    def __init__(self, *args, **kwargs) -> None:
+        """TestImportTime ctor.
+
+        TestImportTime constructor.  Initializes attributes after constructing the parent
+        object.
+
+        Args:
+            args: Arguments to pass to the parent class ctor
+            kwargs: Keyword arguments to pass to the parent class ctor
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        super().__init__(*args, **kwargs)
+
+        self._module_name = ''  # Module to import
+        self._deferred = ()     # Modules that must not be imported along with it
+
+    def set_test_input(self, module_name: str, deferred: tuple,
+                       baseline: tuple = BASELINE_MODULES) -> None:
+        """Import module_name and verify none of the deferred modules were imported with it.
+
+        Args:
+            module_name: The module to import.
+            deferred: Modules that must not be imported along with module_name.
+            baseline: Optional; Modules to import, and exclude from the budget, beforehand.
+        """
+        self._module_name = module_name
+        self._deferred = deferred
+        self.set_command_list([sys.executable, '-X', 'importtime', '-c',
+                               ''.join(f'import {name}; ' for name in baseline)
+                               + f'import {module_name}'])
+        self.expect_exit_code(0)
+
+    def validate_results(self) -> Any:
+        """Parse the importtime report from stderr and validate it.
+
+        Overrides the parent method.
+        """
+        # LOCAL VARIABLES
+        import_times = parse_importtime(self._raw_stderr)  # Module name: cumulative microseconds
+
+        # VALIDATE
+        if self._module_name not in import_times:
+            self._add_test_failure(f'Unable to locate {self._module_name} in the importtime '
+                                   'report', output=self._raw_stderr)
+            return
+        for module_name in self._deferred:
+            if module_name in import_times:
+                self._add_test_failure(f'Importing {self._module_name} also imported '
+                                       f'{module_name}')
+        if import_times[self._module_name] > IMPORT_BUDGET_US:
+            self._add_test_failure(f'Importing {self._module_name} took '
+                                   f'{import_times[self._module_name]} microseconds, exceeding '
+                                   f'the budget of {IMPORT_BUDGET_US}')
+
+
+class NormalTestImportTime(TestImportTime):
+    """Normal Test Cases.
+
+    Organize the Normal Test Cases.
+    """
+
+    def test_normal_01(self):
+        """TediousFuncTest defers its execution and caching dependencies."""
+        self.set_test_input('tediousstart.tediousfunctest', TEDIOUS_DEFERRED)
+        self.run_test()
+
+    def test_normal_02(self):
+        """TediousUnitTest defers its execution and caching dependencies."""
+        self.set_test_input('tediousstart.tediousunittest', TEDIOUS_DEFERRED)
+        self.run_test()
+
+    def test_normal_03(self):
+        """Bad Code defers its error reporting dependency."""
+        self.set_test_input('badcode.main', ('hobo.misc',))
+        self.run_test()
+
+    def test_normal_04(self):
+        """CommandResult defers signal, which unittest would otherwise import first."""
+        self.set_test_input('tediousstart.command_result', ('signal',), baseline=())
+        self.run_test()
+
+    def test_normal_05(self):
+        """The output pump defers selectors."""
+        self.set_test_input('tediousstart.output_pump', ('selectors', 'signal'), baseline=())
+        self.run_test()
+
+
+class SpecialTestImportTime(TestImportTime):
+    """Special Test Cases.
+
+    Organize the Special Test Cases.
+    """
+
+    def test_special_01(self):
+        """The importtime report is parsed."""
+        self.assertEqual(parse_importtime('import time: self [us] | cumulative | imported package\n'
+                                          'import time:       120 |        340 |   json\n'),
+                         {'json': 340})
+
+
+if __name__ == '__main__':
+    execute_test_cases()
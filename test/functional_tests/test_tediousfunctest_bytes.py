@@ -0,0 +1,115 @@
+"""Functionally test TediousFuncTest's bytes-native output capture.
+
+Functionally test TediousFuncTest.capture_mode = CaptureMode.BYTES and the decode_errors
+attribute by executing commands whose output text-mode capture would decode and translate.
+
+Run the test cases defined in this module using any of the example commands below:
+
+    Usage:
+    python -m unittest                                          # Run *ALL* test cases
+    python -m unittest -k TestTFTBytes                          # Match this test class
+    python -m test.functional_tests                             # Run all functional tests
+    python -m test.functional_tests.test_tediousfunctest_bytes  # Run just these tests
+"""
+
+# Standard Imports
+from typing import Any
+# Third Party Imports
+# Local Imports
+from tediousstart.binary_output import BinaryOutput
+from tediousstart.capture_mode import CaptureMode
+from tediousstart.tediousfunctest import TediousFuncTest
+from tediousstart.tediousstart import execute_test_cases
+
+
+class TestTFTBytes(TediousFuncTest):
+    """TestTFTBytes functional test class.
+
+    This class provides base functionality to run NEBS functional tests for
+    TediousFuncTest.capture_mode = CaptureMode.BYTES.
+    """
+
+    capture_mode = CaptureMode.BYTES
+
+    def validate_results(self) -> Any:
+        """Overrides parent class method.  Verification is handled by other methods."""
+
+
+class NormalTestTFTBytes(TestTFTBytes):
+    """Normal Test Cases.
+
+    Organize the Normal Test Cases.
+    """
+
+    def test_normal_01(self):
+        """Output is stored as bytes."""
+        self.set_command_list(['echo', 'hello'])
+        self.expect_stdout(['hello\n'])
+        self.verify_stdout_missing(['goodbye'])
+        self.verify_stderr_empty()
+        self.expect_exit_code(0)
+        self.run_test()
+        self.assertIsInstance(self._raw_stdout, BinaryOutput)
+        self.assertEqual(self._raw_stdout.data(), b'hello\n')
+
+    def test_normal_02(self):
+        """Carriage returns are not translated."""
+        self.set_command_list(['printf', 'progress 50%%\\rprogress 100%%\\r\\n'])
+        self.expect_stdout(['progress 50%\rprogress 100%\r\n'])
+        self.verify_stdout_missing(['progress 50%\n'])
+        self.run_test()
+
+    def test_normal_03(self):
+        """stderr is stored as bytes too."""
+        self.set_command_list(['sh', '-c', 'printf "a\\r\\nb" >&2; exit 2'])
+        self.expect_stderr(['a\r\nb'])
+        self.expect_exit_code(2)
+        self.run_test()
+
+
+class ErrorTestTFTBytes(TestTFTBytes):
+    """Error Test Cases.
+
+    Organize the Error Test Cases.
+    """
+
+    def test_error_01(self):
+        """Unknown decode_errors."""
+        self.decode_errors = 'ignore_everything'
+        self.set_command_list(['echo', 'hello'])
+        with self.assertRaisesRegex(AssertionError, 'Unknown decode_errors'):
+            self.run_test()
+
+    def test_error_02(self):
+        """Bad decode_errors data type."""
+        self.decode_errors = None
+        self.set_command_list(['echo', 'hello'])
+        with self.assertRaisesRegex(AssertionError, 'decode_errors'):
+            self.run_test()
+
+
+class SpecialTestTFTBytes(TestTFTBytes):
+    """Special Test Cases.
+
+    Organize the Special Test Cases.
+    """
+
+    def test_special_01(self):
+        """Undecodable output is matched, and reported with the decode_errors policy."""
+        self.decode_errors = 'backslashreplace'
+        self.set_command_list(['printf', 'ok \\377\\n'])
+        self.expect_stdout(['ok '])
+        self.verify_stderr_empty()
+        self.run_test()
+        self.assertEqual(str(self._raw_stdout), 'ok \\xff\n')
+
+    def test_special_02(self):
+        """Failure reports decode only the output they show."""
+        self.set_command_list(['printf', '\\377\\376'])
+        self.verify_stdout_empty()
+        with self.assertRaisesRegex(AssertionError, 'Stdout was not empty'):
+            self.run_test()
+
+
+if __name__ == '__main__':
+    execute_test_cases()
@@ -0,0 +1,160 @@
+"""Functionally test TediousFuncTest's class-wide command execution.
+
+Functionally test the TediousFuncTest.class_command_list attribute and
+TediousFuncTest.execute_class_command() by executing a command that counts its own executions.
+Every test case in a class must observe the same, single, execution.
+
+Run the test cases defined in this module using any of the example commands below:
+
+    Usage:
+    python -m unittest                                                  # Run *ALL* test cases
+    python -m unittest -k TestTFTClassCommand                           # Match this test class
+    python -m test.functional_tests                                     # Run all functional tests
+    python -m test.functional_tests.test_tediousfunctest_class_command  # Run just these tests
+"""
+
+# Standard Imports
+from typing import Any
+import os
+import tempfile
+# Third Party Imports
+# Local Imports
+from tediousstart.tediousfunctest import TediousFuncTest
+from tediousstart.tediousstart import execute_test_cases
+
+
+# pylint: disable=protected-access
+class TestTFTClassCommand(TediousFuncTest):
+    """TestTFTClassCommand functional test class.
+
+    This class provides base functionality to run NEBS functional tests for
+    TediousFuncTest.class_command_list.
+    """
+
+    _temp_dir = None  # TemporaryDirectory holding the execution counter file
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Prepares the Test Class.
+
+        Defines the class-wide command: one that counts its own executions.
+        """
+        super().setUpClass()
+        cls._temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        cls.class_command_list = ['sh', '-c', f'echo x >> {cls.counter_file()}; '
+                                  f'echo "count: $(wc -l < {cls.counter_file()})"']
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Cleanup after the Test Class."""
+        super().tearDownClass()
+        cls._temp_dir.cleanup()
+
+    @classmethod
+    def counter_file(cls) -> str:
+        """Filename of the execution counter."""
+        return os.path.join(cls._temp_dir.name, 'counter')
+
+    def validate_results(self) -> Any:
+        """Overrides parent class method.  Verification is handled by other methods."""
+
+
+class NormalTestTFTClassCommand(TestTFTClassCommand):
+    """Normal Test Cases.
+
+    Organize the Normal Test Cases.  Each test case expects the class command executed once.
+    """
+
+    def test_normal_01(self):
+        """Validate stdout of the shared execution."""
+        self.expect_stdout(['count: 1'])
+        self.run_test()
+
+    def test_normal_02(self):
+        """Validate the exit code of the shared execution."""
+        self.expect_exit_code(0)
+        self.verify_stdout_missing(['count: 2'])
+        self.run_test()
+
+    def test_normal_03(self):
+        """Validate stderr of the shared execution."""
+        self.verify_stderr_empty()
+        self.run_test()
+
+    def test_normal_04(self):
+        """Test case command lists take precedence over the class command list."""
+        self.set_command_list(['echo', 'override'])
+        self.expect_stdout(['override'])
+        self.run_test()
+
+
+class EagerTestTFTClassCommand(TestTFTClassCommand):
+    """Normal Test Cases.
+
+    Organize the Normal Test Cases.  The class command executes in setUpClass().
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Execute the class command before any test case."""
+        super().setUpClass()
+        cls.execute_class_command()
+
+    def test_normal_05(self):
+        """The class command already executed."""
+        with open(self.counter_file(), 'r', encoding='utf-8') as in_file:
+            self.assertEqual(len(in_file.readlines()), 1)
+        self.expect_stdout(['count: 1'])
+        self.run_test()
+
+
+class ErrorTestTFTClassCommand(TestTFTClassCommand):
+    """Error Test Cases.
+
+    Organize the Error Test Cases.
+    """
+
+    def test_error_01(self):
+        """One test case's failure is reported independently."""
+        self.expect_stdout(['count: 2'])
+        with self.assertRaisesRegex(AssertionError, 'Unable to locate count: 2'):
+            self.run_test()
+
+    def test_error_02(self):
+        """The failure in test_error_01 did not re-execute the class command."""
+        self.expect_stdout(['count: 1'])
+        self.run_test()
+
+    def test_error_03(self):
+        """execute_class_command() rejects an invalid class_command_list."""
+        class BadClassCommand(TediousFuncTest):  # pylint: disable=abstract-method
+            """A class command list with an empty entry."""
+            class_command_list = ['echo', '']
+
+        with self.assertRaisesRegex(AssertionError, 'Invalid class_command_list'):
+            BadClassCommand.execute_class_command()
+
+
+class SpecialTestTFTClassCommand(TestTFTClassCommand):
+    """Special Test Cases.
+
+    Organize the Special Test Cases.
+    """
+
+    def test_special_01(self):
+        """execute_class_command() needs no test case and tearDownClass() discards its results."""
+        class NoTestCases(TediousFuncTest):  # pylint: disable=abstract-method
+            """A test class that can't be instantiated."""
+            class_command_list = ['echo', 'shared']
+
+            def __init__(self, *args, **kwargs):  # pylint: disable=super-init-not-called
+                raise AssertionError('A test case was created')
+
+        NoTestCases.execute_class_command()
+        self.assertIn('shared', NoTestCases._class_execution.stdout)
+        NoTestCases.tearDownClass()
+        self.assertIsNone(NoTestCases._class_execution)
+
+
+if __name__ == '__main__':
+    execute_test_cases()
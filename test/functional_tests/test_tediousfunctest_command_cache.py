@@ -0,0 +1,216 @@
+"""Functionally test TediousFuncTest's command caches.
+
+Functionally test the TediousFuncTest.use_command_cache and persistent_cache attributes,
+mark_nondeterministic(), declare_input_files(), and the CommandCache and PersistentCommandCache
+classes by executing a command that counts its own executions.
+
+Run the test cases defined in this module using any of the example commands below:
+
+    Usage:
+    python -m unittest                                                  # Run *ALL* test cases
+    python -m unittest -k TestTFTCommandCache                           # Match this test class
+    python -m test.functional_tests                                     # Run all functional tests
+    python -m test.functional_tests.test_tediousfunctest_command_cache  # Run just these tests
+"""
+
+# Standard Imports
+from typing import Any
+import os
+import tempfile
+# Third Party Imports
+# Local Imports
+from tediousstart.command_cache import (CachedExecution, CommandCache, PersistentCommandCache,
+                                        RUN_CACHE)
+from tediousstart.tediousfunctest import TediousFuncTest
+from tediousstart.tediousstart import execute_test_cases
+
+
+class CountingFuncTest(TediousFuncTest):
+    """Executes a command that counts its own executions."""
+
+    use_command_cache = True
+
+    def validate_results(self) -> Any:
+        """Overrides parent class method.  Verification is handled by other methods."""
+
+
+class TestTFTCommandCache(TediousFuncTest):
+    """TestTFTCommandCache functional test class.
+
+    This class provides base functionality to run NEBS functional tests for the TediousFuncTest
+    command cache.
+    """
+
+    # CORE CLASS METHODS
+    def __init__(self, *args, **kwargs) -> None:
+        """TestTFTCommandCache ctor.
+
+        TestTFTCommandCache constructor.  Initializes attributes after constructing the parent
+        object.
+
+        Args:
+            args: Arguments to pass to the parent class ctor
+            kwargs: Keyword arguments to pass to the parent class ctor
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        super().__init__(*args, **kwargs)
+
+        self._temp_dir = None  # TemporaryDirectory holding the execution counter file
+
+    def setUp(self) -> None:
+        """Prepares Test Case.
+
+        Automate any preparation necessary before each Test Case executes.
+        """
+        super().setUp()
+        self._temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        RUN_CACHE.clear()
+
+    def tearDown(self) -> None:
+        """Cleanup after the Test Case."""
+        super().tearDown()
+        RUN_CACHE.clear()
+        self._temp_dir.cleanup()
+
+    def validate_results(self) -> Any:
+        """Overrides parent class method.  Verification is handled by other methods."""
+
+    def run_counting_test(self, exp_count: str, deterministic: bool = True,
+                          persistent_cache: PersistentCommandCache = None,
+                          input_files: list = None, exit_code: int = 0) -> None:
+        """Run the counting command in a fresh test object and expect exp_count executions."""
+        counter = os.path.join(self._temp_dir.name, 'counter')
+        test_obj = CountingFuncTest()
+        if persistent_cache:
+            test_obj.use_command_cache = False  # Simulate a new run
+            test_obj.persistent_cache = persistent_cache
+        test_obj.set_command_list(['sh', '-c',
+                                   f'echo x >> {counter}; wc -l < {counter}; exit {exit_code}'])
+        if input_files:
+            test_obj.declare_input_files(input_files)
+        test_obj.expect_stdout([exp_count])
+        test_obj.expect_exit_code(exit_code)
+        if not deterministic:
+            test_obj.mark_nondeterministic()
+        test_obj.run_test()
+
+    def make_persistent_cache(self, max_bytes: int = 1048576,
+                              cache_failures: bool = False) -> PersistentCommandCache:
+        """Create a PersistentCommandCache in the temporary directory."""
+        return PersistentCommandCache(os.path.join(self._temp_dir.name, 'cache'),
+                                      max_bytes=max_bytes, cache_failures=cache_failures)
+
+
+class NormalTestTFTCommandCache(TestTFTCommandCache):
+    """Normal Test Cases.
+
+    Organize the Normal Test Cases.
+    """
+
+    def test_normal_01(self):
+        """Identical commands execute once."""
+        self.run_counting_test('1')
+        self.run_counting_test('1')
+        self.assertEqual(RUN_CACHE.hits, 1)
+
+    def test_normal_02(self):
+        """Nondeterministic commands always execute."""
+        self.run_counting_test('1', deterministic=False)
+        self.run_counting_test('2', deterministic=False)
+        self.assertEqual(len(RUN_CACHE), 0)
+
+    def test_normal_03(self):
+        """Least recently used entries are evicted first."""
+        execution = CachedExecution('x' * 100, '', 0)
+        cache = CommandCache(max_bytes=400)
+        cache.put('one', execution)
+        cache.put('two', execution)
+        cache.get('one')
+        cache.put('three', execution)
+        self.assertIsNotNone(cache.get('one'))
+        self.assertIsNone(cache.get('two'))
+        self.assertLessEqual(cache.size, 400)
+
+
+class PersistentTestTFTCommandCache(TestTFTCommandCache):
+    """Normal Test Cases for the PersistentCommandCache.
+
+    Organize the Normal Test Cases.
+    """
+
+    def test_normal_04(self):
+        """Identical commands execute once across runs."""
+        cache = self.make_persistent_cache()
+        self.run_counting_test('1', persistent_cache=cache)
+        self.run_counting_test('1', persistent_cache=cache)
+
+    def test_normal_05(self):
+        """Changing a declared input file invalidates the cached results."""
+        cache = self.make_persistent_cache()
+        input_file = os.path.join(self._temp_dir.name, 'input.txt')
+        with open(input_file, 'w', encoding='utf-8') as out_file:
+            out_file.write('before')
+        self.run_counting_test('1', persistent_cache=cache, input_files=[input_file])
+        with open(input_file, 'w', encoding='utf-8') as out_file:
+            out_file.write('after')
+        self.run_counting_test('2', persistent_cache=cache, input_files=[input_file])
+
+    def test_normal_06(self):
+        """Least recently used entries are evicted to honor the size limit."""
+        cache = self.make_persistent_cache(max_bytes=250)
+        execution = CachedExecution('x' * 100, '', 0)
+        cache.put('one', execution)
+        cache.put('two', execution)
+        self.assertIsNone(cache.get('one'))
+        self.assertEqual(cache.get('two'), execution)
+
+    def test_normal_07(self):
+        """Failing commands are executed again by the next run."""
+        cache = self.make_persistent_cache()
+        self.run_counting_test('1', persistent_cache=cache, exit_code=1)
+        self.run_counting_test('2', persistent_cache=cache, exit_code=1)
+
+    def test_normal_08(self):
+        """Opt into reusing failing commands across runs."""
+        cache = self.make_persistent_cache(cache_failures=True)
+        self.run_counting_test('1', persistent_cache=cache, exit_code=1)
+        self.run_counting_test('1', persistent_cache=cache, exit_code=1)
+
+
+class BoundaryTestTFTCommandCache(TestTFTCommandCache):
+    """Boundary Test Cases.
+
+    Organize the Boundary Test Cases.
+    """
+
+    def test_boundary_01(self):
+        """Executions larger than the memory cap are never cached."""
+        cache = CommandCache(max_bytes=10)
+        cache.put('big', CachedExecution('x' * 100, '', 0))
+        self.assertEqual(len(cache), 0)
+
+
+class ErrorTestTFTCommandCache(TestTFTCommandCache):
+    """Error Test Cases.
+
+    Organize the Error Test Cases.
+    """
+
+    def test_error_01(self):
+        """Negative memory cap."""
+        with self.assertRaises(ValueError):
+            CommandCache(max_bytes=-1)
+
+    def test_error_02(self):
+        """Invalid cache_failures data type."""
+        with self.assertRaises(TypeError):
+            self.make_persistent_cache(cache_failures='yes')
+
+
+if __name__ == '__main__':
+    execute_test_cases()
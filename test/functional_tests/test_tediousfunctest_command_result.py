@@ -0,0 +1,156 @@
+"""Functionally test the CommandResult returned by TediousFuncTest.run_test().
+
+Run the test cases defined in this module using any of the example commands below:
+
+    Usage:
+    python -m unittest                                                   # Run *ALL* test cases
+    python -m unittest -k TestTFTCommandResult                           # Match this test class
+    python -m test.functional_tests                                      # Run all functional
+    python -m test.functional_tests.test_tediousfunctest_command_result  # Run just these tests
+"""
+
+# Standard Imports
+from typing import Any
+import os
+import pickle
+import signal
+# Third Party Imports
+# Local Imports
+from tediousstart.capture_mode import CaptureMode
+from tediousstart.command_cache import RUN_CACHE
+from tediousstart.command_result import CommandResult, OutputView, ResourceUsage
+from tediousstart.tediousfunctest import TediousFuncTest
+from tediousstart.tediousstart import execute_test_cases
+
+
+class TestTFTCommandResult(TediousFuncTest):
+    """TestTFTCommandResult functional test class.
+
+    This class provides base functionality to run NEBS functional tests for the CommandResult
+    returned by TediousFuncTest.run_test().
+    """
+
+    def setUp(self) -> None:
+        """Prepares Test Case.
+
+        Automate any preparation necessary before each Test Case executes.
+        """
+        super().setUp()
+        RUN_CACHE.clear()
+
+    def tearDown(self) -> None:
+        """Cleanup after the Test Case."""
+        super().tearDown()
+        RUN_CACHE.clear()
+
+    def validate_results(self) -> Any:
+        """Overrides parent class method.  Verification is handled by other methods."""
+
+
+class NormalTestTFTCommandResult(TestTFTCommandResult):
+    """Normal Test Cases.
+
+    Organize the Normal Test Cases.
+    """
+
+    def test_normal_01(self):
+        """The result describes the command execution."""
+        self.set_command_list(['echo', 'hello'])
+        self.expect_exit_code(0)
+        result = self.run_test()
+        self.assertIsInstance(result, CommandResult)
+        self.assertEqual(result.argv, ('echo', 'hello'))
+        self.assertEqual(result.exit_code, 0)
+        self.assertIsNone(result.signal)
+        self.assertFalse(result.cached)
+        self.assertGreaterEqual(result.duration, 0.0)
+
+    def test_normal_02(self):
+        """Output views support the in operator, len(), and str()."""
+        self.set_command_list(['echo', 'hello'])
+        result = self.run_test()
+        self.assertIsInstance(result.stdout, OutputView)
+        self.assertIn('hello', result.stdout)
+        self.assertEqual(len(result.stdout), len('hello\n'))
+        self.assertEqual(str(result.stdout), 'hello\n')
+        self.assertEqual(result.stderr, '')
+
+    def test_normal_03(self):
+        """Resource usage is measured where it is available."""
+        self.set_command_list(['echo', 'hello'])
+        result = self.run_test()
+        if os.name == 'posix':
+            self.assertIsInstance(result.rusage, ResourceUsage)
+            self.assertGreaterEqual(result.rusage.user_time, 0.0)
+
+
+class ErrorTestTFTCommandResult(TestTFTCommandResult):
+    """Error Test Cases.
+
+    Organize the Error Test Cases.
+    """
+
+    def test_error_01(self):
+        """Results can't be modified."""
+        self.set_command_list(['echo', 'hello'])
+        result = self.run_test()
+        with self.assertRaises(AttributeError):
+            result.exit_code = 1
+        with self.assertRaises(AttributeError):
+            del result.stdout
+
+    def test_error_02(self):
+        """Optional ctor arguments are keyword-only."""
+        with self.assertRaises(TypeError):
+            CommandResult(('echo',), 0, '', '', 1.0)  # pylint: disable=too-many-function-args
+
+
+class SpecialTestTFTCommandResult(TestTFTCommandResult):
+    """Special Test Cases.
+
+    Organize the Special Test Cases.
+    """
+
+    def test_special_01(self):
+        """Terminating signals are translated."""
+        self.set_command_list(['sh', '-c', 'kill -TERM $$'])
+        self.expect_exit_code(-signal.SIGTERM)
+        result = self.run_test()
+        self.assertEqual(result.signal, signal.SIGTERM)
+
+    def test_special_02(self):
+        """Results survive pickling."""
+        self.set_command_list(['echo', 'hello'])
+        result = self.run_test()
+        unpickled = pickle.loads(pickle.dumps(result))
+        self.assertEqual(unpickled.argv, result.argv)
+        self.assertEqual(unpickled.stdout, result.stdout)
+        self.assertEqual(unpickled.rusage, result.rusage)
+
+    def test_special_03(self):
+        """Cached results are flagged and carry no timings."""
+        self.use_command_cache = True
+        self.set_command_list(['echo', 'hello'])
+        first = self.run_test()
+        second = self.run_test()
+        self.assertFalse(first.cached)
+        self.assertTrue(second.cached)
+        self.assertIsNone(second.duration)
+        self.assertEqual(second.stdout, first.stdout)
+
+    def test_special_04(self):
+        """Results from every capture mode survive pickling, even output mapped with mmap."""
+        self.spool_max_size = 4  # Spill CaptureMode.SPOOL output to disk
+        for capture_mode in CaptureMode:
+            with self.subTest(capture_mode=capture_mode):
+                self.capture_mode = capture_mode
+                self.set_command_list(['echo', 'hello'])
+                result = self.run_test()
+                unpickled = pickle.loads(pickle.dumps(result))
+                self.assertEqual(unpickled.stdout, result.stdout)
+                self.assertEqual(str(unpickled.stdout), 'hello\n')
+                self.assertEqual(unpickled.exit_code, 0)
+
+
+if __name__ == '__main__':
+    execute_test_cases()
@@ -0,0 +1,151 @@
+"""Functionally test TediousFuncTest's ordered output expectations.
+
+Functionally test TediousFuncTest.expect_stdout_in_order() and expect_stderr_in_order() by
+executing commands that output log phases in a known order.
+
+Run the test cases defined in this module using any of the example commands below:
+
+    Usage:
+    python -m unittest                                             # Run *ALL* test cases
+    python -m unittest -k TestTFTInOrder                           # Match this test class
+    python -m test.functional_tests                                # Run all functional tests
+    python -m test.functional_tests.test_tediousfunctest_in_order  # Run just these tests
+"""
+
+# Standard Imports
+from typing import Any
+import sys
+# Third Party Imports
+# Local Imports
+from tediousstart.capture_mode import CaptureMode
+from tediousstart.tediousfunctest import TediousFuncTest
+from tediousstart.tediousstart import execute_test_cases
+
+
+PHASES_CMD = [sys.executable, '-c', "import sys\n"
+              "for phase in ('Loading', 'Parsing', 'Writing', 'Done'):\n"
+              "    print(f'phase: {phase}')\n"
+              "    print(f'log: {phase}', file=sys.stderr)"]
+
+
+class TestTFTInOrder(TediousFuncTest):
+    """TestTFTInOrder functional test class.
+
+    This class provides base functionality to run NEBS functional tests for
+    TediousFuncTest.expect_stdout_in_order() and expect_stderr_in_order().
+    """
+
+    def validate_results(self) -> Any:
+        """Overrides parent class method.  Verification is handled by other methods."""
+
+
+class NormalTestTFTInOrder(TestTFTInOrder):
+    """Normal Test Cases.
+
+    Organize the Normal Test Cases.
+    """
+
+    def test_normal_01(self):
+        """Phases appear in order."""
+        self.set_command_list(PHASES_CMD)
+        self.expect_stdout_in_order(['phase: Loading', 'phase: Parsing', 'phase: Done'])
+        self.expect_stderr_in_order(['log: Loading', 'log: Writing'])
+        self.run_test()
+
+    def test_normal_02(self):
+        """Several ordered sequences are checked independently."""
+        self.set_command_list(PHASES_CMD)
+        self.expect_stdout_in_order(['Loading', 'Done'])
+        self.expect_stdout_in_order(['Parsing', 'Writing'])
+        self.expect_stdout(['Loading'])
+        self.run_test()
+
+    def test_normal_03(self):
+        """Binary capture modes."""
+        for capture_mode in (CaptureMode.BYTES, CaptureMode.SPOOL, CaptureMode.MEMFD,
+                             CaptureMode.MERGED):
+            with self.subTest(capture_mode=capture_mode):
+                self.capture_mode = capture_mode
+                self.set_command_list(PHASES_CMD)
+                self.expect_stdout_in_order(['phase: Loading', 'phase: Done'])
+                self.run_test()
+
+
+class ErrorTestTFTInOrder(TestTFTInOrder):
+    """Error Test Cases.
+
+    Organize the Error Test Cases.
+    """
+
+    def test_error_01(self):
+        """The first out of order entry is reported."""
+        self.set_command_list(PHASES_CMD)
+        self.expect_stdout_in_order(['Loading', 'Writing', 'Parsing', 'Done'])
+        with self.assertRaisesRegex(AssertionError, 'Found Parsing in stdout out of order: '
+                                                    'expected it after Writing'):
+            self.run_test()
+
+    def test_error_02(self):
+        """A missing entry is reported."""
+        self.set_command_list(PHASES_CMD)
+        self.expect_stderr_in_order(['log: Loading', 'log: Crashing', 'log: Done'])
+        with self.assertRaisesRegex(AssertionError, 'Unable to locate log: Crashing in stderr'):
+            self.run_test()
+
+    def test_error_03(self):
+        """Bad data type."""
+        with self.assertRaisesRegex(AssertionError, 'output'):
+            self.expect_stdout_in_order('Loading')
+
+    def test_error_04(self):
+        """Contradictory expectations."""
+        self.set_command_list(PHASES_CMD)
+        self.expect_stdout_in_order(['Loading'])
+        self.verify_stdout_empty()
+        with self.assertRaisesRegex(AssertionError, 'Decide whether or not you want stdout'):
+            self.run_test()
+
+
+class BoundaryTestTFTInOrder(TestTFTInOrder):
+    """Boundary Test Cases.
+
+    Organize the Boundary Test Cases.
+    """
+
+    def test_boundary_01(self):
+        """Repeated entries must each be found after the previous one."""
+        self.set_command_list(['printf', 'tick\\ntick\\n'])
+        self.expect_stdout_in_order(['tick', 'tick'])
+        self.run_test()
+
+    def test_boundary_02(self):
+        """A repeated entry found only once."""
+        self.set_command_list(['printf', 'tick\\n'])
+        self.expect_stdout_in_order(['tick', 'tick'])
+        with self.assertRaisesRegex(AssertionError, 'Found tick in stdout out of order'):
+            self.run_test()
+
+    def test_boundary_03(self):
+        """Entries can not overlap."""
+        self.set_command_list(['printf', 'abc'])
+        self.expect_stdout_in_order(['ab', 'bc'])
+        with self.assertRaisesRegex(AssertionError, 'Found bc in stdout out of order'):
+            self.run_test()
+
+
+class SpecialTestTFTInOrder(TestTFTInOrder):
+    """Special Test Cases.
+
+    Organize the Special Test Cases.
+    """
+
+    def test_special_01(self):
+        """A long ordered sequence over a long output."""
+        self.set_command_list([sys.executable, '-c',
+                               "for num in range(100000): print(f'line {num}')"])
+        self.expect_stdout_in_order([f'line {num}\n' for num in range(0, 100000, 10)])
+        self.run_test()
+
+
+if __name__ == '__main__':
+    execute_test_cases()
@@ -0,0 +1,112 @@
+"""Functionally test TediousFuncTest's memfd-backed output capture.
+
+Functionally test TediousFuncTest.capture_mode = CaptureMode.MEMFD by executing commands that
+write straight to memfds (or, off Linux, temporary files) which are mapped once they exit.
+
+Run the test cases defined in this module using any of the example commands below:
+
+    Usage:
+    python -m unittest                                          # Run *ALL* test cases
+    python -m unittest -k TestTFTMemfd                          # Match this test class
+    python -m test.functional_tests                             # Run all functional tests
+    python -m test.functional_tests.test_tediousfunctest_memfd  # Run just these tests
+"""
+
+# Standard Imports
+from typing import Any
+import mmap
+import sys
+# Third Party Imports
+# Local Imports
+from tediousstart.binary_output import BinaryOutput
+from tediousstart.capture_mode import CaptureMode
+from tediousstart.tediousfunctest import TediousFuncTest
+from tediousstart.tediousstart import execute_test_cases
+
+
+# pylint: disable=protected-access
+class TestTFTMemfd(TediousFuncTest):
+    """TestTFTMemfd functional test class.
+
+    This class provides base functionality to run NEBS functional tests for
+    TediousFuncTest.capture_mode = CaptureMode.MEMFD.
+    """
+
+    capture_mode = CaptureMode.MEMFD
+
+    def validate_results(self) -> Any:
+        """Overrides parent class method.  Verification is handled by other methods."""
+
+
+class NormalTestTFTMemfd(TestTFTMemfd):
+    """Normal Test Cases.
+
+    Organize the Normal Test Cases.
+    """
+
+    def test_normal_01(self):
+        """Output is mapped and searched in place."""
+        self.set_command_list([sys.executable, '-c', "print('x' * 100000); print('Done')"])
+        self.expect_stdout(['Done'])
+        self.verify_stdout_missing(['Not Done'])
+        self.verify_stderr_empty()
+        self.run_test()
+        self.assertIsInstance(self._raw_stdout, BinaryOutput)
+        self.assertIsInstance(self._raw_stdout._buffer, mmap.mmap)
+        self.assertEqual(len(self._raw_stdout), 100006)
+
+    def test_normal_02(self):
+        """Both streams and the exit code are captured."""
+        self.set_command_list([sys.executable, '-c', "import sys; print('out'); "
+                               "print('err', file=sys.stderr); sys.exit(3)"])
+        self.expect_stdout(['out'])
+        self.expect_stderr(['err'])
+        self.expect_exit_code(3)
+        self.run_test()
+
+
+class ErrorTestTFTMemfd(TestTFTMemfd):
+    """Error Test Cases.
+
+    Organize the Error Test Cases.
+    """
+
+    def test_error_01(self):
+        """Missing output is reported."""
+        self.set_command_list(['echo', 'hello'])
+        self.expect_stdout(['goodbye'])
+        with self.assertRaisesRegex(AssertionError, 'Unable to locate goodbye in stdout'):
+            self.run_test()
+
+
+class BoundaryTestTFTMemfd(TestTFTMemfd):
+    """Boundary Test Cases.
+
+    Organize the Boundary Test Cases.
+    """
+
+    def test_boundary_01(self):
+        """No output at all."""
+        self.set_command_list(['true'])
+        self.verify_stdout_empty()
+        self.verify_stderr_empty()
+        self.run_test()
+        self.assertEqual(self._raw_stdout, '')
+
+
+class SpecialTestTFTMemfd(TestTFTMemfd):
+    """Special Test Cases.
+
+    Organize the Special Test Cases.
+    """
+
+    def test_special_01(self):
+        """Non-ASCII output is matched by encoding the expectation."""
+        self.set_command_list([sys.executable, '-c',
+                               "import sys; sys.stdout.buffer.write('café ☃'.encode())"])
+        self.expect_stdout(['café ☃'])
+        self.run_test()
+
+
+if __name__ == '__main__':
+    execute_test_cases()
@@ -0,0 +1,154 @@
+"""Functionally test TediousFuncTest's merged, timestamped output capture.
+
+Functionally test TediousFuncTest.capture_mode = CaptureMode.MERGED and
+TediousFuncTest.expect_output_order() by executing commands that interleave stdout and stderr.
+
+Run the test cases defined in this module using any of the example commands below:
+
+    Usage:
+    python -m unittest                                           # Run *ALL* test cases
+    python -m unittest -k TestTFTMerged                          # Match this test class
+    python -m test.functional_tests                              # Run all functional tests
+    python -m test.functional_tests.test_tediousfunctest_merged  # Run just these tests
+"""
+
+# Standard Imports
+from typing import Any
+import pickle
+import sys
+# Third Party Imports
+# Local Imports
+from tediousstart.capture_mode import CaptureMode
+from tediousstart.tediousfunctest import TediousFuncTest
+from tediousstart.tediousstart import execute_test_cases
+
+
+# Output from different streams is only ordered once it is read, so pause between writes
+INTERLEAVED_CMD = [sys.executable, '-c', "import os, time\n"
+                   "os.write(1, b'Starting\\n')\n"
+                   "time.sleep(0.1)\n"
+                   "os.write(2, b'WARNING: disk nearly full\\n')\n"
+                   "time.sleep(0.1)\n"
+                   "os.write(1, b'Summary: 3 files\\n')"]
+
+
+class TestTFTMerged(TediousFuncTest):
+    """TestTFTMerged functional test class.
+
+    This class provides base functionality to run NEBS functional tests for
+    TediousFuncTest.capture_mode = CaptureMode.MERGED.
+    """
+
+    capture_mode = CaptureMode.MERGED
+
+    def validate_results(self) -> Any:
+        """Overrides parent class method.  Verification is handled by other methods."""
+
+
+class NormalTestTFTMerged(TestTFTMerged):
+    """Normal Test Cases.
+
+    Organize the Normal Test Cases.
+    """
+
+    def test_normal_01(self):
+        """A stderr warning appears before the stdout summary."""
+        self.set_command_list(INTERLEAVED_CMD)
+        self.expect_stdout(['Summary: 3 files'])
+        self.expect_stderr(['WARNING'])
+        self.expect_output_order([('stdout', 'Starting'), ('stderr', 'WARNING'),
+                                  ('stdout', 'Summary')])
+        self.run_test()
+
+    def test_normal_02(self):
+        """The merged view interleaves both streams as they arrived."""
+        self.set_command_list(INTERLEAVED_CMD)
+        result = self.run_test()
+        self.assertEqual(str(result.merged),
+                         'Starting\nWARNING: disk nearly full\nSummary: 3 files\n')
+        self.assertEqual(str(result.stdout), 'Starting\nSummary: 3 files\n')
+
+    def test_normal_03(self):
+        """Chunks are tagged with their stream and timestamped in arrival order."""
+        self.set_command_list(INTERLEAVED_CMD)
+        result = self.run_test()
+        chunks = list(result.chunk_log.chunks())
+        self.assertEqual([chunk.stream_name for chunk in chunks], ['stdout', 'stderr', 'stdout'])
+        self.assertEqual([chunk.timestamp for chunk in chunks],
+                         sorted(chunk.timestamp for chunk in chunks))
+
+    def test_normal_04(self):
+        """Results, including the chunk log, pickle."""
+        self.set_command_list(INTERLEAVED_CMD)
+        result = pickle.loads(pickle.dumps(self.run_test()))
+        self.assertIn('WARNING', result.merged)
+        self.assertEqual(len(result.chunk_log), 3)
+
+
+class ErrorTestTFTMerged(TestTFTMerged):
+    """Error Test Cases.
+
+    Organize the Error Test Cases.
+    """
+
+    def test_error_01(self):
+        """Out of order output."""
+        self.set_command_list(INTERLEAVED_CMD)
+        self.expect_output_order([('stdout', 'Summary'), ('stderr', 'WARNING')])
+        with self.assertRaisesRegex(AssertionError,
+                                    'Expected WARNING in stderr after Summary in stdout'):
+            self.run_test()
+
+    def test_error_02(self):
+        """Missing ordered output."""
+        self.set_command_list(INTERLEAVED_CMD)
+        self.expect_output_order([('stderr', 'ERROR'), ('stdout', 'Summary')])
+        with self.assertRaisesRegex(AssertionError, 'Unable to locate ERROR in stderr'):
+            self.run_test()
+
+    def test_error_03(self):
+        """Ordering requires CaptureMode.MERGED."""
+        self.capture_mode = CaptureMode.BYTES
+        self.set_command_list(INTERLEAVED_CMD)
+        self.expect_output_order([('stderr', 'WARNING'), ('stdout', 'Summary')])
+        with self.assertRaisesRegex(AssertionError, 'requires capture_mode = CaptureMode.MERGED'):
+            self.run_test()
+
+    def test_error_04(self):
+        """Bad entries."""
+        for entries in ([], [('stdin', 'text')], ['stdout'], [('stdout', '')]):
+            with self.subTest(entries=entries):
+                with self.assertRaises(AssertionError):
+                    self.expect_output_order(entries)
+
+
+class BoundaryTestTFTMerged(TestTFTMerged):
+    """Boundary Test Cases.
+
+    Organize the Boundary Test Cases.
+    """
+
+    def test_boundary_01(self):
+        """No output at all."""
+        self.set_command_list(['true'])
+        self.verify_stdout_empty()
+        result = self.run_test()
+        self.assertEqual(len(result.chunk_log), 0)
+        self.assertEqual(len(result.merged), 0)
+
+    def test_boundary_02(self):
+        """One entry is trivially in order."""
+        self.set_command_list(INTERLEAVED_CMD)
+        self.expect_output_order([('stderr', 'WARNING')])
+        self.run_test()
+
+    def test_boundary_03(self):
+        """The same entry twice is not in order."""
+        self.set_command_list(INTERLEAVED_CMD)
+        self.expect_output_order([('stdout', 'Starting'), ('stdout', 'Starting')])
+        with self.assertRaisesRegex(AssertionError, 'Expected Starting in stdout after'):
+            self.run_test()
+
+
+if __name__ == '__main__':
+    execute_test_cases()
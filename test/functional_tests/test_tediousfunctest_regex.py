@@ -0,0 +1,135 @@
+"""Functionally test TediousFuncTest's regular expression output expectations.
+
+Functionally test TediousFuncTest.expect_stdout_regex(), verify_stdout_regex_missing(),
+expect_stderr_regex(), and verify_stderr_regex_missing().
+
+Run the test cases defined in this module using any of the example commands below:
+
+    Usage:
+    python -m unittest                                          # Run *ALL* test cases
+    python -m unittest -k TestTFTRegex                          # Match this test class
+    python -m test.functional_tests                             # Run all functional tests
+    python -m test.functional_tests.test_tediousfunctest_regex  # Run just these tests
+"""
+
+# Standard Imports
+from typing import Any
+import re
+import sys
+# Third Party Imports
+# Local Imports
+from tediousstart.capture_mode import CaptureMode
+from tediousstart.tediousfunctest import TediousFuncTest
+from tediousstart.tediousstart import execute_test_cases
+
+
+TIMING_CMD = [sys.executable, '-c', "import sys\n"
+              "print('Loaded 3 files')\n"
+              "print('query took 12 ms')\n"
+              "print('WARNING: cache cold', file=sys.stderr)"]
+
+
+class TestTFTRegex(TediousFuncTest):
+    """TestTFTRegex functional test class.
+
+    This class provides base functionality to run NEBS functional tests for TediousFuncTest's
+    regular expression expectations.
+    """
+
+    def validate_results(self) -> Any:
+        """Overrides parent class method.  Verification is handled by other methods."""
+
+
+class NormalTestTFTRegex(TestTFTRegex):
+    """Normal Test Cases.
+
+    Organize the Normal Test Cases.
+    """
+
+    def test_normal_01(self):
+        """Patterns match."""
+        self.set_command_list(TIMING_CMD)
+        self.expect_stdout_regex([r'took \d+ ms', r'^Loaded \d+ files$'], flags=re.MULTILINE)
+        self.verify_stdout_regex_missing([r'took \d+ s\b'])
+        self.expect_stderr_regex(['warning: cache'], flags=re.IGNORECASE)
+        self.verify_stderr_regex_missing(['ERROR'])
+        self.run_test()
+
+    def test_normal_02(self):
+        """Literal and regex expectations combined."""
+        self.set_command_list(TIMING_CMD)
+        self.expect_stdout(['Loaded'])
+        self.verify_stdout_missing(['Failed'])
+        self.expect_stdout_regex([r'\d+ ms'])
+        self.run_test()
+
+    def test_normal_03(self):
+        """Binary capture modes."""
+        for capture_mode in (CaptureMode.BYTES, CaptureMode.SPOOL, CaptureMode.MEMFD,
+                             CaptureMode.MERGED):
+            with self.subTest(capture_mode=capture_mode):
+                self.capture_mode = capture_mode
+                self.set_command_list(TIMING_CMD)
+                self.expect_stdout_regex([r'took \d+ ms'])
+                self.verify_stderr_regex_missing([r'ERROR \d+'])
+                self.run_test()
+
+
+class ErrorTestTFTRegex(TestTFTRegex):
+    """Error Test Cases.
+
+    Organize the Error Test Cases.
+    """
+
+    def test_error_01(self):
+        """Pattern doesn't match."""
+        self.set_command_list(TIMING_CMD)
+        self.expect_stdout_regex([r'took \d+ s\b'])
+        with self.assertRaisesRegex(AssertionError, r'Unable to match took \\d\+ s\\b in stdout'):
+            self.run_test()
+
+    def test_error_02(self):
+        """Excluded pattern matches."""
+        self.set_command_list(TIMING_CMD)
+        self.verify_stderr_regex_missing(['WARN(ING)?'])
+        with self.assertRaisesRegex(AssertionError, 'Found excluded pattern WARN'):
+            self.run_test()
+
+    def test_error_03(self):
+        """Literal failures are still reported alongside regex expectations."""
+        self.set_command_list(TIMING_CMD)
+        self.expect_stdout(['Not Loaded'])
+        self.expect_stdout_regex([r'took \d+ ms'])
+        with self.assertRaisesRegex(AssertionError, 'Unable to locate Not Loaded in stdout'):
+            self.run_test()
+
+    def test_error_04(self):
+        """Invalid pattern."""
+        with self.assertRaisesRegex(AssertionError, 'Invalid regular expression'):
+            self.expect_stdout_regex(['(unbalanced'])
+
+    def test_error_05(self):
+        """Bad data types."""
+        with self.assertRaisesRegex(AssertionError, 'flags'):
+            self.expect_stdout_regex(['pattern'], flags='I')
+        with self.assertRaises(AssertionError):
+            self.verify_stderr_regex_missing('pattern')
+
+
+class SpecialTestTFTRegex(TestTFTRegex):
+    """Special Test Cases.
+
+    Organize the Special Test Cases.
+    """
+
+    def test_special_01(self):
+        """Contradictory expectations."""
+        self.set_command_list(TIMING_CMD)
+        self.expect_stdout_regex([r'\d+'])
+        self.verify_stdout_empty()
+        with self.assertRaisesRegex(AssertionError, 'Decide whether or not you want stdout'):
+            self.run_test()
+
+
+if __name__ == '__main__':
+    execute_test_cases()
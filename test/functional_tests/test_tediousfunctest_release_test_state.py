@@ -0,0 +1,129 @@
+"""Functionally test TediousFuncTest's release of per-test state.
+
+Functionally test the TediousStart.release_test_state attribute by running a suite of test cases
+that each capture a large amount of stdout.  Once each test case finishes, its captured output
+must be released so peak memory does not grow with the size of the suite.
+
+Run the test cases defined in this module using any of the example commands below:
+
+    Usage:
+    python -m unittest                                                       # Run *ALL* tests
+    python -m unittest -k TestTFTReleaseTestState                            # Match this class
+    python -m test.functional_tests                                          # Run functional
+    python -m test.functional_tests.test_tediousfunctest_release_test_state  # Run just these
+"""
+
+# Standard Imports
+from typing import Any
+import tracemalloc
+import unittest
+# Third Party Imports
+# Local Imports
+from tediousstart.tediousfunctest import TediousFuncTest
+from tediousstart.tediousstart import execute_test_cases
+
+
+OUTPUT_SIZE = 2 * 1024 * 1024  # Number of characters each inner test case prints
+SUITE_SIZE = 16                # Number of inner test cases in the suite
+
+
+def make_inner_test_class(release_test_state: bool) -> type:
+    """Create a test class whose test case prints OUTPUT_SIZE characters and validates them.
+
+    The class is created on demand so it isn't collected as part of the test suite.
+    """
+
+    class InnerTestCase(TediousFuncTest):
+        """Captures OUTPUT_SIZE characters of stdout."""
+
+        def validate_results(self) -> Any:
+            """Overrides parent class method.  Verification is handled by other methods."""
+
+        def test_output(self):
+            """Capture OUTPUT_SIZE characters of stdout."""
+            self.set_command_list(['python3', '-c', f'print("x" * {OUTPUT_SIZE}, end="")'])
+            self.expect_stdout(['xxx'])
+            self.run_test()
+
+    InnerTestCase.release_test_state = release_test_state
+    return InnerTestCase
+
+
+class TestTFTReleaseTestState(TediousFuncTest):
+    """TestTFTReleaseTestState functional test class.
+
+    This class provides base functionality to run NEBS functional tests for
+    TediousStart.release_test_state.
+    """
+
+    def validate_results(self) -> Any:
+        """Overrides parent class method.  Verification is handled by other methods."""
+
+    def run_suite(self, release_test_state: bool) -> tuple:
+        """Run SUITE_SIZE inner test cases and measure the peak memory.
+
+        The suite keeps a reference to every test case (as unittest does by default).
+
+        Returns:
+            A tuple containing the list of test case objects, the unittest.TestResult, and the
+            peak traced memory, in bytes.
+        """
+        # LOCAL VARIABLES
+        test_class = make_inner_test_class(release_test_state)          # Inner test class
+        tests = [test_class('test_output') for _ in range(SUITE_SIZE)]  # Test case objects
+        result = unittest.TestResult()                                  # Test results
+        peak = 0                                                        # Peak memory
+
+        # RUN IT
+        tracemalloc.start()
+        try:
+            for test in tests:
+                test.run(result)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        # DONE
+        return tests, result, peak
+
+
+class NormalTestTFTReleaseTestState(TestTFTReleaseTestState):
+    """Normal Test Cases.
+
+    Organize the Normal Test Cases.
+    """
+
+    def test_normal_01(self):
+        """Captured output is released and summarized."""
+        tests, result, _ = self.run_suite(release_test_state=True)
+        self.assertTrue(result.wasSuccessful())
+        # pylint: disable=protected-access
+        for test in tests:
+            self.assertEqual(test._raw_stdout, '')
+            self.assertEqual(test.test_summary.output_size, OUTPUT_SIZE)
+            self.assertEqual(test.test_summary.failure_count, 0)
+        # pylint: enable=protected-access
+
+    def test_normal_02(self):
+        """Peak memory stays flat as the suite grows."""
+        peak = self.run_suite(release_test_state=True)[2]
+        self.assertLess(peak, OUTPUT_SIZE * SUITE_SIZE / 3)
+
+
+class SpecialTestTFTReleaseTestState(TestTFTReleaseTestState):
+    """Special Test Cases.
+
+    Organize the Special Test Cases.
+    """
+
+    def test_special_01(self):
+        """Opt out of releasing per-test state."""
+        tests = self.run_suite(release_test_state=False)[0]
+        # pylint: disable=protected-access
+        self.assertEqual(len(tests[-1]._raw_stdout), OUTPUT_SIZE)
+        # pylint: enable=protected-access
+        self.assertIsNone(tests[-1].test_summary)
+
+
+if __name__ == '__main__':
+    execute_test_cases()
@@ -0,0 +1,214 @@
+"""Functionally test TediousFuncTest's RetryPolicy support.
+
+Functionally test TediousFuncTest.set_retry_policy(), the retry_policy class attribute, and the
+global retry policy by executing commands that fail a set number of times before passing.
+
+Run the test cases defined in this module using any of the example commands below:
+
+    Usage:
+    python -m unittest                                          # Run *ALL* test cases
+    python -m unittest -k TestTFTRetry                          # Match this test class
+    python -m test.functional_tests                             # Run all functional tests
+    python -m test.functional_tests.test_tediousfunctest_retry  # Run just these tests
+"""
+
+# Standard Imports
+from typing import Any
+import os
+import tempfile
+# Third Party Imports
+# Local Imports
+from tediousstart.retry_policy import (RETRY_HISTORY, RetryPolicy, get_global_retry_policy,
+                                       set_global_retry_policy)
+from tediousstart.tediousfunctest import TediousFuncTest
+from tediousstart.tediousstart import execute_test_cases
+
+
+class TestTFTRetry(TediousFuncTest):
+    """TestTFTRetry functional test class.
+
+    This class provides base functionality to run NEBS functional tests for TediousFuncTest
+    retry policies.
+    """
+
+    # CORE CLASS METHODS
+    def __init__(self, *args, **kwargs) -> None:
+        """TestTFTRetry ctor.
+
+        TestTFTRetry constructor.  Initializes attributes after constructing the parent
+        object.
+
+        Args:
+            args: Arguments to pass to the parent class ctor
+            kwargs: Keyword arguments to pass to the parent class ctor
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        super().__init__(*args, **kwargs)
+
+        self._temp_dir = None  # TemporaryDirectory holding the attempt counter file
+
+    def setUp(self) -> None:
+        """Prepares Test Case.
+
+        Automate any preparation necessary before each Test Case executes.
+        """
+        super().setUp()
+        self._temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+
+    def tearDown(self) -> None:
+        """Cleanup after the Test Case."""
+        super().tearDown()
+        self._temp_dir.cleanup()
+
+    def validate_results(self) -> Any:
+        """Overrides parent class method.  Verification is handled by other methods."""
+
+    def set_flaky_command(self, num_failures: int) -> None:
+        """Execute a command that exits 1 for the first num_failures executions."""
+        counter = os.path.join(self._temp_dir.name, 'counter')
+        self.set_command_list(['sh', '-c', f'echo x >> {counter}; '
+                               f'if [ $(wc -l < {counter}) -gt {num_failures} ]; '
+                               'then echo PASS; else echo FAIL; exit 1; fi'])
+        self.expect_stdout(['PASS'])
+        self.expect_exit_code(0)
+
+
+class NormalTestTFTRetry(TestTFTRetry):
+    """Normal Test Cases.
+
+    Organize the Normal Test Cases.
+    """
+
+    def test_normal_01(self):
+        """Test case policy; passes on the second attempt and is reported as flaky."""
+        self.set_flaky_command(num_failures=1)
+        self.set_retry_policy(RetryPolicy(max_retries=1))
+        self.run_test()
+        self.assertTrue(RETRY_HISTORY.is_flaky(self.id()))
+        self.assertEqual(RETRY_HISTORY.summary(self.id()), (1, 1))
+
+    def test_normal_02(self):
+        """Passes on the first attempt; not flaky."""
+        self.set_flaky_command(num_failures=0)
+        self.set_retry_policy(RetryPolicy(max_retries=3))
+        self.run_test()
+        self.assertFalse(RETRY_HISTORY.is_flaky(self.id()))
+        self.assertEqual(RETRY_HISTORY.summary(self.id()), (1, 0))
+
+    def test_normal_03(self):
+        """Global policy applies when no narrower policy exists."""
+        old_policy = get_global_retry_policy()
+        set_global_retry_policy(RetryPolicy(max_retries=2))
+        try:
+            self.set_flaky_command(num_failures=2)
+            self.run_test()
+        finally:
+            set_global_retry_policy(old_policy)
+        self.assertEqual(RETRY_HISTORY.summary(self.id()), (1, 2))
+
+
+class ClassPolicyTestTFTRetry(TestTFTRetry):
+    """Normal Test Cases for the class-wide retry policy.
+
+    Organize the Normal Test Cases.
+    """
+
+    retry_policy = RetryPolicy(max_retries=2)
+
+    def test_normal_04(self):
+        """Class policy; passes on the third attempt."""
+        self.set_flaky_command(num_failures=2)
+        self.run_test()
+        self.assertTrue(RETRY_HISTORY.is_flaky(self.id()))
+
+
+class FailingValidationTestTFTRetry(TestTFTRetry):
+    """Test Cases for validate_results() overrides that call self.fail().
+
+    Organize the Normal and Error Test Cases.
+    """
+
+    def validate_results(self) -> Any:
+        """Fail the attempt, with self.fail(), if the command printed FAIL."""
+        if 'FAIL' in self._raw_stdout:
+            self.fail('validate_results() found FAIL')
+
+    def set_flaky_output(self, num_failures: int) -> None:
+        """Execute a command that succeeds but prints FAIL for the first num_failures times."""
+        counter = os.path.join(self._temp_dir.name, 'counter')
+        self.set_command_list(['sh', '-c', f'echo x >> {counter}; '
+                               f'if [ $(wc -l < {counter}) -gt {num_failures} ]; '
+                               'then echo PASS; else echo FAIL; fi'])
+
+    def test_normal_05(self):
+        """A self.fail() in validate_results() is retried like any other failure."""
+        self.set_flaky_output(num_failures=1)
+        self.set_retry_policy(RetryPolicy(max_retries=1))
+        self.run_test()
+        self.assertTrue(RETRY_HISTORY.is_flaky(self.id()))
+        self.assertEqual(RETRY_HISTORY.summary(self.id()), (1, 1))
+
+    def test_error_04(self):
+        """Retries exhausted; the last attempt's self.fail() is raised."""
+        self.set_flaky_output(num_failures=5)
+        self.set_retry_policy(RetryPolicy(max_retries=2))
+        with self.assertRaisesRegex(AssertionError, r'validate_results\(\) found FAIL'):
+            self.run_test()
+        self.assertEqual(RETRY_HISTORY.summary(self.id()), (0, 3))
+
+
+class ErrorTestTFTRetry(TestTFTRetry):
+    """Error Test Cases.
+
+    Organize the Error Test Cases.
+    """
+
+    def test_error_01(self):
+        """Retries exhausted; the test case fails."""
+        self.set_flaky_command(num_failures=5)
+        self.set_retry_policy(RetryPolicy(max_retries=2))
+        with self.assertRaises(AssertionError):
+            self.run_test()
+        self.assertEqual(RETRY_HISTORY.summary(self.id()), (0, 3))
+
+    def test_error_02(self):
+        """Bad data type."""
+        with self.assertRaisesRegex(AssertionError, 'TEST CASE ERROR'):
+            self.set_retry_policy(2)
+
+    def test_error_03(self):
+        """Negative max_retries."""
+        with self.assertRaises(ValueError):
+            RetryPolicy(max_retries=-1)
+
+
+class BoundaryTestTFTRetry(TestTFTRetry):
+    """Boundary Test Cases.
+
+    Organize the Boundary Test Cases.
+    """
+
+    def test_boundary_01(self):
+        """Exhausted budget; no retries are attempted."""
+        policy = RetryPolicy(max_retries=5, budget=0.0)
+        self.set_flaky_command(num_failures=1)
+        self.set_retry_policy(policy)
+        with self.assertRaises(AssertionError):
+            self.run_test()
+        self.assertEqual(RETRY_HISTORY.summary(self.id()), (0, 1))
+
+    def test_boundary_02(self):
+        """Zero retries behaves like no policy at all."""
+        self.set_flaky_command(num_failures=1)
+        self.set_retry_policy(RetryPolicy(max_retries=0))
+        with self.assertRaises(AssertionError):
+            self.run_test()
+
+
+if __name__ == '__main__':
+    execute_test_cases()
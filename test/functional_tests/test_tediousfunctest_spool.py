@@ -0,0 +1,151 @@
+"""Functionally test TediousFuncTest's spill-to-disk output capture.
+
+Functionally test the TediousFuncTest.capture_mode, spool_max_size, and spool_dir attributes by
+executing commands whose output exceeds the in-memory spool size.
+
+Run the test cases defined in this module using any of the example commands below:
+
+    Usage:
+    python -m unittest                                          # Run *ALL* test cases
+    python -m unittest -k TestTFTSpool                          # Match this test class
+    python -m test.functional_tests                             # Run all functional tests
+    python -m test.functional_tests.test_tediousfunctest_spool  # Run just these tests
+"""
+
+# Standard Imports
+from typing import Any
+import mmap
+import sys
+import tempfile
+# Third Party Imports
+# Local Imports
+from tediousstart.binary_output import BinaryOutput
+from tediousstart.capture_mode import CaptureMode
+from tediousstart.tediousfunctest import TediousFuncTest
+from tediousstart.tediousstart import execute_test_cases
+
+
+BIG_OUTPUT_CMD = [sys.executable, '-c', "print('x' * 100000); print('Done')"]
+
+
+# pylint: disable=protected-access
+class TestTFTSpool(TediousFuncTest):
+    """TestTFTSpool functional test class.
+
+    This class provides base functionality to run NEBS functional tests for
+    TediousFuncTest.capture_mode = CaptureMode.SPOOL.
+    """
+
+    capture_mode = CaptureMode.SPOOL
+    spool_max_size = 1024
+    _temp_dir = None  # TemporaryDirectory spilled to
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Prepares the Test Class.
+
+        Spills output to a temporary directory.
+        """
+        super().setUpClass()
+        cls._temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        cls.spool_dir = cls._temp_dir.name
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Cleanup after the Test Class."""
+        super().tearDownClass()
+        cls._temp_dir.cleanup()
+
+    def validate_results(self) -> Any:
+        """Overrides parent class method.  Verification is handled by other methods."""
+
+
+class NormalTestTFTSpool(TestTFTSpool):
+    """Normal Test Cases.
+
+    Organize the Normal Test Cases.
+    """
+
+    def test_normal_01(self):
+        """Spilled output is searched through mmap."""
+        self.set_command_list(BIG_OUTPUT_CMD)
+        self.expect_stdout(['Done'])
+        self.verify_stdout_missing(['Not Done'])
+        self.verify_stderr_empty()
+        self.run_test()
+        self.assertIsInstance(self._raw_stdout, BinaryOutput)
+        self.assertIsInstance(self._raw_stdout._buffer, mmap.mmap)
+        self.assertEqual(len(self._raw_stdout), 100006)
+
+    def test_normal_02(self):
+        """Small output stays in memory."""
+        self.set_command_list(['echo', 'hello'])
+        self.expect_stdout(['hello'])
+        self.expect_exit_code(0)
+        self.run_test()
+        self.assertIsInstance(self._raw_stdout._buffer, bytes)
+
+    def test_normal_03(self):
+        """Both streams are pumped."""
+        self.set_command_list([sys.executable, '-c', "import sys; print('x' * 100000); "
+                               "print('y' * 100000, file=sys.stderr); sys.exit(3)"])
+        self.expect_stdout(['x' * 100000])
+        self.expect_stderr(['y' * 100000])
+        self.expect_exit_code(3)
+        self.run_test()
+
+
+class ErrorTestTFTSpool(TestTFTSpool):
+    """Error Test Cases.
+
+    Organize the Error Test Cases.
+    """
+
+    def test_error_01(self):
+        """Missing output is reported."""
+        self.set_command_list(BIG_OUTPUT_CMD)
+        self.expect_stdout(['Not Found'])
+        with self.assertRaisesRegex(AssertionError, 'Unable to locate Not Found in stdout'):
+            self.run_test()
+
+    def test_error_02(self):
+        """Bad capture_mode data type."""
+        self.capture_mode = 'spool'
+        self.set_command_list(['echo', 'hello'])
+        with self.assertRaisesRegex(AssertionError, 'capture_mode'):
+            self.run_test()
+
+
+class BoundaryTestTFTSpool(TestTFTSpool):
+    """Boundary Test Cases.
+
+    Organize the Boundary Test Cases.
+    """
+
+    def test_boundary_01(self):
+        """A spool_max_size of 0 spills even the smallest output."""
+        self.spool_max_size = 0
+        self.set_command_list(['echo', 'hello'])
+        self.expect_stdout(['hello'])
+        self.verify_stderr_empty()
+        self.run_test()
+        self.assertIsInstance(self._raw_stdout._buffer, mmap.mmap)
+        self.assertEqual(self._raw_stderr, '')
+
+
+class SpecialTestTFTSpool(TestTFTSpool):
+    """Special Test Cases.
+
+    Organize the Special Test Cases.
+    """
+
+    def test_special_01(self):
+        """Non-ASCII output is matched by encoding the expectation."""
+        self.set_command_list([sys.executable, '-c',
+                               "import sys; sys.stdout.buffer.write('café ☃'.encode())"])
+        self.expect_stdout(['café ☃'])
+        self.run_test()
+
+
+if __name__ == '__main__':
+    execute_test_cases()
@@ -0,0 +1,180 @@
+"""Functionally test TediousFuncTest's live output tee.
+
+Functionally test the TediousFuncTest.tee_output and tee_flush_interval attributes by executing
+commands whose output is forwarded to a log file, or stream, while it is captured.
+
+Run the test cases defined in this module using any of the example commands below:
+
+    Usage:
+    python -m unittest                                        # Run *ALL* test cases
+    python -m unittest -k TestTFTTee                          # Match this test class
+    python -m test.functional_tests                           # Run all functional tests
+    python -m test.functional_tests.test_tediousfunctest_tee  # Run just these tests
+"""
+
+# Standard Imports
+from typing import Any
+import io
+import os
+import resource
+import sys
+import tempfile
+# Third Party Imports
+# Local Imports
+from tediousstart.capture_mode import CaptureMode
+from tediousstart.tediousfunctest import TediousFuncTest
+from tediousstart.tediousstart import execute_test_cases
+
+
+COUNT_CMD = [sys.executable, '-c', "import sys\nfor num in range(1000):\n"
+             "    print(f'out {num}', flush=True)\n    print(f'err {num}', file=sys.stderr)"]
+
+
+class TestTFTTee(TediousFuncTest):
+    """TestTFTTee functional test class.
+
+    This class provides base functionality to run NEBS functional tests for
+    TediousFuncTest.tee_output.  Each test case tees to its own log file.
+    """
+
+    _temp_dir = None  # TemporaryDirectory holding the log file
+
+    def setUp(self) -> None:
+        """Prepares the test case.  Tees to a log file."""
+        super().setUp()
+        self._temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.tee_output = os.path.join(self._temp_dir.name, 'tee.log')
+
+    def tearDown(self) -> None:
+        """Cleanup after the test case."""
+        super().tearDown()
+        self._temp_dir.cleanup()
+
+    def read_log(self) -> str:
+        """Read the log file."""
+        with open(self.tee_output, 'r', encoding='utf-8') as in_file:
+            return in_file.read()
+
+    def validate_results(self) -> Any:
+        """Overrides parent class method.  Verification is handled by other methods."""
+
+
+class NormalTestTFTTee(TestTFTTee):
+    """Normal Test Cases.
+
+    Organize the Normal Test Cases.
+    """
+
+    def test_normal_01(self):
+        """Output is both captured and forwarded to the log file."""
+        self.set_command_list(['echo', 'hello'])
+        self.expect_stdout(['hello'])
+        self.verify_stderr_empty()
+        self.run_test()
+        self.assertEqual(self.read_log(), 'hello\n')
+        self.assertIsInstance(self._raw_stdout, str)
+
+    def test_normal_02(self):
+        """Lines within a stream are never reordered or spliced."""
+        self.set_command_list(COUNT_CMD)
+        self.expect_stdout(['out 0\n', 'out 999\n'])
+        self.expect_stderr(['err 0\n', 'err 999\n'])
+        self.run_test()
+        log_lines = self.read_log().splitlines()
+        self.assertEqual(len(log_lines), 2000)
+        self.assertEqual([line for line in log_lines if line.startswith('out')],
+                         [f'out {num}' for num in range(1000)])
+        self.assertEqual([line for line in log_lines if line.startswith('err')],
+                         [f'err {num}' for num in range(1000)])
+
+    def test_normal_03(self):
+        """Tee to a stream."""
+        self.tee_output = io.StringIO()
+        self.set_command_list(['echo', 'hello'])
+        self.expect_stdout(['hello'])
+        self.run_test()
+        self.assertEqual(self.tee_output.getvalue(), 'hello\n')
+
+    def test_normal_04(self):
+        """Tee binary capture modes."""
+        for capture_mode in (CaptureMode.BYTES, CaptureMode.SPOOL):
+            with self.subTest(capture_mode=capture_mode):
+                self.capture_mode = capture_mode
+                self.tee_output = io.BytesIO()
+                self.set_command_list(['printf', 'a\\r\\nb'])
+                self.expect_stdout(['a\r\nb'])
+                self.run_test()
+                self.assertEqual(self.tee_output.getvalue(), b'a\r\nb')
+
+
+class ErrorTestTFTTee(TestTFTTee):
+    """Error Test Cases.
+
+    Organize the Error Test Cases.
+    """
+
+    def test_error_01(self):
+        """Bad tee_output data type."""
+        self.tee_output = 1
+        self.set_command_list(['echo', 'hello'])
+        with self.assertRaisesRegex(AssertionError, 'tee_output must be a stream or a filename'):
+            self.run_test()
+
+    def test_error_02(self):
+        """CaptureMode.MEMFD can't be teed."""
+        self.capture_mode = CaptureMode.MEMFD
+        self.set_command_list(['echo', 'hello'])
+        with self.assertRaisesRegex(AssertionError, 'CaptureMode.MEMFD has no pipes to tee'):
+            self.run_test()
+
+    def test_error_03(self):
+        """Bad tee_flush_interval data type."""
+        self.tee_flush_interval = '1'
+        self.set_command_list(['echo', 'hello'])
+        with self.assertRaisesRegex(AssertionError, 'tee_flush_interval'):
+            self.run_test()
+
+    def test_error_04(self):
+        """Negative tee_flush_interval."""
+        self.tee_flush_interval = -1
+        self.set_command_list(['echo', 'hello'])
+        with self.assertRaisesRegex(AssertionError, 'Invalid tee_flush_interval of -1'):
+            self.run_test()
+
+
+class BoundaryTestTFTTee(TestTFTTee):
+    """Boundary Test Cases.
+
+    Organize the Boundary Test Cases.
+    """
+
+    def test_boundary_01(self):
+        """A zero tee_flush_interval flushes every write without polling a quiet command."""
+        self.tee_flush_interval = 0
+        self.set_command_list(['sh', '-c', 'echo start; sleep 0.5; echo stop'])
+        self.expect_stdout(['start\nstop\n'])
+        cpu_before = resource.getrusage(resource.RUSAGE_SELF)
+        self.run_test()
+        cpu_after = resource.getrusage(resource.RUSAGE_SELF)
+        self.assertLess(cpu_after.ru_utime + cpu_after.ru_stime
+                        - cpu_before.ru_utime - cpu_before.ru_stime, 0.25)
+        self.assertEqual(self.read_log(), 'start\nstop\n')
+
+
+class SpecialTestTFTTee(TestTFTTee):
+    """Special Test Cases.
+
+    Organize the Special Test Cases.
+    """
+
+    def test_special_01(self):
+        """Teed text output is newline-translated exactly like untee'd text output."""
+        self.set_command_list(['printf', 'a\\r\\nb\\rc'])
+        self.expect_stdout(['a\nb\nc'])
+        self.run_test()
+        with open(self.tee_output, 'rb') as in_file:
+            self.assertEqual(in_file.read(), b'a\r\nb\rc')
+
+
+if __name__ == '__main__':
+    execute_test_cases()
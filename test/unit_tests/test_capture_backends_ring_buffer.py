@@ -0,0 +1,153 @@
+"""Unit test the RingBufferStream capture backend.
+
+Run the test cases defined in this module using any of the example commands below:
+
+    Usage:
+    python -m unittest                                           # Run *ALL* test cases
+    python -m unittest -k TestRingBufferStream                   # Match this test class
+    python -m test.unit_tests                                    # Run all unit tests
+    python -m test.unit_tests.test_capture_backends_ring_buffer  # Run just these tests
+"""
+
+# Standard Imports
+from typing import Any
+import tracemalloc
+# Third Party Imports
+# Local Imports
+from tediousstart.capture_backends import RingBufferStream
+from tediousstart.redirect_std_streams import RedirectStdStreams
+from tediousstart.tediousstart import execute_test_cases
+from tediousstart.tediousunittest import TediousUnitTest
+
+
+class TestRingBufferStream(TediousUnitTest):
+    """TestRingBufferStream unit test class.
+
+    This class provides base functionality to run NEBS unit tests for RingBufferStream.  The
+    test input is a list of strings to print, and any keyword arguments for the RingBufferStream
+    ctor.  The expected return value is the captured stdout.
+    """
+
+    # CORE CLASS METHODS
+    # Methods listed in call order
+    def call_callable(self) -> Any:
+        """Print each string under RedirectStdStreams with a RingBufferStream stdout.
+
+        Overrides the parent method.
+
+        Returns:
+            The captured stdout.
+        """
+        with RedirectStdStreams(stdout=RingBufferStream(**self._kwargs)) as test_obj:
+            for text in self._args[0]:
+                print(text, end='')
+            return test_obj.communicate()[0]
+
+    def validate_return_value(self, return_value: Any) -> None:
+        """Validate the captured stdout.
+
+        Overrides the parent method.  Calls self._validate_return_value() under the hood.
+        """
+        self._validate_return_value(return_value=return_value)
+
+
+class NormalTestRingBufferStream(TestRingBufferStream):
+    """Normal Test Cases.
+
+    Organize the Normal Test Cases.
+    """
+
+    def test_normal_01(self):
+        """Output that fits is captured in full."""
+        self.set_test_input(['hello\n', 'world\n'], head_chars=8, tail_chars=8)
+        self.expect_return('hello\nworld\n')
+        self.run_test()
+
+    def test_normal_02(self):
+        """Long output is captured as a head and tail."""
+        self.set_test_input(['HEAD', 'x' * 100, 'TAIL'], head_chars=4, tail_chars=4)
+        self.expect_return('HEAD\n... (100 characters omitted) ...\nTAIL')
+        self.run_test()
+
+    def test_normal_03(self):
+        """Characters and lines are counted."""
+        stream = RingBufferStream(head_chars=2, tail_chars=2)
+        for _ in range(1000):
+            stream.write('line\n')
+        self.assertEqual(stream.total_chars, 5000)
+        self.assertEqual(stream.total_lines, 1000)
+        self.assertTrue(stream.truncated)
+
+
+class ErrorTestRingBufferStream(TestRingBufferStream):
+    """Error Test Cases.
+
+    Organize the Error Test Cases.
+    """
+
+    def test_error_01(self):
+        """Bad data types."""
+        self.set_test_input(['text'], head_chars='4')
+        self.expect_exception(TypeError, 'head_chars')
+        self.run_test()
+
+    def test_error_02(self):
+        """Negative sizes."""
+        self.set_test_input(['text'], tail_chars=-1)
+        self.expect_exception(ValueError, 'Invalid head_chars and tail_chars')
+        self.run_test()
+
+
+class BoundaryTestRingBufferStream(TestRingBufferStream):
+    """Boundary Test Cases.
+
+    Organize the Boundary Test Cases.
+    """
+
+    def test_boundary_01(self):
+        """No head."""
+        self.set_test_input(['0123456789'], head_chars=0, tail_chars=3)
+        self.expect_return('\n... (7 characters omitted) ...\n789')
+        self.run_test()
+
+    def test_boundary_02(self):
+        """No tail."""
+        self.set_test_input(['0123456789'], head_chars=3, tail_chars=0)
+        self.expect_return('012\n... (7 characters omitted) ...\n')
+        self.run_test()
+
+    def test_boundary_03(self):
+        """Output exactly fills the head and tail."""
+        self.set_test_input(['0', '1', '2', '3'], head_chars=2, tail_chars=2)
+        self.expect_return('0123')
+        self.run_test()
+
+    def test_boundary_04(self):
+        """One write larger than the whole buffer."""
+        self.set_test_input(['a' * 10 + 'b' * 10 ** 6 + 'c' * 10], head_chars=10, tail_chars=10)
+        self.expect_return('a' * 10 + '\n... (1000000 characters omitted) ...\n' + 'c' * 10)
+        self.run_test()
+
+
+class SpecialTestRingBufferStream(TestRingBufferStream):
+    """Special Test Cases.
+
+    Organize the Special Test Cases.
+    """
+
+    def test_special_01(self):
+        """Memory stays constant no matter how much is written."""
+        stream = RingBufferStream(head_chars=1024, tail_chars=1024)
+        tracemalloc.start()
+        try:
+            for line_num in range(100000):
+                stream.write(f'noisy line number {line_num}\n')
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        self.assertLess(peak, 64 * 1024)
+        self.assertTrue(stream.getvalue().endswith('noisy line number 99999\n'))
+
+
+if __name__ == '__main__':
+    execute_test_cases()
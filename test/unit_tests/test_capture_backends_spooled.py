@@ -0,0 +1,168 @@
+"""Unit test the SpooledTextStream capture backend and its BinaryOutput.
+
+Run the test cases defined in this module using any of the example commands below:
+
+    Usage:
+    python -m unittest                                       # Run *ALL* test cases
+    python -m unittest -k TestSpooledTextStream              # Match this test class
+    python -m test.unit_tests                                # Run all unit tests
+    python -m test.unit_tests.test_capture_backends_spooled  # Run just these tests
+"""
+
+# Standard Imports
+from typing import Any
+import mmap
+import tempfile
+# Third Party Imports
+# Local Imports
+from tediousstart.binary_output import BinaryOutput
+from tediousstart.capture_backends import SpooledTextStream
+from tediousstart.redirect_std_streams import RedirectStdStreams
+from tediousstart.tediousstart import execute_test_cases
+from tediousstart.tediousunittest import TediousUnitTest
+
+
+# pylint: disable=protected-access
+class TestSpooledTextStream(TediousUnitTest):
+    """TestSpooledTextStream unit test class.
+
+    This class provides base functionality to run NEBS unit tests for SpooledTextStream.  The
+    test input is a list of strings to print, and any keyword arguments for the
+    SpooledTextStream ctor.  The expected return value is the captured stdout.
+    """
+
+    # CORE CLASS METHODS
+    # Methods listed in call order
+    def call_callable(self) -> Any:
+        """Print each string under RedirectStdStreams with a SpooledTextStream stdout.
+
+        Overrides the parent method.
+
+        Returns:
+            The captured stdout.
+        """
+        with RedirectStdStreams(stdout=SpooledTextStream(**self._kwargs)) as test_obj:
+            for text in self._args[0]:
+                print(text, end='')
+            return test_obj.communicate()[0]
+
+    def validate_return_value(self, return_value: Any) -> None:
+        """Validate the captured stdout.
+
+        Overrides the parent method.  Calls self._validate_return_value() under the hood.
+        """
+        self._validate_return_value(return_value=return_value)
+
+
+class NormalTestSpooledTextStream(TestSpooledTextStream):
+    """Normal Test Cases.
+
+    Organize the Normal Test Cases.
+    """
+
+    def test_normal_01(self):
+        """Small output stays in memory."""
+        self.set_test_input(['hello\n', 'world\n'])
+        self.expect_return('hello\nworld\n')
+        self.run_test()
+
+    def test_normal_02(self):
+        """Large output spills to spool_dir and is searched through mmap."""
+        with tempfile.TemporaryDirectory() as spool_dir:
+            stream = SpooledTextStream(max_size=1024, spool_dir=spool_dir)
+            with RedirectStdStreams(stdout=stream):
+                for line_num in range(10000):
+                    print(f'line {line_num}')
+            output = stream.output()
+            self.assertTrue(stream.spilled)
+            self.assertIsInstance(output._buffer, mmap.mmap)
+            self.assertIn('line 9999\n', output)
+            self.assertNotIn('line 10000', output)
+            self.assertEqual(output[:7], 'line 0\n')
+            stream.close()
+
+    def test_normal_03(self):
+        """Non-ASCII text is encoded and decoded."""
+        self.set_test_input(['café ☃\n'], max_size=2)
+        self.expect_return('café ☃\n')
+        self.run_test()
+
+
+class ErrorTestSpooledTextStream(TestSpooledTextStream):
+    """Error Test Cases.
+
+    Organize the Error Test Cases.
+    """
+
+    def test_error_01(self):
+        """Bad data type."""
+        self.set_test_input(['text'], max_size='1024')
+        self.expect_exception(TypeError, 'max_size')
+        self.run_test()
+
+    def test_error_02(self):
+        """Negative max_size."""
+        self.set_test_input(['text'], max_size=-1)
+        self.expect_exception(ValueError, 'Invalid max_size')
+        self.run_test()
+
+
+class BoundaryTestSpooledTextStream(TestSpooledTextStream):
+    """Boundary Test Cases.
+
+    Organize the Boundary Test Cases.
+    """
+
+    def test_boundary_01(self):
+        """No output."""
+        self.set_test_input([])
+        self.expect_return('')
+        self.run_test()
+
+    def test_boundary_02(self):
+        """Output exactly max_size bytes long stays in memory."""
+        stream = SpooledTextStream(max_size=4)
+        stream.write('1234')
+        self.assertFalse(stream.spilled)
+        stream.write('5')
+        self.assertTrue(stream.spilled)
+        self.assertEqual(stream.read(), '12345')
+
+    def test_boundary_03(self):
+        """read(size) counts characters, not encoded bytes."""
+        stream = SpooledTextStream(max_size=2)
+        stream.write('café ☃')
+        self.assertEqual(stream.read(4), 'café')
+        self.assertEqual(stream.read(6), 'café ☃')
+        stream.close()
+
+    def test_boundary_04(self):
+        """A max_size of 0 spills immediately instead of keeping everything in memory."""
+        stream = SpooledTextStream(max_size=0)
+        self.assertTrue(stream.spilled)
+        self.assertEqual(stream.read(), '')
+        stream.write('text')
+        self.assertIsInstance(stream.output()._buffer, mmap.mmap)
+        self.assertEqual(stream.read(), 'text')
+        stream.close()
+
+
+class SpecialTestSpooledTextStream(TestSpooledTextStream):
+    """Special Test Cases.
+
+    Organize the Special Test Cases.
+    """
+
+    def test_special_01(self):
+        """BinaryOutput encodes expectations instead of decoding output."""
+        output = BinaryOutput(b'caf\xc3\xa9\r\n\xff')
+        self.assertIn('café\r\n', output)
+        self.assertIn(b'\xff', output)
+        self.assertEqual(len(output), 8)
+        self.assertEqual(output.text(), 'café\r\n�')
+        self.assertEqual(output, 'café\r\n�')
+        self.assertFalse(BinaryOutput(b''))
+
+
+if __name__ == '__main__':
+    execute_test_cases()
@@ -0,0 +1,127 @@
+"""Unit test the capture_executors module's execute_command() function.
+
+Run the test cases defined in this module using any of the example commands below:
+
+    Usage:
+    python -m unittest                                # Run *ALL* test cases
+    python -m unittest -k TestExecuteCommand          # Match this test class
+    python -m test.unit_tests                         # Run all unit tests
+    python -m test.unit_tests.test_capture_executors  # Run just these tests
+"""
+
+# Standard Imports
+from typing import Any
+import io
+import sys
+# Third Party Imports
+# Local Imports
+from tediousstart.capture_executors import execute_command, make_capture_settings
+from tediousstart.capture_mode import CaptureMode
+from tediousstart.tediousfunctest import TediousFuncTest
+from tediousstart.tediousstart import execute_test_cases
+from tediousstart.tediousunittest import TediousUnitTest
+
+
+# Prints to stdout, then stderr, then stdout again and exits 3
+SCRIPT = ('import sys\n'
+          'print("one", flush=True)\n'
+          'print("two", file=sys.stderr, flush=True)\n'
+          'print("three", flush=True)\n'
+          'sys.exit(3)\n')
+
+
+# pylint: disable=protected-access
+class TestExecuteCommand(TediousUnitTest):
+    """TestExecuteCommand unit test class.
+
+    This class provides base functionality to run NEBS unit tests for execute_command().  The
+    test input is any TediousFuncTest capture settings to change.  SCRIPT is executed with those
+    settings.  The expected return value is the (stdout, stderr, exit code) of the Execution.
+    """
+
+    # CORE CLASS METHODS
+    # Methods listed in call order
+    def call_callable(self) -> Any:
+        """Execute SCRIPT with the capture settings.
+
+        Overrides the parent method.
+
+        Returns:
+            The captured (stdout, stderr, exit code), with output converted to str.
+        """
+        execution = execute_command([sys.executable, '-c', SCRIPT],
+                                    make_capture_settings(TediousFuncTest)._replace(**self._kwargs))
+        self.assertGreater(execution.duration, 0)
+        return (str(execution.stdout), str(execution.stderr), execution.exit_code)
+
+    def validate_return_value(self, return_value: Any) -> None:
+        """Validate the captured results.
+
+        Overrides the parent method.  Calls self._validate_return_value() under the hood.
+        """
+        self._validate_return_value(return_value=return_value)
+
+
+class NormalTestExecuteCommand(TestExecuteCommand):
+    """Normal Test Cases.
+
+    Organize the Normal Test Cases.
+    """
+
+    def test_normal_01(self):
+        """Default settings capture text."""
+        self.set_test_input()
+        self.expect_return(('one\nthree\n', 'two\n', 3))
+        self.run_test()
+
+    def test_normal_02(self):
+        """CaptureMode.SPOOL captures the same output."""
+        self.set_test_input(capture_mode=CaptureMode.SPOOL)
+        self.expect_return(('one\nthree\n', 'two\n', 3))
+        self.run_test()
+
+    def test_normal_03(self):
+        """CaptureMode.MEMFD captures the same output."""
+        self.set_test_input(capture_mode=CaptureMode.MEMFD)
+        self.expect_return(('one\nthree\n', 'two\n', 3))
+        self.run_test()
+
+    def test_normal_04(self):
+        """CaptureMode.BYTES captures the same output."""
+        self.set_test_input(capture_mode=CaptureMode.BYTES)
+        self.expect_return(('one\nthree\n', 'two\n', 3))
+        self.run_test()
+
+    def test_normal_05(self):
+        """CaptureMode.MERGED captures the same output."""
+        self.set_test_input(capture_mode=CaptureMode.MERGED)
+        self.expect_return(('one\nthree\n', 'two\n', 3))
+        self.run_test()
+
+    def test_normal_06(self):
+        """Teed text output is still captured."""
+        self.set_test_input(tee_output=io.BytesIO())
+        self.expect_return(('one\nthree\n', 'two\n', 3))
+        self.run_test()
+
+
+class SpecialTestExecuteCommand(TestExecuteCommand):
+    """Special Test Cases.
+
+    Organize the Special Test Cases.
+    """
+
+    def test_special_01(self):
+        """CaptureMode.MERGED stores each stream once, inside its ChunkLog."""
+        execution = execute_command([sys.executable, '-c', SCRIPT],
+                                    make_capture_settings(TediousFuncTest)._replace(
+                                        capture_mode=CaptureMode.MERGED))
+        self.assertIs(execution.stderr._buffer, execution.chunk_log.stream('stderr'))
+        self.assertEqual(sorted(execution.chunk_log.merged().text().splitlines()),
+                         ['one', 'three', 'two'])
+        self.assertLess(execution.chunk_log.find('stdout', 'one'),
+                        execution.chunk_log.find('stdout', 'three'))
+
+
+if __name__ == '__main__':
+    execute_test_cases()
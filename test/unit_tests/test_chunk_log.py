@@ -0,0 +1,141 @@
+"""Unit test the ChunkLog class.
+
+Run the test cases defined in this module using any of the example commands below:
+
+    Usage:
+    python -m unittest                        # Run *ALL* test cases
+    python -m unittest -k TestChunkLog        # Match this test class
+    python -m test.unit_tests                 # Run all unit tests
+    python -m test.unit_tests.test_chunk_log  # Run just these tests
+"""
+
+# Standard Imports
+from typing import Any
+# Third Party Imports
+# Local Imports
+from tediousstart.chunk_log import ChunkLog
+from tediousstart.tediousstart import execute_test_cases
+from tediousstart.tediousunittest import TediousUnitTest
+
+
+class TestChunkLog(TediousUnitTest):
+    """TestChunkLog unit test class.
+
+    This class provides base functionality to run NEBS unit tests for ChunkLog.find().  The
+    test input is a list of (stream name, chunk) tuples to log followed by the stream name and
+    entry to find.  The expected return value is the entry's offset in the merged output.
+    """
+
+    # CORE CLASS METHODS
+    # Methods listed in call order
+    def call_callable(self) -> Any:
+        """Log each chunk then call ChunkLog.find().
+
+        Overrides the parent method.
+
+        Returns:
+            ChunkLog.find()'s return value.
+        """
+        chunk_log = ChunkLog()
+        for stream_name, chunk in self._args[0]:
+            chunk_log.append(stream_name, chunk)
+        return chunk_log.find(*self._args[1:])
+
+    def validate_return_value(self, return_value: Any) -> None:
+        """Validate the offset.
+
+        Overrides the parent method.  Calls self._validate_return_value() under the hood.
+        """
+        self._validate_return_value(return_value=return_value)
+
+
+class NormalTestChunkLog(TestChunkLog):
+    """Normal Test Cases.
+
+    Organize the Normal Test Cases.
+    """
+
+    def test_normal_01(self):
+        """Find an entry in a later chunk."""
+        self.set_test_input([('stdout', b'one\n'), ('stderr', b'warn\n'), ('stdout', b'two\n')],
+                            'stdout', 'two')
+        self.expect_return(9)
+        self.run_test()
+
+    def test_normal_02(self):
+        """Find an entry spanning chunks of the same stream."""
+        self.set_test_input([('stdout', b'Sum'), ('stderr', b'warn\n'), ('stdout', b'mary\n')],
+                            'stdout', b'Summary')
+        self.expect_return(0)
+        self.run_test()
+
+    def test_normal_03(self):
+        """Views of the log."""
+        chunk_log = ChunkLog()
+        chunk_log.handler('stdout')(b'out\n')
+        chunk_log.handler('stderr')(b'err\n')
+        self.assertEqual(chunk_log.stream('stdout'), b'out\n')
+        self.assertEqual(chunk_log.stream('stderr'), b'err\n')
+        self.assertEqual(chunk_log.merged(), 'out\nerr\n')
+        self.assertEqual([chunk.data for chunk in chunk_log.chunks()], [b'out\n', b'err\n'])
+
+    def test_normal_04(self):
+        """Find entries among many interleaved chunks."""
+        self.set_test_input([(('stdout', 'stderr')[num % 2], f'{num:04}'.encode())
+                             for num in range(1000)], 'stderr', '0777')
+        self.expect_return(777 * 4)
+        self.run_test()
+
+
+class ErrorTestChunkLog(TestChunkLog):
+    """Error Test Cases.
+
+    Organize the Error Test Cases.
+    """
+
+    def test_error_01(self):
+        """Unknown stream name."""
+        self.set_test_input([('stdin', b'text')])
+        self.expect_exception(ValueError, 'not in tuple')
+        self.run_test()
+
+
+class BoundaryTestChunkLog(TestChunkLog):
+    """Boundary Test Cases.
+
+    Organize the Boundary Test Cases.
+    """
+
+    def test_boundary_01(self):
+        """Empty log."""
+        self.set_test_input([], 'stdout', 'text')
+        self.expect_return(-1)
+        self.run_test()
+
+    def test_boundary_02(self):
+        """Entry only found in the other stream."""
+        self.set_test_input([('stderr', b'text')], 'stdout', 'text')
+        self.expect_return(-1)
+        self.run_test()
+
+
+class SpecialTestChunkLog(TestChunkLog):
+    """Special Test Cases.
+
+    Organize the Special Test Cases.
+    """
+
+    def test_special_01(self):
+        """Streams are stored once; the merged output is built on demand and rebuilt after
+        more chunks arrive."""
+        chunk_log = ChunkLog()
+        chunk_log.append('stdout', b'one\n')
+        self.assertIs(chunk_log.stream('stdout'), chunk_log.stream('stdout'))
+        self.assertEqual(chunk_log.merged(), 'one\n')
+        chunk_log.append('stderr', b'two\n')
+        self.assertEqual(chunk_log.merged(), 'one\ntwo\n')
+        self.assertEqual(chunk_log.find('stderr', 'two'), 4)
+
+
+if __name__ == '__main__':
+    execute_test_cases()
@@ -0,0 +1,246 @@
+"""Unit test the tediousstart.comparison.compare_values() function.
+
+Run the test cases defined in this module using any of the example commands below:
+
+    Usage:
+    python -m unittest                                        # Run *ALL* test cases
+    python -m unittest -k TestCompareValues                   # Match this test class
+    python -m test.unit_tests                                 # Run all unit test cases
+    python -m test.unit_tests.test_comparison_compare_values  # Run just these tests
+"""
+
+# Standard Imports
+from typing import Any
+import unittest
+# Third Party Imports
+# Local Imports
+from tediousstart.comparison import _import_numpy, compare_values
+from tediousstart.tediousstart import execute_test_cases
+from tediousstart.tediousunittest import TediousUnitTest
+
+
+NUMPY = _import_numpy()  # Optional numpy module
+BIG = 100000             # Length of large test input
+
+
+class TestCompareValues(TediousUnitTest):
+    """TestCompareValues unit test class.
+
+    This class provides base functionality to run NEBS unit tests for compare_values().
+    """
+
+    # CORE CLASS METHODS
+    # Methods listed in call order
+    def call_callable(self) -> Any:
+        """Calls compare_values().
+
+        Overrides the parent method.
+
+        Returns:
+            Return value of compare_values()
+        """
+        return compare_values(*self._args, **self._kwargs)
+
+    def validate_return_value(self, return_value: Any) -> None:
+        """Validate compare_values() return value.
+
+        Overrides the parent method.  An expected return value of '' must match exactly.
+        Otherwise, each of the expected return value's lines must be found in the failure
+        message and the failure message must remain small.
+        """
+        if not self._exp_return:
+            self._validate_return_value(return_value)
+            return
+        for exp_line in self._exp_return.splitlines():
+            if exp_line not in return_value:
+                self._add_test_failure(f'Unable to locate {exp_line} in {return_value}')
+        if len(return_value) > 2048:
+            self._add_test_failure(f'Failure message too long: {len(return_value)} characters')
+
+
+class NormalTestCompareValues(TestCompareValues):
+    """Normal Test Cases.
+
+    Organize the Normal Test Cases.
+    """
+
+    def test_normal_01(self):
+        """Equal scalars."""
+        self.set_test_input(5, 5)
+        self.expect_return('')
+        self.run_test()
+
+    def test_normal_02(self):
+        """Unequal scalars."""
+        self.set_test_input(5, 6)
+        self.expect_return('Expected value "5" but received "6" instead')
+        self.run_test()
+
+    def test_normal_03(self):
+        """Floats within tolerance."""
+        self.set_test_input(1.0, 1.0 + 1e-12, rel_tol=1e-9)
+        self.expect_return('')
+        self.run_test()
+
+    def test_normal_04(self):
+        """Large equal lists."""
+        self.set_test_input(list(range(BIG)), list(range(BIG)))
+        self.expect_return('')
+        self.run_test()
+
+    def test_normal_05(self):
+        """Large lists with one difference."""
+        actual = list(range(BIG))
+        actual[500] = -1
+        self.set_test_input(list(range(BIG)), actual)
+        self.expect_return(f'1 of {BIG} items differ\n[500] expected 500 but received -1')
+        self.run_test()
+
+    def test_normal_06(self):
+        """Large float lists within tolerance."""
+        self.set_test_input([num * 0.1 for num in range(BIG)],
+                            [num * 0.1 + 1e-12 for num in range(BIG)], abs_tol=1e-9)
+        self.expect_return('')
+        self.run_test()
+
+    def test_normal_07(self):
+        """Large bytes with a difference."""
+        actual = bytearray(BIG)
+        actual[-1] = 1
+        self.set_test_input(bytes(BIG), bytes(actual))
+        self.expect_return(f'1 of {BIG} items differ\n[{BIG - 1}] expected 0 but received 1')
+        self.run_test()
+
+
+class BoundaryTestCompareValues(TestCompareValues):
+    """Boundary Test Cases.
+
+    Organize the Boundary Test Cases.
+    """
+
+    def test_boundary_01(self):
+        """Every item differs; only max_diffs are described."""
+        self.set_test_input([0] * BIG, [1] * BIG, max_diffs=3)
+        self.expect_return(f'{BIG} of {BIG} items differ; first 3:')
+        self.run_test()
+
+    def test_boundary_02(self):
+        """Different lengths."""
+        self.set_test_input(list(range(BIG)), list(range(BIG - 1)))
+        self.expect_return(f'Expected length {BIG} but received length {BIG - 1}')
+        self.run_test()
+
+    def test_boundary_03(self):
+        """Huge unequal values are shortened."""
+        self.set_test_input({'key': 'x' * BIG}, {'key': 'y' * BIG})
+        self.expect_return('characters total')
+        self.run_test()
+
+    def test_boundary_04(self):
+        """Float just outside tolerance."""
+        self.set_test_input(1.0, 1.1, abs_tol=0.05)
+        self.expect_return('abs_tol=0.05')
+        self.run_test()
+
+
+class ErrorTestCompareValues(TestCompareValues):
+    """Error Test Cases.
+
+    Organize the Error Test Cases.
+    """
+
+    def test_error_01(self):
+        """Tolerances are keyword-only."""
+        self.set_test_input(1.0, 1.1, 0.05)
+        self.expect_exception(TypeError, 'positional argument')
+        self.run_test()
+
+
+@unittest.skipIf(NUMPY is None, 'numpy is not installed')
+class NumpyTestCompareValues(TestCompareValues):
+    """Special Test Cases.
+
+    Organize the NumPy Test Cases.
+    """
+
+    def test_special_01(self):
+        """Arrays within tolerance."""
+        self.set_test_input(NUMPY.arange(BIG) * 0.1, NUMPY.arange(BIG) * 0.1 + 1e-12,
+                            abs_tol=1e-9)
+        self.expect_return('')
+        self.run_test()
+
+    def test_special_02(self):
+        """Arrays with one difference."""
+        actual = NUMPY.arange(BIG)
+        actual[7] = -1
+        self.set_test_input(NUMPY.arange(BIG), actual)
+        self.expect_return(f'1 of {BIG} items differ')
+        self.run_test()
+
+    def test_special_03(self):
+        """Arrays of different shapes."""
+        self.set_test_input(NUMPY.zeros((2, 3)), NUMPY.zeros((3, 2)))
+        self.expect_return('Expected shape (2, 3) but received shape (3, 2)')
+        self.run_test()
+
+    def test_special_07(self):
+        """NaNs in large lists differ, as they do without numpy."""
+        self.set_test_input([float('nan')] * BIG, [float('nan')] * BIG)
+        self.expect_return(f'{BIG} of {BIG} items differ')
+        self.run_test()
+
+    def test_special_08(self):
+        """Large integers in large lists are compared exactly, not as floats."""
+        actual = [2**60] * BIG
+        actual[-1] = 2**60 + 1
+        self.set_test_input([2**60] * BIG, actual)
+        self.expect_return(f'1 of {BIG} items differ\n[{BIG - 1}] expected {2**60} but '
+                           f'received {2**60 + 1}')
+        self.run_test()
+
+    def test_special_09(self):
+        """Differences in multidimensional arrays are addressed by path."""
+        actual = NUMPY.zeros((2, 3))
+        actual[1, 2] = 1.0
+        self.set_test_input(NUMPY.zeros((2, 3)), actual)
+        self.expect_return('1 of 6 items differ\n[1][2] expected 0.0 but received 1.0')
+        self.run_test()
+
+
+class ToleranceTestCompareValues(TediousUnitTest):
+    """Special Test Cases.
+
+    Organize the TediousUnitTest.set_return_tolerance() Test Cases.
+    """
+
+    def call_callable(self) -> Any:
+        """Sum the test input."""
+        return sum(self._args[0])
+
+    def validate_return_value(self, return_value: Any) -> None:
+        """Calls self._validate_return_value() under the hood."""
+        self._validate_return_value(return_value)
+
+    def test_special_04(self):
+        """Float noise is tolerated."""
+        self.set_test_input([0.1] * 10)
+        self.expect_return(1.0)
+        self.set_return_tolerance(rel_tol=1e-9)
+        self.run_test()
+
+    def test_special_05(self):
+        """Float noise fails without a tolerance."""
+        self.set_test_input([0.1] * 10)
+        self.expect_return(1.0)
+        with self.assertRaisesRegex(AssertionError, 'Expected value "1.0"'):
+            self.run_test()
+
+    def test_special_06(self):
+        """Negative tolerance."""
+        with self.assertRaisesRegex(AssertionError, 'Invalid abs_tol'):
+            self.set_return_tolerance(abs_tol=-1.0)
+
+
+if __name__ == '__main__':
+    execute_test_cases()
@@ -0,0 +1,184 @@
+"""Unit test the tediousstart.comparison.structural_diff() function.
+
+Run the test cases defined in this module using any of the example commands below:
+
+    Usage:
+    python -m unittest                                         # Run *ALL* test cases
+    python -m unittest -k TestStructuralDiff                   # Match this test class
+    python -m test.unit_tests                                  # Run all unit test cases
+    python -m test.unit_tests.test_comparison_structural_diff  # Run just these tests
+"""
+
+# Standard Imports
+from typing import Any
+import sys
+# Third Party Imports
+# Local Imports
+from tediousstart.comparison import compare_values, structural_diff
+from tediousstart.tediousstart import execute_test_cases
+from tediousstart.tediousunittest import TediousUnitTest
+
+
+DEEP = sys.getrecursionlimit() * 10  # Nesting depth guaranteed to exceed the recursion limit
+
+
+def nest(depth: int, leaf: Any) -> list:
+    """Wrap leaf in depth nested lists without recursing."""
+    # LOCAL VARIABLES
+    nested = [leaf]  # The nested lists
+
+    # NEST IT
+    for _ in range(depth - 1):
+        nested = [nested]
+
+    # DONE
+    return nested
+
+
+class TestStructuralDiff(TediousUnitTest):
+    """TestStructuralDiff unit test class.
+
+    This class provides base functionality to run NEBS unit tests for structural_diff().
+    The expected return value is a tuple of the difference count and the expected differences.
+    """
+
+    # CORE CLASS METHODS
+    # Methods listed in call order
+    def call_callable(self) -> Any:
+        """Calls structural_diff().
+
+        Overrides the parent method.
+
+        Returns:
+            Return value of structural_diff()
+        """
+        return structural_diff(*self._args, **self._kwargs)
+
+    def validate_return_value(self, return_value: Any) -> None:
+        """Validate structural_diff() return value.
+
+        Overrides the parent method.  The difference count must match exactly and each
+        expected difference must be found in the list of differences.
+        """
+        if return_value[0] != self._exp_return[0]:
+            self._add_test_failure(f'Expected {self._exp_return[0]} differences but counted '
+                                   f'{return_value[0]} instead')
+        for exp_diff in self._exp_return[1]:
+            if exp_diff not in return_value[1]:
+                self._add_test_failure(f'Unable to locate {exp_diff} in {return_value[1]}')
+
+
+class NormalTestStructuralDiff(TestStructuralDiff):
+    """Normal Test Cases.
+
+    Organize the Normal Test Cases.
+    """
+
+    def test_normal_01(self):
+        """Equal structures."""
+        self.set_test_input({'a': [1, {'b': (2, 3)}]}, {'a': [1, {'b': (2, 3)}]})
+        self.expect_return((0, []))
+        self.run_test()
+
+    def test_normal_02(self):
+        """Changed leaf is addressed by its path."""
+        self.set_test_input({'users': [{'name': 'a'}, {'name': 'b'}]},
+                            {'users': [{'name': 'a'}, {'name': 'c'}]})
+        self.expect_return((1, ["['users'][1]['name'] expected b but received c"]))
+        self.run_test()
+
+    def test_normal_03(self):
+        """Missing and unexpected keys."""
+        self.set_test_input({'a': 1, 'b': 2}, {'a': 1, 'c': 3})
+        self.expect_return((2, ["['b'] missing", "['c'] unexpected"]))
+        self.run_test()
+
+    def test_normal_04(self):
+        """Missing and unexpected set items."""
+        self.set_test_input({'tags': {'x', 'y'}}, {'tags': {'x', 'z'}})
+        self.expect_return((2, ["['tags'] missing 'y'", "['tags'] unexpected 'z'"]))
+        self.run_test()
+
+    def test_normal_05(self):
+        """Numeric leaves honor tolerances."""
+        self.set_test_input({'pi': (3.14159, [1.0])}, {'pi': (3.14159 + 1e-12, [1.0])},
+                            rel_tol=1e-9)
+        self.expect_return((0, []))
+        self.run_test()
+
+
+class ErrorTestStructuralDiff(TestStructuralDiff):
+    """Error Test Cases.
+
+    Organize the Error Test Cases.
+    """
+
+    def test_error_01(self):
+        """Mismatched types."""
+        self.set_test_input({'a': [1]}, {'a': (1,)})
+        self.expect_return((1, ["['a'] expected list but received tuple"]))
+        self.run_test()
+
+    def test_error_02(self):
+        """Mismatched lengths."""
+        self.set_test_input([1, 2, 3], [1, 2])
+        self.expect_return((1, ['$ expected length 3 but received length 2']))
+        self.run_test()
+
+
+class BoundaryTestStructuralDiff(TestStructuralDiff):
+    """Boundary Test Cases.
+
+    Organize the Boundary Test Cases.
+    """
+
+    def test_boundary_01(self):
+        """Nesting deeper than the recursion limit."""
+        self.set_test_input(nest(DEEP, 1), nest(DEEP, 2))
+        self.expect_return((1, []))
+        self.run_test()
+
+    def test_boundary_02(self):
+        """Every item differs; only max_diffs are described."""
+        self.set_test_input({num: num for num in range(1000)},
+                            {num: -num for num in range(1, 1001)}, max_diffs=3)
+        self.expect_return((1001, ['[0] missing', '[1000] unexpected']))
+        self.run_test()
+        self.assertEqual(len(structural_diff(*self._args, **self._kwargs)[1]), 3)
+
+    def test_boundary_03(self):
+        """Empty structures."""
+        self.set_test_input({}, {})
+        self.expect_return((0, []))
+        self.run_test()
+
+
+class SpecialTestStructuralDiff(TestStructuralDiff):
+    """Special Test Cases.
+
+    Organize the Special Test Cases.
+    """
+
+    def test_special_01(self):
+        """Shared subtrees are skipped by identity."""
+        shared = [{'key': num} for num in range(10000)]
+        self.set_test_input({'a': shared, 'b': 1}, {'a': shared, 'b': 2})
+        self.expect_return((1, ["['b'] expected 1 but received 2"]))
+        self.run_test()
+
+    def test_special_02(self):
+        """compare_values() reports deep differences without crashing."""
+        failure_msg = compare_values({'deep': nest(DEEP, 1)}, {'deep': nest(DEEP, 2)})
+        self.assertIn('1 differences', failure_msg)
+        self.assertIn('expected 1 but received 2', failure_msg)
+        self.assertLess(len(failure_msg), 1024)
+
+    def test_special_03(self):
+        """compare_values() folds nested differences into large sequences."""
+        failure_msg = compare_values([{'a': 1}] * 100, [{'a': 1}] * 99 + [{'a': 2}])
+        self.assertIn("1 of 100 items differ; first 1: [99]['a'] expected 1 but received 2",
+                      failure_msg)
+
+
+if __name__ == '__main__':
+    execute_test_cases()
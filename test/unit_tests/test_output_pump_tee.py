@@ -0,0 +1,152 @@
+"""Unit test the OutputTee class.
+
+Run the test cases defined in this module using any of the example commands below:
+
+    Usage:
+    python -m unittest                              # Run *ALL* test cases
+    python -m unittest -k TestOutputTee             # Match this test class
+    python -m test.unit_tests                       # Run all unit tests
+    python -m test.unit_tests.test_output_pump_tee  # Run just these tests
+"""
+
+# Standard Imports
+from typing import Any
+import io
+# Third Party Imports
+# Local Imports
+from tediousstart.output_pump import OutputTee
+from tediousstart.tediousstart import execute_test_cases
+from tediousstart.tediousunittest import TediousUnitTest
+
+
+class CountingBytesIO(io.BytesIO):
+    """A BytesIO that counts its flushes."""
+
+    def __init__(self) -> None:
+        """CountingBytesIO class ctor."""
+        super().__init__()
+        self.flush_count = 0  # Number of calls to flush()
+
+    def flush(self) -> None:
+        """Count the flush."""
+        self.flush_count += 1
+        super().flush()
+
+
+class TestOutputTee(TediousUnitTest):
+    """TestOutputTee unit test class.
+
+    This class provides base functionality to run NEBS unit tests for OutputTee.  The test input
+    is a list of (stream name, chunk) tuples to forward, and any keyword arguments for the
+    OutputTee ctor.  The expected return value is everything forwarded, once the tee is closed.
+    """
+
+    # CORE CLASS METHODS
+    # Methods listed in call order
+    def call_callable(self) -> Any:
+        """Forward each chunk through an OutputTee to a BytesIO.
+
+        Overrides the parent method.
+
+        Returns:
+            Everything forwarded.
+        """
+        target = io.BytesIO()
+        tee = OutputTee(target, **self._kwargs)
+        for stream_name, chunk in self._args[0]:
+            tee.forward(stream_name, chunk)
+        tee.close()
+        return target.getvalue()
+
+    def validate_return_value(self, return_value: Any) -> None:
+        """Validate everything forwarded.
+
+        Overrides the parent method.  Calls self._validate_return_value() under the hood.
+        """
+        self._validate_return_value(return_value=return_value)
+
+
+class NormalTestOutputTee(TestOutputTee):
+    """Normal Test Cases.
+
+    Organize the Normal Test Cases.
+    """
+
+    def test_normal_01(self):
+        """Whole lines are forwarded as they arrive."""
+        self.set_test_input([('stdout', b'one\n'), ('stdout', b'two\n')])
+        self.expect_return(b'one\ntwo\n')
+        self.run_test()
+
+    def test_normal_02(self):
+        """Unterminated lines are held back so streams never splice lines together."""
+        self.set_test_input([('stdout', b'out 1\nout'), ('stderr', b'err 1\n'),
+                             ('stdout', b' 2\n')])
+        self.expect_return(b'out 1\nerr 1\nout 2\n')
+        self.run_test()
+
+    def test_normal_03(self):
+        """Flushes are rate-limited."""
+        target = CountingBytesIO()
+        tee = OutputTee(target, flush_interval=3600)
+        for _ in range(1000):
+            tee.forward('stdout', b'line\n')
+        self.assertEqual(target.flush_count, 0)
+        tee.close()
+        self.assertEqual(target.flush_count, 1)
+
+    def test_normal_04(self):
+        """Text-only targets receive decoded text."""
+        target = io.StringIO()
+        tee = OutputTee(target)
+        tee.wrap('stdout', lambda chunk: None)('café\n'.encode())
+        tee.close()
+        self.assertEqual(target.getvalue(), 'café\n')
+
+
+class ErrorTestOutputTee(TestOutputTee):
+    """Error Test Cases.
+
+    Organize the Error Test Cases.
+    """
+
+    def test_error_01(self):
+        """Bad data type."""
+        self.set_test_input([], flush_interval='0.1')
+        self.expect_exception(TypeError, 'flush_interval')
+        self.run_test()
+
+    def test_error_02(self):
+        """Negative flush_interval."""
+        self.set_test_input([], flush_interval=-1)
+        self.expect_exception(ValueError, 'Invalid flush_interval')
+        self.run_test()
+
+
+class BoundaryTestOutputTee(TestOutputTee):
+    """Boundary Test Cases.
+
+    Organize the Boundary Test Cases.
+    """
+
+    def test_boundary_01(self):
+        """Unterminated lines are forwarded by close()."""
+        self.set_test_input([('stdout', b'no newline')])
+        self.expect_return(b'no newline')
+        self.run_test()
+
+    def test_boundary_02(self):
+        """Carriage returns end lines (e.g., progress bars)."""
+        self.set_test_input([('stdout', b'50%\r100%\r'), ('stderr', b'done\n')])
+        self.expect_return(b'50%\r100%\rdone\n')
+        self.run_test()
+
+    def test_boundary_03(self):
+        """Endless lines are not held back forever."""
+        self.set_test_input([('stdout', b'x' * 100000), ('stderr', b'err\n')])
+        self.expect_return(b'x' * 100000 + b'err\n')
+        self.run_test()
+
+
+if __name__ == '__main__':
+    execute_test_cases()
@@ -0,0 +1,145 @@
+"""Unit test the pattern_cache module's combined scan.
+
+Run the test cases defined in this module using any of the example commands below:
+
+    Usage:
+    python -m unittest                            # Run *ALL* test cases
+    python -m unittest -k TestScanEntries         # Match this test class
+    python -m test.unit_tests                     # Run all unit tests
+    python -m test.unit_tests.test_pattern_cache  # Run just these tests
+"""
+
+# Standard Imports
+from typing import Any, Callable
+from unittest.mock import Mock
+import re
+# Third Party Imports
+# Local Imports
+from tediousstart.pattern_cache import (compile_alternation, compile_pattern, make_literal_entry,
+                                        scan_entries)
+from tediousstart.tediousstart import execute_test_cases
+from tediousstart.tediousunittest import TediousUnitTest
+
+
+def make_search(output: Any) -> Callable:
+    """Make a search function for output that records its calls (see: Mock.call_count)."""
+    return Mock(wraps=lambda pattern, pos: pattern.search(output, pos))
+
+
+class TestScanEntries(TediousUnitTest):
+    """TestScanEntries unit test class.
+
+    This class provides base functionality to run NEBS unit tests for scan_entries().  The test
+    input is an output (str or bytes) followed by a list of (pattern, flags) entries.  The
+    expected return value is the set of indices of the entries found.
+    """
+
+    # CORE CLASS METHODS
+    # Methods listed in call order
+    def call_callable(self) -> Any:
+        """Scan the output for the entries.
+
+        Overrides the parent method.
+
+        Returns:
+            scan_entries()'s return value.
+        """
+        output, entries = self._args
+        return scan_entries(make_search(output), tuple(entries),
+                            as_bytes=isinstance(output, bytes))
+
+    def validate_return_value(self, return_value: Any) -> None:
+        """Validate the indices found.
+
+        Overrides the parent method.  Calls self._validate_return_value() under the hood.
+        """
+        self._validate_return_value(return_value=return_value)
+
+
+class NormalTestScanEntries(TestScanEntries):
+    """Normal Test Cases.
+
+    Organize the Normal Test Cases.
+    """
+
+    def test_normal_01(self):
+        """Literal and regex entries."""
+        self.set_test_input('Loaded\nquery took 12 ms\nDone\n',
+                            [make_literal_entry('Done'), (r'took \d+ ms', 0), ('Failed', 0)])
+        self.expect_return({0, 1})
+        self.run_test()
+
+    def test_normal_02(self):
+        """Bytes output."""
+        self.set_test_input(b'query took 12 ms\n', [(r'took \d+ ms', 0), ('TOOK', re.I)])
+        self.expect_return({0, 1})
+        self.run_test()
+
+    def test_normal_03(self):
+        """One pass, per entry found, no matter how many entries are missing."""
+        search = make_search('x' * 100000 + 'found')
+        entries = tuple([('found', 0)] + [(f'missing {num}', 0) for num in range(100)])
+        self.assertEqual(scan_entries(search, entries), {0})
+        self.assertEqual(search.call_count, 2)
+
+
+class ErrorTestScanEntries(TestScanEntries):
+    """Error Test Cases.
+
+    Organize the Error Test Cases.
+    """
+
+    def test_error_01(self):
+        """Invalid pattern."""
+        self.set_test_input('output', [('(unbalanced', 0)])
+        self.expect_exception(re.error, 'missing')
+        self.run_test()
+
+
+class BoundaryTestScanEntries(TestScanEntries):
+    """Boundary Test Cases.
+
+    Organize the Boundary Test Cases.
+    """
+
+    def test_boundary_01(self):
+        """No entries."""
+        self.set_test_input('output', [])
+        self.expect_return(set())
+        self.run_test()
+
+    def test_boundary_02(self):
+        """Overlapping entries don't hide each other."""
+        self.set_test_input('abc', [make_literal_entry('abc'), ('b', 0), ('abc', 0), ('a', 0)])
+        self.expect_return({0, 1, 2, 3})
+        self.run_test()
+
+    def test_boundary_03(self):
+        """Empty output."""
+        self.set_test_input('', [('x*', 0), ('x+', 0)])
+        self.expect_return({0})
+        self.run_test()
+
+
+class SpecialTestScanEntries(TestScanEntries):
+    """Special Test Cases.
+
+    Organize the Special Test Cases.
+    """
+
+    def test_special_01(self):
+        """Entries that can't be combined are searched for separately."""
+        self.set_test_input('aa bb', [(r'(a)\1', 0), ('(?P<name>bb)', 0), ('a b', re.X),
+                                      ('cc', 0)])
+        self.expect_return({0, 1})
+        self.run_test()
+
+    def test_special_02(self):
+        """Compiled patterns and alternations are cached process-wide."""
+        self.assertIs(compile_pattern(r'took \d+ ms'), compile_pattern(r'took \d+ ms'))
+        entries = ((r'took \d+ ms', 0), ('Done', re.I))
+        self.assertIs(compile_alternation(entries), compile_alternation(entries))
+
+
+if __name__ == '__main__':
+    execute_test_cases()
@@ -0,0 +1,146 @@
+"""Unit test the tediousstart.records module.
+
+Run the test cases defined in this module using any of the example commands below:
+
+    Usage:
+    python -m unittest                      # Run *ALL* test cases
+    python -m unittest -k TestRecords       # Match this test class
+    python -m test.unit_tests               # Run all unit test cases
+    python -m test.unit_tests.test_records  # Run just these tests
+"""
+
+# Standard Imports
+from typing import Any
+import pickle
+# Third Party Imports
+# Local Imports
+from tediousstart.records import (CallExpectations, CallSpec, CommandOutput, CommandSpec,
+                                  ExitExpectation, StreamExpectations)
+from tediousstart.tediousfunctest import TediousFuncTest
+from tediousstart.tediousstart import execute_test_cases
+from tediousstart.tediousunittest import TediousUnitTest
+
+
+RECORD_CLASSES = (CallExpectations, CallSpec, CommandOutput, CommandSpec, ExitExpectation,
+                  StreamExpectations)  # Every record class
+
+
+class TestRecords(TediousUnitTest):
+    """TestRecords unit test class.
+
+    This class provides base functionality to run NEBS unit tests for the record classes.  The
+    test input is a record which is pickled and unpickled.
+    """
+
+    # CORE CLASS METHODS
+    # Methods listed in call order
+    def call_callable(self) -> Any:
+        """Round trip a record through pickle.
+
+        Overrides the parent method.
+
+        Returns:
+            The unpickled record.
+        """
+        return pickle.loads(pickle.dumps(self._args[0]))
+
+    def validate_return_value(self, return_value: Any) -> None:
+        """Validate the unpickled record.
+
+        Overrides the parent method.  Calls self._validate_return_value() under the hood.
+        """
+        self._validate_return_value(return_value=return_value)
+
+
+class NormalTestRecords(TestRecords):
+    """Normal Test Cases.
+
+    Organize the Normal Test Cases.
+    """
+
+    def test_normal_01(self):
+        """Default records survive pickling."""
+        self.run_test_table([((record_class(),), {}, record_class())
+                             for record_class in RECORD_CLASSES])
+
+    def test_normal_02(self):
+        """Populated records survive pickling."""
+        stream_exp = StreamExpectations()
+        stream_exp.check = True
+        stream_exp.extend('expected', ['hello'])
+        self.set_test_input(stream_exp)
+        self.expect_return(stream_exp)
+        self.run_test()
+
+    def test_normal_03(self):
+        """Command output survives pickling."""
+        self.set_test_input(CommandOutput('out', 'err', 3))
+        self.expect_return(CommandOutput('out', 'err', 3))
+        self.run_test()
+
+
+class ErrorTestRecords(TestRecords):
+    """Error Test Cases.
+
+    Organize the Error Test Cases.
+    """
+
+    def test_error_01(self):
+        """Unknown fields can't be added."""
+        for record_class in RECORD_CLASSES:
+            with self.assertRaises(AttributeError):
+                record_class().unknown_field = True
+
+    def test_error_02(self):
+        """Records are unhashable."""
+        with self.assertRaises(TypeError):
+            hash(CommandSpec())
+
+
+class SpecialTestRecords(TestRecords):
+    """Special Test Cases.
+
+    Organize the Special Test Cases.
+    """
+
+    def test_special_01(self):
+        """Records carry no per-instance __dict__."""
+        for record_class in RECORD_CLASSES:
+            self.assertFalse(hasattr(record_class(), '__dict__'))
+
+    def test_special_02(self):
+        """Test author state lives in the records."""
+        self.set_test_input(1, key='value')
+        self.assertEqual(self._call.args, (1,))
+        self.assertEqual(self._kwargs, {'key': 'value'})
+        self.assertTrue(self._defined_test_input)
+
+    def test_special_03(self):
+        """TediousFuncTest captured output lives in its CommandOutput record."""
+
+        # pylint: disable=too-few-public-methods
+        class FuncTest(TediousFuncTest):
+            """Minimal TediousFuncTest."""
+
+            def validate_results(self) -> Any:
+                """Overrides parent class method."""
+        # pylint: enable=too-few-public-methods
+
+        func_test = FuncTest()
+        # pylint: disable=protected-access
+        func_test._raw_stdout = 'out'
+        self.assertEqual(func_test._output, CommandOutput('out', '', None))
+        # pylint: enable=protected-access
+
+    def test_special_04(self):
+        """Unused list fields share the empty tuple; extend() builds a list on first use."""
+        stream_exp = StreamExpectations()
+        self.assertIs(stream_exp.expected, StreamExpectations().expected)
+        stream_exp.extend('expected', ['one'])
+        stream_exp.extend('expected', ['two'])
+        self.assertEqual(stream_exp.expected, ['one', 'two'])
+        self.assertEqual(StreamExpectations().expected, ())
+
+
+if __name__ == '__main__':
+    execute_test_cases()
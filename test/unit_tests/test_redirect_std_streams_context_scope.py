@@ -0,0 +1,187 @@
+"""Unit test RedirectStdStreams' CaptureScope.CONTEXT thread and asyncio task isolated capture.
+
+Run the test cases defined in this module using any of the example commands below:
+
+    Usage:
+    python -m unittest                                                 # Run *ALL* test cases
+    python -m unittest -k TestRSSContextScope                          # Match this test class
+    python -m test.unit_tests                                          # Run all unit tests
+    python -m test.unit_tests.test_redirect_std_streams_context_scope  # Run just these tests
+"""
+
+# Standard Imports
+from typing import Any
+import asyncio
+import io
+import sys
+import threading
+# Third Party Imports
+# Local Imports
+from tediousstart.redirect_std_streams import (CaptureScope, DispatchingStream,
+                                               RedirectStdStreams, STDOUT_TARGET)
+from tediousstart.tediousstart import execute_test_cases
+from tediousstart.tediousunittest import TediousUnitTest
+
+
+NUM_THREADS = 8  # Number of threads capturing concurrently
+NUM_LINES = 200  # Number of lines each thread prints
+
+
+def chatty_worker(name: str, barrier: threading.Barrier, results: dict) -> None:
+    """Capture NUM_LINES lines of name-tagged output while the other workers do the same."""
+    with RedirectStdStreams(scope=CaptureScope.CONTEXT) as capture:
+        barrier.wait()
+        for line_num in range(NUM_LINES):
+            print(f'{name} {line_num}')
+            print(f'{name} error {line_num}', file=sys.stderr)
+        results[name] = capture.communicate()
+
+
+class TestRSSContextScope(TediousUnitTest):
+    """TestRSSContextScope unit test class.
+
+    This class provides base functionality to run NEBS unit tests for
+    RedirectStdStreams(scope=CaptureScope.CONTEXT).  The test input is a number of threads that
+    capture their output concurrently.
+    """
+
+    def setUp(self) -> None:
+        """Prepares Test Case.
+
+        Automate any preparation necessary before each Test Case executes.
+        """
+        super().setUp()
+        self.std_streams = (sys.stdout, sys.stderr)  # Streams every capture must restore
+
+    def tearDown(self) -> None:
+        """Verify the Test Case restored sys.stdout and sys.stderr."""
+        super().tearDown()
+        self.assertIs(sys.stdout, self.std_streams[0])
+        self.assertIs(sys.stderr, self.std_streams[1])
+
+    # CORE CLASS METHODS
+    # Methods listed in call order
+    def call_callable(self) -> Any:
+        """Run chatty_worker() on the requested number of threads concurrently.
+
+        Overrides the parent method.
+
+        Returns:
+            A dictionary of each thread name and its communicate() return value.
+        """
+        # LOCAL VARIABLES
+        num_threads = self._args[0]               # Number of concurrent threads
+        barrier = threading.Barrier(num_threads)  # Starts the threads' output together
+        results = {}                              # Thread name: (stdout, stderr)
+        threads = [threading.Thread(target=chatty_worker, args=(f'thread{num}', barrier, results))
+                   for num in range(num_threads)]
+
+        # RUN THEM
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # DONE
+        return results
+
+    def validate_return_value(self, return_value: Any) -> None:
+        """Verify each thread captured exactly, and only, its own output.
+
+        Overrides the parent method.
+        """
+        for name, (std_out, std_err) in return_value.items():
+            exp_out = ''.join(f'{name} {line_num}\n' for line_num in range(NUM_LINES))
+            exp_err = ''.join(f'{name} error {line_num}\n' for line_num in range(NUM_LINES))
+            if std_out != exp_out:
+                self._add_test_failure(f'{name} captured the wrong stdout', output=std_out)
+            if std_err != exp_err:
+                self._add_test_failure(f'{name} captured the wrong stderr', output=std_err)
+        if len(return_value) != self._exp_return:
+            self._add_test_failure(f'Expected {self._exp_return} results but received '
+                                   f'{len(return_value)}')
+
+
+class NormalTestRSSContextScope(TestRSSContextScope):
+    """Normal Test Cases.
+
+    Organize the Normal Test Cases.
+    """
+
+    def test_normal_01(self):
+        """Concurrent captures on different threads stay isolated."""
+        self.set_test_input(NUM_THREADS)
+        self.expect_return(NUM_THREADS)
+        self.run_test()
+
+    def test_normal_02(self):
+        """Concurrent captures in different asyncio tasks stay isolated."""
+
+        async def chatty_task(name: str) -> tuple:
+            with RedirectStdStreams(scope=CaptureScope.CONTEXT) as capture:
+                for line_num in range(3):
+                    print(f'{name} {line_num}')
+                    await asyncio.sleep(0)
+                return capture.communicate()
+
+        async def run_tasks() -> list:
+            return await asyncio.gather(chatty_task('first'), chatty_task('second'))
+
+        results = asyncio.run(run_tasks())
+        self.assertEqual(results[0], ('first 0\nfirst 1\nfirst 2\n', ''))
+        self.assertEqual(results[1], ('second 0\nsecond 1\nsecond 2\n', ''))
+
+
+class BoundaryTestRSSContextScope(TestRSSContextScope):
+    """Boundary Test Cases.
+
+    Organize the Boundary Test Cases.
+    """
+
+    def test_boundary_01(self):
+        """A single thread."""
+        self.set_test_input(1)
+        self.expect_return(1)
+        self.run_test()
+
+
+class SpecialTestRSSContextScope(TestRSSContextScope):
+    """Special Test Cases.
+
+    Organize the Special Test Cases.
+    """
+
+    def test_special_01(self):
+        """Nested captures restore the outer capture on exit."""
+        with RedirectStdStreams(scope=CaptureScope.CONTEXT) as outer:
+            print('outer before')
+            with RedirectStdStreams(scope=CaptureScope.CONTEXT) as inner:
+                print('inner')
+            print('outer after')
+        self.assertEqual(outer.communicate()[0], 'outer before\nouter after\n')
+        self.assertEqual(inner.communicate()[0], 'inner\n')
+
+    def test_special_02(self):
+        """Uncaptured output goes to the replaced stream."""
+        replaced = io.StringIO()  # Stands in for the original sys.stdout
+        dispatcher = DispatchingStream(STDOUT_TARGET, replaced)  # Stands in for sys.stdout
+        dispatcher.write('uncaptured\n')
+        with RedirectStdStreams(scope=CaptureScope.CONTEXT) as capture:
+            dispatcher.write('captured\n')
+        self.assertEqual(replaced.getvalue(), 'uncaptured\n')
+        self.assertEqual(capture.communicate()[0], 'captured\n')
+
+    def test_special_03(self):
+        """Nested captures share the DispatchingStreams, which the outermost exit uninstalls."""
+        with RedirectStdStreams(scope=CaptureScope.CONTEXT):
+            installed = sys.stdout
+            with RedirectStdStreams(scope=CaptureScope.CONTEXT):
+                self.assertIs(sys.stdout, installed)
+            self.assertIs(sys.stdout, installed)
+        self.assertIsInstance(installed, DispatchingStream)
+        self.assertIs(sys.stdout, self.std_streams[0])
+        self.assertIs(sys.stderr, self.std_streams[1])
+
+
+if __name__ == '__main__':
+    execute_test_cases()
@@ -0,0 +1,149 @@
+"""Unit test RedirectStdStreams' CaptureScope.FD file descriptor level capture.
+
+Run the test cases defined in this module using any of the example commands below:
+
+    Usage:
+    python -m unittest                                            # Run *ALL* test cases
+    python -m unittest -k TestRSSFdScope                          # Match this test class
+    python -m test.unit_tests                                     # Run all unit tests
+    python -m test.unit_tests.test_redirect_std_streams_fd_scope  # Run just these tests
+"""
+
+# Standard Imports
+from typing import Any
+import os
+import subprocess
+import sys
+import unittest
+# Third Party Imports
+# Local Imports
+from tediousstart.redirect_std_streams import CaptureScope, RedirectStdStreams
+from tediousstart.tediousstart import execute_test_cases
+from tediousstart.tediousunittest import TediousUnitTest
+
+
+MB = 1048576  # Size of 1 MB
+
+
+def native_function(std_out: str, std_err: str) -> None:
+    """Write to stdout and stderr via Python, file descriptors, and a subprocess."""
+    print(f'print {std_out}')
+    print(f'print {std_err}', file=sys.stderr)
+    os.write(1, f'os.write {std_out}\n'.encode())
+    os.write(2, f'os.write {std_err}\n'.encode())
+    subprocess.run(['sh', '-c', f'echo subprocess {std_out}; echo subprocess {std_err} >&2'],
+                   check=True)
+
+
+# pylint: disable=protected-access
+@unittest.skipUnless(hasattr(os, 'pread'), 'CaptureScope.FD requires os.pread()')
+class TestRSSFdScope(TediousUnitTest):
+    """TestRSSFdScope unit test class.
+
+    This class provides base functionality to run NEBS unit tests for
+    RedirectStdStreams(scope=CaptureScope.FD).communicate().  The test input is passed to
+    native_function() within the context.
+    """
+
+    # CORE CLASS METHODS
+    # Methods listed in call order
+    def call_callable(self) -> Any:
+        """Calls RedirectStdStreams.communicate() after native_function().
+
+        Overrides the parent method.
+
+        Returns:
+            Return value of RedirectStdStreams.communicate()
+        """
+        with RedirectStdStreams(scope=CaptureScope.FD) as test_obj:
+            native_function(*self._args, **self._kwargs)
+            return test_obj.communicate()
+
+    def validate_return_value(self, return_value: Any) -> None:
+        """Validate RedirectStdStreams.communicate() return value.
+
+        Overrides the parent method.  Each line of the expected stdout and stderr must be found in
+        the actual stdout and stderr, respectively.
+        """
+        for stream_name, exp_text, actual_text in zip(('stdout', 'stderr'), self._exp_return,
+                                                      return_value):
+            for exp_line in exp_text.splitlines():
+                if exp_line not in actual_text:
+                    self._add_test_failure(f'Unable to locate {exp_line} in {stream_name}',
+                                           output=actual_text)
+
+
+class NormalTestRSSFdScope(TestRSSFdScope):
+    """Normal Test Cases.
+
+    Organize the Normal Test Cases.
+    """
+
+    def test_normal_01(self):
+        """Python-level, os.write(), and subprocess output are all captured."""
+        self.set_test_input('out', 'err')
+        self.expect_return(('print out\nos.write out\nsubprocess out',
+                            'print err\nos.write err\nsubprocess err'))
+        self.run_test()
+
+    def test_normal_02(self):
+        """File descriptors are restored."""
+        stdout_stat = os.fstat(1)
+        with RedirectStdStreams(scope=CaptureScope.FD):
+            self.assertNotEqual(os.fstat(1).st_ino, stdout_stat.st_ino)
+        self.assertEqual(os.fstat(1).st_ino, stdout_stat.st_ino)
+
+
+class ErrorTestRSSFdScope(TestRSSFdScope):
+    """Error Test Cases.
+
+    Organize the Error Test Cases.
+    """
+
+    def test_error_01(self):
+        """Invalid scope."""
+        with self.assertRaises(TypeError):
+            with RedirectStdStreams(scope=1):
+                pass
+
+
+class BoundaryTestRSSFdScope(TestRSSFdScope):
+    """Boundary Test Cases.
+
+    Organize the Boundary Test Cases.
+    """
+
+    def test_boundary_01(self):
+        """Large native writes don't deadlock."""
+        with RedirectStdStreams(scope=CaptureScope.FD) as test_obj:
+            subprocess.run(['sh', '-c', f'head -c {8 * MB} /dev/zero | tr "\\0" x'], check=True)
+            std_out = test_obj.communicate()[0]
+        self.assertEqual(len(std_out), 8 * MB)
+
+
+class SpecialTestRSSFdScope(TestRSSFdScope):
+    """Special Test Cases.
+
+    Organize the Special Test Cases.
+    """
+
+    def test_special_01(self):
+        """Output is captured after communicate() is called mid-context."""
+        with RedirectStdStreams(scope=CaptureScope.FD) as test_obj:
+            os.write(1, b'first\n')
+            first = test_obj.communicate()[0]
+            os.write(1, b'second\n')
+        self.assertEqual(first, 'first\n')
+        self.assertEqual(test_obj.communicate()[0], 'first\nsecond\n')
+
+    def test_special_02(self):
+        """The capture files are closed on exit."""
+        with RedirectStdStreams(scope=CaptureScope.FD) as test_obj:
+            os.write(2, b'native\n')
+            capture_files = [capture_file for _, capture_file in test_obj._fd_redirects]
+        self.assertTrue(all(capture_file.closed for capture_file in capture_files))
+        self.assertEqual(test_obj.communicate()[1], 'native\n')
+
+
+if __name__ == '__main__':
+    execute_test_cases()
@@ -0,0 +1,120 @@
+"""Unit test the TediousStart._add_test_failure() method and its lazy FailureRecords.
+
+Run the test cases defined in this module using any of the example commands below:
+
+    Usage:
+    python -m unittest
+    python -m unittest -k TestTESTAddTestFailure
+    python -m test.unit_tests.test_tediousstart_add_test_failure
+"""
+
+# Standard Imports
+from typing import Any
+# Third Party Imports
+# Local Imports
+from tediousstart.failure_record import excerpt, FailureRecord
+from tediousstart.tediousstart import execute_test_cases, TediousStart
+from tediousstart.tediousunittest import TediousUnitTest
+
+
+class TestTESTAddTestFailure(TediousUnitTest):
+    """TestTESTAddTestFailure unit test class.
+
+    This class provides base functionality to run NEBS unit tests for _add_test_failure().
+    Each test case adds one failure to a TediousStart object and presents it.
+    """
+
+    # CORE CLASS METHODS
+    # Methods listed in call order
+    def call_callable(self) -> Any:
+        """Calls TediousStart._add_test_failure() then TediousStart._present_test_failures().
+
+        Overrides the parent method.
+
+        Returns:
+            The presented failure message.
+        """
+        test_obj = TediousStart()
+        test_obj.max_failure_output = self._kwargs.get('max_failure_output',
+                                                       test_obj.max_failure_output)
+        # pylint: disable=protected-access
+        test_obj._add_test_failure(*self._args, **{key: value for key, value in self._kwargs.items()
+                                                   if key != 'max_failure_output'})
+        try:
+            test_obj._present_test_failures()
+        except AssertionError as err:
+            return str(err)
+        # pylint: enable=protected-access
+        return ''
+
+    def validate_return_value(self, return_value: Any) -> None:
+        """Validate the presented failure message.
+
+        Overrides the parent method.  Each of the expected return value's lines must be found
+        in the presented failure message.
+        """
+        for exp_line in self._exp_return.splitlines():
+            if exp_line not in return_value:
+                self._add_test_failure(f'Unable to locate {exp_line} in {return_value}')
+
+
+class NormalTestTESTAddTestFailure(TestTESTAddTestFailure):
+    """Normal Test Cases.
+
+    Organize the Normal Test Cases.
+    """
+
+    def test_normal_01(self):
+        """Message only."""
+        self.set_test_input('Something went wrong')
+        self.expect_return('Something went wrong')
+        self.run_test()
+
+    def test_normal_02(self):
+        """Short output is embedded in full."""
+        self.set_test_input('Stdout was not empty', output='hello')
+        self.expect_return('Stdout was not empty: hello')
+        self.run_test()
+
+    def test_normal_03(self):
+        """Long output is embedded as a head and tail excerpt."""
+        self.set_test_input('Stdout was not empty', output='H' * 10 + 'x' * 10 ** 6 + 'T' * 10,
+                            max_failure_output=20)
+        self.expect_return('HHHHHHHHHH\n... (1000000 characters omitted) ...\nTTTTTTTTTT')
+        self.run_test()
+
+
+class ErrorTestTESTAddTestFailure(TestTESTAddTestFailure):
+    """Error Test Cases.
+
+    Organize the Error Test Cases.
+    """
+
+    def test_error_01(self):
+        """Empty message."""
+        self.set_test_input('')
+        self.expect_exception(AssertionError, 'TEST CASE ERROR')
+        self.run_test()
+
+
+class SpecialTestTESTAddTestFailure(TestTESTAddTestFailure):
+    """Special Test Cases.
+
+    Organize the Special Test Cases.
+    """
+
+    def test_special_01(self):
+        """Records are rendered lazily."""
+        output = ['x' * 10]  # Mutable stand-in for output to prove it isn't copied
+        record = FailureRecord('Lazy', output=output)
+        output.append('y')
+        self.assertEqual(record.render(), f"Lazy: {['x' * 10, 'y']!r}")
+
+    def test_special_02(self):
+        """Bytes output."""
+        self.assertEqual(excerpt(b'\x00' * 10, max_chars=4),
+                         "b'\\x00\\x00'... (6 bytes omitted) ...b'\\x00\\x00'")
+
+
+if __name__ == '__main__':
+    execute_test_cases()
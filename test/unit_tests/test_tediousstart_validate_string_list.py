@@ -0,0 +1,151 @@
+"""Unit test the TediousStart._validate_string_list() method.
+
+Run the test cases defined in this module using any of the example commands below:
+
+    Usage:
+    python -m unittest
+    python -m unittest -k TestTESTValidateStringList
+    python -m test.unit_tests.test_tediousstart_validate_string_list
+"""
+
+# Standard Imports
+from typing import Any
+# Third Party Imports
+# Local Imports
+from tediousstart.tediousfunctest import TediousFuncTest
+from tediousstart.tediousstart import execute_test_cases, TediousStart
+from tediousstart.tediousunittest import TediousUnitTest
+
+
+class TestTESTValidateStringList(TediousUnitTest):
+    """TestTESTValidateStringList unit test class.
+
+    This class provides base functionality to run NEBS unit tests for _validate_string_list().
+    Each test case validates one list with a TediousStart object.
+    """
+
+    # CORE CLASS METHODS
+    # Methods listed in call order
+    def call_callable(self) -> Any:
+        """Calls TediousStart._validate_string_list().
+
+        Overrides the parent method.
+
+        Returns:
+            The failure message, if any.
+        """
+        test_obj = TediousStart()
+        test_obj.trusted_input = self._kwargs.pop('trusted_input', False)
+        try:
+            # pylint: disable=protected-access
+            test_obj._validate_string_list(*self._args, **self._kwargs)
+            # pylint: enable=protected-access
+        except AssertionError as err:
+            return str(err)
+        return ''
+
+    def validate_return_value(self, return_value: Any) -> None:
+        """Validate the failure message.
+
+        Overrides the parent method.  The expected return value must be found in the failure
+        message.  An empty expected return value means no failure.
+        """
+        if not self._exp_return and return_value:
+            self._add_test_failure(f'Unexpected failure: {return_value}')
+        elif self._exp_return not in return_value:
+            self._add_test_failure(f'Unable to locate {self._exp_return} in {return_value}')
+
+
+class NormalTestTESTValidateStringList(TestTESTValidateStringList):
+    """Normal Test Cases.
+
+    Organize the Normal Test Cases.
+    """
+
+    def test_normal_01(self):
+        """Valid lists."""
+        self.run_test_table([
+            ((['a', 'b'], 'cmd_list'), {}, ''),
+            ((['a', ''], 'output'), {'entries_can_be_empty': True}, ''),
+            (([], 'output'), {'can_be_empty': True}, ''),
+        ])
+
+    def test_normal_02(self):
+        """A large generated list."""
+        self.set_test_input([f'line {num}' for num in range(100000)], 'output')
+        self.expect_return('')
+        self.run_test()
+
+
+class ErrorTestTESTValidateStringList(TestTESTValidateStringList):
+    """Error Test Cases.
+
+    Organize the Error Test Cases.
+    """
+
+    def test_error_01(self):
+        """Not a list."""
+        self.set_test_input(('a', 'b'), 'cmd_list')
+        self.expect_return("cmd_list expected type <class 'list'>")
+        self.run_test()
+
+    def test_error_02(self):
+        """Every invalid entry is reported in one failure."""
+        self.set_test_input(['a', 1, '', None], 'cmd_list')
+        self.expect_return('TEST CASE ERROR: 3 invalid "cmd_list" entries: [1] expected type '
+                           'str, instead received type int; [2] can not be empty; [3] expected '
+                           'type str, instead received type NoneType')
+        self.run_test()
+
+    def test_error_03(self):
+        """Empty list."""
+        self.set_test_input([], 'cmd_list')
+        self.expect_return('"cmd_list" can not be empty')
+        self.run_test()
+
+
+class BoundaryTestTESTValidateStringList(TestTESTValidateStringList):
+    """Boundary Test Cases.
+
+    Organize the Boundary Test Cases.
+    """
+
+    def test_boundary_01(self):
+        """Thousands of problems are reported as an excerpt."""
+        self.set_test_input([1] * 10000, 'output')
+        self.expect_return('10000 invalid "output" entries')
+        self.run_test()
+        self.assertIn('characters omitted', self.call_callable())
+
+
+class SpecialTestTESTValidateStringList(TestTESTValidateStringList):
+    """Special Test Cases.
+
+    Organize the Special Test Cases.
+    """
+
+    def test_special_01(self):
+        """Trusted input skips validation."""
+        self.set_test_input(['a', 1], 'cmd_list', trusted_input=True)
+        self.expect_return('')
+        self.run_test()
+
+    def test_special_02(self):
+        """TediousFuncTest input methods use the batched validator."""
+
+        # pylint: disable=too-few-public-methods
+        class FuncTest(TediousFuncTest):
+            """Minimal TediousFuncTest."""
+
+            def validate_results(self) -> Any:
+                """Overrides parent class method."""
+        # pylint: enable=too-few-public-methods
+
+        with self.assertRaisesRegex(AssertionError, r'1 invalid "output" entries: \[0\]'):
+            FuncTest().expect_stdout([b'bytes'])
+        FuncTest.trusted_input = True
+        FuncTest().expect_stdout([b'bytes'])
+
+
+if __name__ == '__main__':
+    execute_test_cases()
@@ -0,0 +1,127 @@
+"""Unit test TediousUnitTest's support for awaitable call_callable() results.
+
+Run the test cases defined in this module using any of the example commands below:
+
+    Usage:
+    python -m unittest                                    # Run *ALL* test cases
+    python -m unittest -k TestTUTAsync                    # Match this test class
+    python -m test.unit_tests                             # Run all unit test cases
+    python -m test.unit_tests.test_tediousunittest_async  # Run just these tests
+"""
+
+# Standard Imports
+from typing import Any
+import asyncio
+import time
+# Third Party Imports
+# Local Imports
+from badcode.maths import divide_it
+from tediousstart.tediousstart import ExceptionData, execute_test_cases
+from tediousstart.tediousunittest import TediousUnitTest
+
+
+async def async_divide_it(numerator: int, denominator: int, delay: float = 0.0) -> float:
+    """Asynchronously call badcode.maths.divide_it() after sleeping for delay seconds."""
+    await asyncio.sleep(delay)
+    return divide_it(numerator, denominator)
+
+
+class TestTUTAsync(TediousUnitTest):
+    """TestTUTAsync unit test class.
+
+    This class provides base functionality to run NEBS unit tests for TediousUnitTest's async
+    support by testing async_divide_it().
+    """
+
+    # CORE CLASS METHODS
+    # Methods listed in call order
+    def call_callable(self) -> Any:
+        """Calls async_divide_it() without awaiting it.
+
+        Overrides the parent method.  TediousUnitTest awaits the coroutine.
+
+        Returns:
+            A coroutine object.
+        """
+        return async_divide_it(*self._args, **self._kwargs)
+
+    def validate_return_value(self, return_value: Any) -> None:
+        """Validate async_divide_it() return value.
+
+        Overrides the parent method.  Calls self._validate_return_value() under the hood.
+        """
+        self._validate_return_value(return_value=return_value)
+
+
+class NormalTestTUTAsync(TestTUTAsync):
+    """Normal Test Cases.
+
+    Organize the Normal Test Cases.
+    """
+
+    def test_normal_01(self):
+        """Awaited return value."""
+        self.set_test_input(1, 4)
+        self.expect_return(0.25)
+        self.run_test()
+
+    def test_normal_02(self):
+        """Exception raised by the awaited coroutine."""
+        self.set_test_input(1, 0)
+        self.expect_exception(ValueError, 'divide by zero')
+        self.run_test()
+
+    def test_normal_03(self):
+        """Rows are awaited concurrently."""
+        start_time = time.monotonic()
+        self.run_test_table([((num, 1), {'delay': 0.2}, float(num)) for num in range(20)],
+                            concurrent=True)
+        self.assertLess(time.monotonic() - start_time, 2.0)
+
+    def test_normal_04(self):
+        """Concurrent rows expecting Exceptions."""
+        self.run_test_table([((1, 2), {}, 0.5),
+                             ((1, 0), {}, ExceptionData(ValueError, 'divide by zero'))],
+                            concurrent=True)
+
+    def test_normal_05(self):
+        """The event loop is shared by the test class."""
+        self.set_test_input(1, 1)
+        self.expect_return(1.0)
+        self.run_test()
+        self.assertIs(self._get_event_loop(), type(self).__dict__['_event_loop'])
+
+
+class ErrorTestTUTAsync(TestTUTAsync):
+    """Error Test Cases.
+
+    Organize the Error Test Cases.
+    """
+
+    def test_error_01(self):
+        """Wrong awaited return value."""
+        self.set_test_input(1, 4)
+        self.expect_return(0.5)
+        with self.assertRaisesRegex(AssertionError, 'Expected value "0.5"'):
+            self.run_test()
+
+    def test_error_02(self):
+        """Awaited coroutine raises an unexpected Exception."""
+        self.set_test_input(1, 0)
+        self.expect_return(0.5)
+        with self.assertRaisesRegex(AssertionError, 'Execution failed unexpectedly'):
+            self.run_test()
+
+    def test_error_03(self):
+        """The deadline applies to each concurrent row."""
+        start_time = time.monotonic()
+        self.expect_completion_within(0.5)
+        row_failures = self._run_table_concurrently([((1, 2), {}, 0.5),
+                                                     ((1, 2), {'delay': 5.0}, 0.5)])
+        self.assertLess(time.monotonic() - start_time, 2.0)
+        self.assertEqual([index for index, _ in row_failures], [1])
+        self.assertIn('did not complete within 0.5 seconds', str(row_failures[0][1][0]))
+
+
+if __name__ == '__main__':
+    execute_test_cases()
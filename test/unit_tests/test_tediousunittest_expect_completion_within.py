@@ -0,0 +1,159 @@
+"""Unit test the TediousUnitTest.expect_completion_within() method.
+
+Run the test cases defined in this module using any of the example commands below:
+
+    Usage:
+    python -m unittest                                                       # Run *ALL* tests
+    python -m unittest -k TestTUTExpectCompletionWithin                      # Match this class
+    python -m test.unit_tests                                                # Run all unit tests
+    python -m test.unit_tests.test_tediousunittest_expect_completion_within  # Run just these
+"""
+
+# Standard Imports
+from typing import Any
+import asyncio
+import threading
+import time
+# Third Party Imports
+# Local Imports
+from tediousstart.tediousstart import execute_test_cases
+from tediousstart.tediousunittest import TediousUnitTest
+
+
+def spin_forever() -> None:
+    """Never return."""
+    while True:
+        pass
+
+
+async def sleep_forever() -> None:
+    """Never return, asynchronously."""
+    while True:
+        await asyncio.sleep(0.01)
+
+
+def finish_quickly() -> str:
+    """Return immediately."""
+    return 'done'
+
+
+def finish_slowly() -> str:
+    """Block for half a second then return."""
+    time.sleep(0.5)
+    return 'done'
+
+
+class TestTUTExpectCompletionWithin(TediousUnitTest):
+    """TestTUTExpectCompletionWithin unit test class.
+
+    This class provides base functionality to run NEBS unit tests for
+    TediousUnitTest.expect_completion_within().  The test input is the function to call.
+    """
+
+    # CORE CLASS METHODS
+    # Methods listed in call order
+    def call_callable(self) -> Any:
+        """Calls the function passed as test input.
+
+        Overrides the parent method.
+
+        Returns:
+            Return value of the function
+        """
+        return self._args[0]()
+
+    def validate_return_value(self, return_value: Any) -> None:
+        """Validate the function's return value.
+
+        Overrides the parent method.  Calls self._validate_return_value() under the hood.
+        """
+        self._validate_return_value(return_value=return_value)
+
+    def wait_for_workers(self, timeout: float = 2.0) -> bool:
+        """Wait for this test case's worker threads to exit.
+
+        Returns:
+            True if every worker exited within timeout seconds, False otherwise.
+        """
+        end_time = time.monotonic() + timeout
+        while time.monotonic() < end_time:
+            if not any(thread.name == f'{self.id()} worker' for thread in threading.enumerate()):
+                return True
+            time.sleep(0.01)
+        return False
+
+
+class NormalTestTUTExpectCompletionWithin(TestTUTExpectCompletionWithin):
+    """Normal Test Cases.
+
+    Organize the Normal Test Cases.
+    """
+
+    def test_normal_01(self):
+        """Completes in time."""
+        self.set_test_input(finish_quickly)
+        self.expect_return('done')
+        self.expect_completion_within(5)
+        self.run_test()
+
+    def test_normal_02(self):
+        """Expected Exception raised in the worker."""
+        self.set_test_input(None)
+        self.expect_exception(TypeError, 'not callable')
+        self.expect_completion_within(5.0)
+        self.run_test()
+
+
+class ErrorTestTUTExpectCompletionWithin(TestTUTExpectCompletionWithin):
+    """Error Test Cases.
+
+    Organize the Error Test Cases.
+    """
+
+    def test_error_01(self):
+        """Infinite loop; reports where it was stuck and interrupts the worker."""
+        self.set_test_input(spin_forever)
+        self.expect_return(None)
+        self.expect_completion_within(0.2)
+        with self.assertRaisesRegex(AssertionError, r'(?s)within 0.2 seconds.*spin_forever'):
+            self.run_test()
+        self.assertTrue(self.wait_for_workers())
+
+    def test_error_02(self):
+        """Stuck coroutine; a timeout is not the expected Exception."""
+        self.set_test_input(sleep_forever)
+        self.expect_exception(ValueError, '')
+        self.expect_completion_within(0.2)
+        with self.assertRaisesRegex(AssertionError, 'did not complete within'):
+            self.run_test()
+        self.assertTrue(self.wait_for_workers())
+
+    def test_error_03(self):
+        """Bad data type."""
+        with self.assertRaisesRegex(AssertionError, 'TEST CASE ERROR'):
+            self.expect_completion_within('5')
+
+    def test_error_04(self):
+        """The deadline applies to blocking synchronous rows run concurrently."""
+        self.expect_completion_within(0.05)
+        row_failures = self._run_table_concurrently([((finish_quickly,), {}, 'done'),
+                                                     ((finish_slowly,), {}, 'done')])
+        self.assertEqual([index for index, _ in row_failures], [1])
+        self.assertIn('did not complete within 0.05 seconds', str(row_failures[0][1][0]))
+        self.assertTrue(self.wait_for_workers())
+
+
+class BoundaryTestTUTExpectCompletionWithin(TestTUTExpectCompletionWithin):
+    """Boundary Test Cases.
+
+    Organize the Boundary Test Cases.
+    """
+
+    def test_boundary_01(self):
+        """Zero seconds."""
+        with self.assertRaisesRegex(AssertionError, 'Invalid deadline'):
+            self.expect_completion_within(0)
+
+
+if __name__ == '__main__':
+    execute_test_cases()
@@ -0,0 +1,135 @@
+"""Unit test the TediousUnitTest.run_test_table() method.
+
+Run the test cases defined in this module using any of the example commands below:
+
+    Usage:
+    python -m unittest                                              # Run *ALL* test cases
+    python -m unittest -k TestTUTRunTestTable                       # Match this test class
+    python -m test.unit_tests                                       # Run all unit test cases
+    python -m test.unit_tests.test_tediousunittest_run_test_table  # Run just these tests
+"""
+
+# Standard Imports
+from typing import Any
+import unittest
+# Third Party Imports
+# Local Imports
+from badcode.maths import divide_it
+from tediousstart.tediousstart import ExceptionData, execute_test_cases
+from tediousstart.tediousunittest import TediousUnitTest
+
+
+class TestTUTRunTestTable(TediousUnitTest):
+    """TestTUTRunTestTable unit test class.
+
+    This class provides base functionality to run NEBS unit tests for
+    TediousUnitTest.run_test_table() by testing badcode.maths.divide_it().
+    """
+
+    # CORE CLASS METHODS
+    # Methods listed in call order
+    def call_callable(self) -> Any:
+        """Calls badcode.maths.divide_it().
+
+        Overrides the parent method.  Defines the way to call divide_it().
+
+        Returns:
+            Return value of divide_it()
+
+        Raises:
+            Exceptions raised by divide_it() are bubbled up and handled by TediousUnitTest
+        """
+        return divide_it(*self._args, **self._kwargs)
+
+    def validate_return_value(self, return_value: Any) -> None:
+        """Validate divide_it() return value.
+
+        Overrides the parent method.  Calls self._validate_return_value() under the hood.
+        """
+        self._validate_return_value(return_value=return_value)
+
+    def run_table_in_isolation(self, rows: list) -> unittest.TestResult:
+        """Run rows in a separate TestTUTRunTestTable object and return the result."""
+        # LOCAL VARIABLES
+        result = unittest.TestResult()  # Collects the isolated results
+
+        # pylint: disable=too-few-public-methods
+        class IsolatedTable(TestTUTRunTestTable):
+            """Wraps rows in a test case."""
+
+            def test_table(self):
+                """Run the rows."""
+                self.run_test_table(rows)
+        # pylint: enable=too-few-public-methods
+
+        # RUN IT
+        IsolatedTable('test_table').run(result)
+
+        # DONE
+        return result
+
+
+class NormalTestTUTRunTestTable(TestTUTRunTestTable):
+    """Normal Test Cases.
+
+    Organize the Normal Test Cases.
+    """
+
+    def test_normal_01(self):
+        """Return values and Exceptions in one table."""
+        self.run_test_table([((1, 2), {}, 0.5),
+                             ((9,), {'denominator': 3}, 3.0),
+                             ((1, 0), {}, ExceptionData(ValueError, 'divide by zero')),
+                             (('1', 2), {}, ExceptionData(TypeError, 'must be an int'))])
+
+    def test_normal_02(self):
+        """Many rows."""
+        self.run_test_table([((num, 1), {}, float(num)) for num in range(10000)])
+
+
+class ErrorTestTUTRunTestTable(TestTUTRunTestTable):
+    """Error Test Cases.
+
+    Organize the Error Test Cases.
+    """
+
+    def test_error_01(self):
+        """Each failing row is its own subTest failure."""
+        result = self.run_table_in_isolation([((1, 2), {}, 0.5),
+                                              ((1, 2), {}, 0.25),
+                                              ((4, 2), {}, 2.0),
+                                              ((1, 1), {}, ExceptionData(ValueError, ''))])
+        self.assertEqual(len(result.failures), 2)
+        self.assertIn('row=1', str(result.failures[0][0]))
+        self.assertIn('row=3', str(result.failures[1][0]))
+
+    def test_error_02(self):
+        """Malformed row."""
+        result = self.run_table_in_isolation([((1, 2), 0.5)])
+        self.assertEqual(len(result.failures), 1)
+        self.assertIn('TEST CASE ERROR', result.failures[0][1])
+
+    def test_error_03(self):
+        """Bad data type."""
+        result = self.run_table_in_isolation('rows')
+        self.assertIn('rows must be a list', result.failures[0][1])
+
+
+class BoundaryTestTUTRunTestTable(TestTUTRunTestTable):
+    """Boundary Test Cases.
+
+    Organize the Boundary Test Cases.
+    """
+
+    def test_boundary_01(self):
+        """Empty table."""
+        result = self.run_table_in_isolation([])
+        self.assertIn('rows may not be empty', result.failures[0][1])
+
+    def test_boundary_02(self):
+        """One row."""
+        self.run_test_table([((0, 5), {}, 0.0)])
+
+
+if __name__ == '__main__':
+    execute_test_cases()